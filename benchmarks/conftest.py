@@ -0,0 +1,37 @@
+import pytest
+
+from capella_console_client import CapellaConsoleClient
+from .mock_server import MockCapellaServer
+
+
+NUM_ITEMS = 2500
+ASSET_SIZE = 4 * 1024 * 1024
+
+
+@pytest.fixture(scope="session")
+def mock_server():
+    with MockCapellaServer(num_items=NUM_ITEMS, asset_size=ASSET_SIZE) as server:
+        yield server
+
+
+@pytest.fixture(scope="session")
+def slow_mock_server():
+    """wide area network like: 20ms latency, 20 MB/s per asset response, 2% failed requests"""
+    with MockCapellaServer(
+        num_items=NUM_ITEMS, asset_size=ASSET_SIZE, latency=0.02, bandwidth=20e6, failure_rate=0.02
+    ) as server:
+        yield server
+
+
+def _client(server: MockCapellaServer) -> CapellaConsoleClient:
+    return CapellaConsoleClient(email="bench@capellaspace.com", password="bench", base_url=server.url)
+
+
+@pytest.fixture
+def bench_client(mock_server):
+    return _client(mock_server)
+
+
+@pytest.fixture
+def slow_bench_client(slow_mock_server):
+    return _client(slow_mock_server)
@@ -0,0 +1,286 @@
+"""
+local stand-in for the Capella Console API and presigned asset storage
+
+serves /token, /user, /catalog/search (paginated), /orders/review, /orders, /orders/<id>/download and
+/assets/<stac_id>/<file> (HTTP range support) with configurable latency, bandwidth and failure rate.
+
+.. code:: python3
+
+    with MockCapellaServer(num_items=2500, latency=0.02) as server:
+        client = CapellaConsoleClient(email="bench@capellaspace.com", password="bench", base_url=server.url)
+"""
+
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+
+ASSET_PATH_REGEX = re.compile(r"^/assets/(?P<stac_id>[^/]+)/(?P<file_name>[^/]+)$")
+ORDER_DOWNLOAD_PATH_REGEX = re.compile(r"^/orders/(?P<order_id>[^/]+)/download$")
+RANGE_REGEX = re.compile(r"^bytes=(\d+)-(\d*)$")
+
+WRITE_CHUNK_SIZE = 64 * 1024
+
+
+class MockCapellaServer:
+    """
+    Args:
+        num_items: number of STAC items in catalog
+        asset_size: bytes per HH asset (metadata and thumbnail assets are small)
+        latency: seconds added to every response
+        bandwidth: bytes per second per asset response (None: unlimited)
+        failure_rate: fraction of (non /token) requests answered with 503
+        seed: seed of failure injection
+    """
+
+    def __init__(
+        self,
+        num_items: int = 1000,
+        asset_size: int = 1024 * 1024,
+        latency: float = 0.0,
+        bandwidth: Optional[float] = None,
+        failure_rate: float = 0.0,
+        seed: int = 0,
+    ):
+        self.num_items = num_items
+        self.asset_size = asset_size
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.failure_rate = failure_rate
+
+        self.items = [_stac_item(idx) for idx in range(num_items)]
+        self.items_by_id = {item["id"]: item for item in self.items}
+        self.orders: Dict[str, List[str]] = {}
+        self.request_count = 0
+
+        self._asset = bytes(range(256)) * (asset_size // 256) + bytes(asset_size % 256)
+        self._asset_etag = f'"{hashlib.md5(self._asset).hexdigest()}"'
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._httpd: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        assert self._httpd is not None, "server not started"
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "MockCapellaServer":
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), _handler_class(self))
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def __enter__(self) -> "MockCapellaServer":
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    def should_fail(self) -> bool:
+        with self._lock:
+            self.request_count += 1
+            return self.failure_rate > 0 and self._random.random() < self.failure_rate
+
+    def search(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        items = self.items
+        if "ids" in payload:
+            items = [self.items_by_id[stac_id] for stac_id in payload["ids"] if stac_id in self.items_by_id]
+
+        limit = int(payload.get("limit", 500))
+        page = int(payload.get("page", 1))
+        features = items[(page - 1) * limit : page * limit]
+
+        links = []
+        if page * limit < len(items):
+            links.append({"rel": "next", "href": f"{self.url}/catalog/search?page={page + 1}", "method": "POST"})
+
+        return {
+            "type": "FeatureCollection",
+            "features": features,
+            "numberMatched": len(items),
+            "numberReturned": len(features),
+            "links": links,
+        }
+
+    def submit_order(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        order_id = str(uuid.uuid4())
+        stac_ids = [item["granuleId"] for item in payload["items"]]
+        with self._lock:
+            self.orders[order_id] = stac_ids
+        return {
+            "orderId": order_id,
+            "orderStatus": "completed",
+            "orderDate": datetime.utcnow().isoformat() + "Z",
+            "expirationDate": (datetime.utcnow() + timedelta(hours=1)).isoformat() + "Z",
+            "items": payload["items"],
+        }
+
+    def presigned_assets(self, order_id: str) -> Optional[List[Dict[str, Any]]]:
+        stac_ids = self.orders.get(order_id)
+        if stac_ids is None:
+            return None
+        return [{"id": stac_id, "assets": self.assets(stac_id)} for stac_id in stac_ids]
+
+    def assets(self, stac_id: str) -> Dict[str, Dict[str, Any]]:
+        href = f"{self.url}/assets/{stac_id}"
+        return {
+            "HH": {
+                "href": f"{href}/{stac_id}.tif",
+                "type": "image/tiff; application=geotiff; profile=cloud-optimized",
+                "file:size": self.asset_size,
+            },
+            "metadata": {"href": f"{href}/{stac_id}_extended.json", "type": "application/json"},
+            "thumbnail": {"href": f"{href}/{stac_id}_thumb.png", "type": "image/png"},
+        }
+
+    def asset_content(self, file_name: str) -> Tuple[bytes, str]:
+        """content and ETag of asset `file_name`"""
+        if file_name.endswith(".tif"):
+            return self._asset, self._asset_etag
+
+        content = json.dumps({"file": file_name}).encode() * 64
+        return content, f'"{hashlib.md5(content).hexdigest()}"'
+
+
+def _handler_class(server: MockCapellaServer):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format, *args):
+            pass
+
+        def do_GET(self):
+            self._handle("GET")
+
+        def do_HEAD(self):
+            self._handle("HEAD")
+
+        def do_POST(self):
+            self._handle("POST")
+
+        def _handle(self, method: str) -> None:
+            if server.latency:
+                time.sleep(server.latency)
+
+            path = urlparse(self.path).path
+            body = self._read_body()
+
+            if path != "/token" and server.should_fail():
+                return self._json(503, {"error": {"message": "Service Unavailable", "code": "SERVICE_UNAVAILABLE"}})
+
+            if method == "POST" and path == "/token":
+                return self._json(200, {"accessToken": "BENCH_TOKEN", "refreshToken": "BENCH_REFRESH_TOKEN"})
+            if method == "GET" and path == "/user":
+                return self._json(
+                    200, {"id": "BENCH_ID", "organizationId": "BENCH_ORG_ID", "email": "bench@capellaspace.com"}
+                )
+            if method == "POST" and path == "/catalog/search":
+                return self._json(200, server.search(body))
+            if method == "POST" and path == "/orders/review":
+                return self._json(200, {"authorized": True, "orderDetails": {"summary": {"total": "$0"}}})
+            if method == "POST" and path == "/orders":
+                return self._json(200, server.submit_order(body))
+
+            match = ORDER_DOWNLOAD_PATH_REGEX.match(path)
+            if method == "GET" and match:
+                presigned = server.presigned_assets(match.group("order_id"))
+                if presigned is None:
+                    return self._json(404, {"error": {"message": "order not found", "code": "NOT_FOUND"}})
+                return self._json(200, presigned)
+
+            match = ASSET_PATH_REGEX.match(path)
+            if method in ("GET", "HEAD") and match:
+                return self._asset(method, *server.asset_content(match.group("file_name")))
+
+            self._json(404, {"error": {"message": f"{method} {path} not found", "code": "NOT_FOUND"}})
+
+        def _read_body(self) -> Dict[str, Any]:
+            length = int(self.headers.get("Content-Length") or 0)
+            if not length:
+                return {}
+            return json.loads(self.rfile.read(length))
+
+        def _json(self, status: int, payload: Any) -> None:
+            content = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+
+        def _asset(self, method: str, content: bytes, etag: str) -> None:
+            status, start, end = 200, 0, len(content) - 1
+            match = RANGE_REGEX.match(self.headers.get("Range", ""))
+            if match:
+                start = int(match.group(1))
+                end = min(int(match.group(2) or end), end)
+                if start > end:
+                    self.send_response(416)
+                    self.send_header("Content-Range", f"bytes */{len(content)}")
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                status = 206
+
+            self.send_response(status)
+            self.send_header("Content-Type", "application/octet-stream")
+            self.send_header("Content-Length", str(end - start + 1))
+            self.send_header("ETag", etag)
+            self.send_header("Accept-Ranges", "bytes")
+            if status == 206:
+                self.send_header("Content-Range", f"bytes {start}-{end}/{len(content)}")
+            self.end_headers()
+
+            if method == "HEAD":
+                return
+
+            view = memoryview(content)[start : end + 1]
+            for offset in range(0, len(view), WRITE_CHUNK_SIZE):
+                chunk = view[offset : offset + WRITE_CHUNK_SIZE]
+                self.wfile.write(chunk)
+                if server.bandwidth:
+                    time.sleep(len(chunk) / server.bandwidth)
+
+    return Handler
+
+
+def _stac_item(idx: int) -> Dict[str, Any]:
+    collected = datetime(2022, 1, 1) + timedelta(minutes=idx)
+    stamp = collected.strftime("%Y%m%d%H%M%S")
+    stac_id = f"CAPELLA_C02_SP_GEO_HH_{stamp}_{(collected + timedelta(seconds=10)).strftime('%Y%m%d%H%M%S')}"
+    return {
+        "type": "Feature",
+        "stac_version": "1.0.0",
+        "id": stac_id,
+        "collection": "capella-geo",
+        "geometry": {"type": "Point", "coordinates": [-105.0 + idx % 90, 40.0 - idx % 45]},
+        "bbox": [-105.0, 39.0, -104.0, 40.0],
+        "properties": {
+            "datetime": collected.isoformat() + "Z",
+            "constellation": "capella",
+            "platform": "capella-2",
+            "sar:instrument_mode": "spotlight",
+            "sar:product_type": "GEO",
+            "sar:polarizations": ["HH"],
+            "capella:collect_id": str(uuid.UUID(int=idx)),
+        },
+        "assets": {},
+        "links": [],
+    }
@@ -0,0 +1,19 @@
+import subprocess
+import sys
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+pytest.importorskip("typer")
+
+
+def _run(*args: str) -> None:
+    subprocess.run([sys.executable, *args], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def test_import_client(benchmark):
+    benchmark.pedantic(_run, args=("-c", "import capella_console_client"), rounds=5)
+
+
+def test_cli_startup(benchmark):
+    benchmark.pedantic(_run, args=("-m", "capella_console_client.cli.wizard", "--help"), rounds=5)
@@ -0,0 +1,49 @@
+import tempfile
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from capella_console_client.assets import _gather_download_requests, _perform_download  # noqa: E402
+
+
+NUM_PRODUCTS = 8
+
+
+def _download_requests(server, local_dir: Path):
+    dl_requests = []
+    for item in server.items[:NUM_PRODUCTS]:
+        dl_requests.extend(_gather_download_requests(server.assets(item["id"]), local_dir))
+    return dl_requests
+
+
+@pytest.mark.parametrize("threaded", [False, True])
+def test_perform_download(benchmark, mock_server, threaded):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+
+        def _download():
+            return _perform_download(_download_requests(mock_server, Path(tmp_dir)), override=True, threaded=threaded)
+
+        local_paths = benchmark(_download)
+        assert local_paths["HH"].stat().st_size == mock_server.asset_size
+
+
+def test_perform_download_verified(benchmark, mock_server):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+
+        def _download():
+            dl_requests = _download_requests(mock_server, Path(tmp_dir))
+            return _perform_download(dl_requests, override=True, threaded=True, verify=True)
+
+        benchmark(_download)
+
+
+def test_perform_download_slow_network(benchmark, slow_mock_server):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+
+        def _download():
+            dl_requests = _download_requests(slow_mock_server, Path(tmp_dir))
+            return _perform_download(dl_requests, override=True, threaded=True)
+
+        benchmark.pedantic(_download, rounds=3)
@@ -0,0 +1,21 @@
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+
+def test_submit_order(benchmark, bench_client, mock_server):
+    stac_ids = [item["id"] for item in mock_server.items[:10]]
+
+    order_id = benchmark(bench_client.submit_order, stac_ids=stac_ids)
+    assert order_id in mock_server.orders
+
+
+def test_order_and_presign(benchmark, bench_client, mock_server):
+    items = mock_server.items[:10]
+
+    def _order_and_presign():
+        order_id = bench_client.submit_order(items=items, omit_search=True)
+        return bench_client.get_presigned_assets(order_id)
+
+    presigned = benchmark(_order_and_presign)
+    assert len(presigned) == 10
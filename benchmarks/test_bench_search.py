@@ -0,0 +1,21 @@
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from capella_console_client.search import StacSearch  # noqa: E402
+
+
+@pytest.mark.parametrize("limit", [500, 2500])
+def test_fetch_all(benchmark, bench_client, limit):
+    def _fetch_all():
+        return StacSearch(bench_client._sesh, constellation="capella", limit=limit).fetch_all()
+
+    result = benchmark(_fetch_all)
+    assert len(result) == limit
+
+
+def test_fetch_all_slow_network(benchmark, slow_bench_client):
+    result = benchmark.pedantic(
+        lambda: StacSearch(slow_bench_client._sesh, constellation="capella", limit=2500).fetch_all(), rounds=3
+    )
+    assert len(result) == 2500
@@ -1 +1,16 @@
-from .client import CapellaConsoleClient
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .client import CapellaConsoleClient
+
+
+def __getattr__(name: str):
+    # deferred - importing e.g. capella_console_client.cli does not pay for httpx
+    if name == "CapellaConsoleClient":
+        from .client import CapellaConsoleClient
+
+        return CapellaConsoleClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ["CapellaConsoleClient"]
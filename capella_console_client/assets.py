@@ -1,21 +1,34 @@
 from pathlib import Path
 from urllib.parse import urlparse
 from dataclasses import dataclass
+import hashlib
+import os
 import tempfile
+import uuid
 from concurrent.futures import ThreadPoolExecutor
-from typing import List, Optional, Union, Dict, Any
+from typing import List, Optional, Union, Dict, Any, Tuple, TYPE_CHECKING
 import re
 
 import httpx
-import rich.progress
-from retrying import retry  # type: ignore
 
 from capella_console_client.logconf import logger
-from capella_console_client.hooks import (
-    retry_if_httpx_status_error,
-    log_attempt_delay,
+from capella_console_client.config import (
+    DEFAULT_DOWNLOAD_CHUNK_SIZE,
+    DOWNLOAD_CHUNK_SIZE_ENV,
+    DEFAULT_MAX_CONCURRENT_DOWNLOADS,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
 )
+from capella_console_client.retry import with_retries, DOWNLOAD_RETRY_POLICY, _url_host, _last_call_retries
+from capella_console_client.instrumentation import RequestMetrics, _measure
 from capella_console_client.exceptions import ConnectError
+from capella_console_client.store import ProductStore
+from capella_console_client.integrity import DownloadManifest, _verify
+from capella_console_client.throttle import DownloadThrottle
+from capella_console_client.scheduling import _schedule
+from capella_console_client.progress import DownloadProgress, DownloadCounter, ProgressCallback, _open_progress
+
+if TYPE_CHECKING:
+    from capella_console_client.job_manifest import JobManifest
 
 
 STAC_ID_REGEX = re.compile("^.*(CAPELLA_\\w+_\\w+_\\w+_\\d{14}_\\d{14}).*$")
@@ -28,31 +41,20 @@ class DownloadRequest:
     local_path: Path
     asset_key: str
     stac_id: str = ""
-
-
-progress_bar = rich.progress.Progress(
-    rich.progress.TextColumn("[bold blue]{task.fields[filename]}", justify="left"),
-    rich.progress.BarColumn(bar_width=None),
-    "[progress.percentage]{task.percentage:>3.1f}%",
-    "•",
-    rich.progress.DownloadColumn(),
-    "•",
-    rich.progress.TransferSpeedColumn(),
-    "•",
-    rich.progress.TimeRemainingColumn(),
-)
-
-
-def _flush_progress_bar(progress: rich.progress.Progress) -> None:
-    for task_id in progress.task_ids:
-        progress.remove_task(task_id)
+    # -1 if unknown
+    size: int = -1
+    etag: Optional[str] = None
+    # size and etag probed
+    probed: bool = False
+    # md5 hex digest of downloaded file (if verified)
+    md5: Optional[str] = None
 
 
 def _gather_download_requests(
     assets_presigned: Dict[str, Any],
     local_dir: Union[Path, str] = Path(tempfile.gettempdir()),
-    include: Union[List[str], str] = None,
-    exclude: Union[List[str], str] = None,
+    include: Optional[Union[List[str], str]] = None,
+    exclude: Optional[Union[List[str], str]] = None,
     separate_dirs: bool = True,
 ) -> List[DownloadRequest]:
     local_dir = Path(local_dir)
@@ -66,6 +68,27 @@ def _gather_download_requests(
 
     logger.info(f"downloading product {stac_id} to {local_dir}")
 
+    # gather up paths
+    download_requests = []
+    for key, asset in _select_assets(assets_presigned, include, exclude).items():
+        local_path = local_dir / _get_filename(asset["href"])
+        download_requests.append(
+            DownloadRequest(
+                stac_id=stac_id,
+                asset_key=key,
+                url=asset["href"],
+                local_path=local_path,
+                size=int(asset.get("file:size", -1)),
+            )
+        )
+    return download_requests
+
+
+def _select_assets(
+    assets_presigned: Dict[str, Any],
+    include: Optional[Union[List[str], str]] = None,
+    exclude: Optional[Union[List[str], str]] = None,
+) -> Dict[str, Any]:
     if include:
         include = _prep_include_exclude(include)
         logger.info(f"Only including assets {', '.join(include)}")
@@ -74,8 +97,7 @@ def _gather_download_requests(
         exclude = _prep_include_exclude(exclude)
         logger.info(f"Excluding assets {', '.join(exclude)}")
 
-    # gather up paths
-    download_requests = []
+    selected = {}
     for key, asset in assets_presigned.items():
         # white-listing asset
         if include and key not in include:
@@ -85,16 +107,8 @@ def _gather_download_requests(
         if exclude and key in exclude:
             continue
 
-        local_path = local_dir / _get_filename(asset["href"])
-        download_requests.append(
-            DownloadRequest(
-                stac_id=stac_id,
-                asset_key=key,
-                url=asset["href"],
-                local_path=local_path,
-            )
-        )
-    return download_requests
+        selected[key] = asset
+    return selected
 
 
 def _get_raster_href(assets_presigned: Dict[str, Any]) -> str:
@@ -153,49 +167,83 @@ def _perform_download(
     override: bool,
     threaded: bool,
     show_progress: bool = False,
+    store: Optional[ProductStore] = None,
+    verify: bool = False,
+    throttle: Optional[DownloadThrottle] = None,
+    progress_callback: Optional[ProgressCallback] = None,
+    asset_priority: Optional[List[str]] = None,
+    max_workers: int = DEFAULT_MAX_CONCURRENT_DOWNLOADS,
+    manifest: Optional["JobManifest"] = None,
 ) -> Dict[str, Path]:
 
     local_paths_by_key = {}
-
-    with progress_bar as progress:
-        _flush_progress_bar(progress)
+    if manifest is not None:
+        manifest.add(download_requests)
+
+    with _open_progress(show_progress, progress_callback) as progress:
+        download_kwargs: Dict[str, Any] = dict(
+            override=override,
+            show_progress=show_progress,
+            progress=progress,
+            store=store,
+            verify=verify,
+            throttle=throttle,
+            manifest=manifest,
+        )
 
         # serially
         if not threaded:
-            for dl_request in download_requests:
-                local_paths_by_key[dl_request.asset_key] = _download_asset(
-                    dl_request,
-                    override=override,
-                    show_progress=show_progress,
-                    progress=progress,
-                )
-
-        # threaded
+            for unit in _schedule(download_requests, asset_priority):
+                for dl_request, local_path in _download_assets(unit, **download_kwargs):
+                    local_paths_by_key[dl_request.asset_key] = local_path
+
+        # threaded - largest (longest) transfers first, small assets batched
         else:
-            with ThreadPoolExecutor(max_workers=len(download_requests)) as executor:
-                # Start the load operations and mark each future with its URL
-                futures_by_key = {}
-
-                for dl_request in download_requests:
-                    futures_by_key[dl_request.asset_key] = executor.submit(
-                        _download_asset,
-                        dl_request=dl_request,
-                        override=override,
-                        show_progress=show_progress,
-                        progress=progress,
-                    )
-
-            for key, fut in futures_by_key.items():
-                local_paths_by_key[key] = fut.result()
+            _probe_sizes(_pending(download_requests, override), throttle=throttle)
+            units = _schedule(download_requests, asset_priority)
+
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(units))) as executor:
+                futures = [executor.submit(_download_assets, unit, **download_kwargs) for unit in units]
+
+            for fut in futures:
+                for dl_request, local_path in fut.result():
+                    local_paths_by_key[dl_request.asset_key] = local_path
 
     return local_paths_by_key
 
 
+def _download_assets(
+    download_requests: List[DownloadRequest], manifest: Optional["JobManifest"] = None, **kwargs
+) -> List[Tuple[DownloadRequest, Path]]:
+    """download work unit sequentially, recording progress in `manifest` if provided"""
+    if manifest is None:
+        return [(dl_request, _download_asset(dl_request, **kwargs)) for dl_request in download_requests]
+
+    local_paths = []
+    for dl_request in download_requests:
+        if not kwargs.get("override") and manifest.is_done(dl_request):
+            local_paths.append((dl_request, Path(dl_request.local_path)))
+            continue
+
+        manifest.mark_in_flight(dl_request)
+        try:
+            local_path = _download_asset(dl_request, **kwargs)
+        except Exception as e:
+            manifest.mark_failed(dl_request, e)
+            raise
+        manifest.mark_done(dl_request)
+        local_paths.append((dl_request, local_path))
+    return local_paths
+
+
 def _download_asset(
     dl_request: DownloadRequest,
     override: bool,
     show_progress: bool,
-    progress: rich.progress.Progress,
+    progress: Optional[DownloadProgress] = None,
+    store: Optional[ProductStore] = None,
+    verify: bool = False,
+    throttle: Optional[DownloadThrottle] = None,
 ) -> Path:
     if dl_request.local_path is None:
         local_file = _get_filename(dl_request.url)
@@ -204,64 +252,191 @@ def _download_asset(
     dl_request.local_path = Path(dl_request.local_path)
 
     if not override and dl_request.local_path.exists():
-        logger.info(f"already downloaded to {dl_request.local_path}")
-        return dl_request.local_path
+        if not verify:
+            logger.info(f"already downloaded to {dl_request.local_path}")
+            return dl_request.local_path
 
-    try:
-        asset_size = _get_asset_bytesize(dl_request.url)
-    except Exception:
-        asset_size = -1
+        if DownloadManifest.is_verified(dl_request.local_path):
+            dl_request.md5 = DownloadManifest.get(dl_request.local_path)["md5"]  # type: ignore
+            logger.info(f"already downloaded and verified {dl_request.local_path}")
+            return dl_request.local_path
+
+        logger.info(f"{dl_request.local_path} exists but could not be verified ... downloading again")
+
+    if not dl_request.probed:
+        _probe_asset(dl_request, throttle)
+    asset_size, etag = dl_request.size, dl_request.etag
+
+    stac_id = dl_request.stac_id or _stac_id_from_href(dl_request.url)
+    use_store = store is not None and asset_size != -1 and bool(stac_id)
+
+    if use_store:
+        blob_path = store.lookup(stac_id, dl_request.asset_key, asset_size, etag)  # type: ignore
+        if blob_path is not None:
+            return store.materialize(blob_path, dl_request.local_path)  # type: ignore
 
     if not show_progress:
         size_suffix = f"({_sizeof_fmt(asset_size)})" if asset_size != -1 else ""
         logger.info(f"downloading to {dl_request.local_path} {size_suffix}")
 
-    _fetch(dl_request, asset_size, show_progress, progress)
+    counter = progress.register(dl_request, asset_size) if progress is not None else None
+    with _measure(RequestMetrics("download", "GET", _url_host(dl_request.url))) as metrics:
+        try:
+            md5 = _fetch(dl_request, asset_size, counter, verify=verify, etag=etag, throttle=throttle)
+        except Exception as e:
+            if counter is not None:
+                progress.discard(counter)  # type: ignore
+            # retries exhausted
+            if isinstance(e, httpx.ConnectError):
+                raise ConnectError(f"Could not connect to {dl_request.url}: {e}") from None
+            raise
+        finally:
+            metrics.retries = _last_call_retries()
+        metrics.status = 200
+        metrics.num_bytes = dl_request.local_path.stat().st_size
+    dl_request.md5 = md5
 
     if not show_progress:
         logger.info(f"successfully downloaded to {dl_request.local_path}")
 
+    if verify:
+        DownloadManifest.record(dl_request.local_path, dl_request.local_path.stat().st_size, md5, etag)  # type: ignore
+
+    if use_store:
+        store.add(dl_request.local_path, stac_id, dl_request.asset_key, asset_size, etag)  # type: ignore
+
     return dl_request.local_path
 
 
-@retry(
-    retry_on_exception=retry_if_httpx_status_error,
-    wait_func=log_attempt_delay,
-    wait_exponential_multiplier=2000,
-    wait_exponential_max=16000,
-)
+@with_retries(DOWNLOAD_RETRY_POLICY, endpoint=lambda dl_request, *args, **kwargs: _url_host(dl_request.url))
 def _fetch(
     dl_request: DownloadRequest,
     asset_size: int,
-    show_progress: bool,
-    progress: rich.progress.Progress,
-):
+    counter: Optional[DownloadCounter] = None,
+    verify: bool = False,
+    etag: Optional[str] = None,
+    throttle: Optional[DownloadThrottle] = None,
+) -> Optional[str]:
+    """
+    stream `dl_request.url` to `dl_request.local_path` (via <local_path>.<random>.part, i.e. never leaves partial files behind)
+
+    Returns:
+        Optional[str]: md5 hex digest of downloaded content if `verify`
+    """
+    hasher = hashlib.md5() if verify else None
+    num_bytes = 0
+    part_path = _part_path(dl_request.local_path)
+    chunk_size = _download_chunk_size()
+
+    if throttle is not None:
+        throttle.acquire_request(dl_request.url)
+
+    if counter is not None:
+        # restart on retry
+        counter.completed = 0
+
     try:
-        with open(dl_request.local_path, "wb") as f:
-            with httpx.stream("GET", dl_request.url) as response:
-                response.raise_for_status()
-                if show_progress:
-                    download_task_id = _register_progress_task(dl_request, progress, asset_size)
+        with httpx.stream("GET", dl_request.url) as response:
+            response.raise_for_status()
+
+            fd = os.open(part_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+            try:
+                _preallocate(fd, asset_size)
+
+                # network reads are copied into a single reused buffer - flushed in large chunks by unbuffered
+                # writes, i.e. no per chunk allocations and few python level iterations
+                buffer = memoryview(bytearray(chunk_size))
+                filled = 0
+                for piece in response.iter_bytes():
+                    piece_view = memoryview(piece)
+                    while piece_view:
+                        num_copied = min(len(piece_view), chunk_size - filled)
+                        buffer[filled : filled + num_copied] = piece_view[:num_copied]
+                        filled += num_copied
+                        piece_view = piece_view[num_copied:]
+
+                        if filled == chunk_size:
+                            _flush_chunk(fd, buffer, dl_request.url, hasher, throttle, counter)
+                            num_bytes += filled
+                            filled = 0
+
+                if filled:
+                    _flush_chunk(fd, buffer[:filled], dl_request.url, hasher, throttle, counter)
+                    num_bytes += filled
+
+                # drop preallocated but unwritten space, e.g. on truncated responses
+                if asset_size > num_bytes:
+                    os.ftruncate(fd, num_bytes)
+            finally:
+                os.close(fd)
+
+        md5 = None
+        if hasher is not None:
+            md5 = hasher.hexdigest()
+            _verify(dl_request.local_path, num_bytes, md5, asset_size, etag)
+
+        os.replace(part_path, dl_request.local_path)
+        if counter is not None:
+            counter.done = True
+    finally:
+        if part_path.exists():
+            part_path.unlink()
+
+    return md5
+
+
+def _download_chunk_size() -> int:
+    value = os.environ.get(DOWNLOAD_CHUNK_SIZE_ENV)
+    if not value:
+        return DEFAULT_DOWNLOAD_CHUNK_SIZE
+    try:
+        return max(1, int(value))
+    except ValueError:
+        raise ValueError(f"{DOWNLOAD_CHUNK_SIZE_ENV} must be an integer (got {value})") from None
 
-                for chunk in response.iter_bytes():
-                    f.write(chunk)
 
-                    if show_progress:
-                        progress.update(download_task_id, completed=response.num_bytes_downloaded)
-    except httpx.ConnectError as e:
-        raise ConnectError(f"Could not connect to {dl_request.url}: {e}") from None
+def _preallocate(fd: int, asset_size: int) -> None:
+    """reserve `asset_size` bytes up front if supported (avoids fragmentation and ENOSPC mid download)"""
+    if asset_size <= 0 or not hasattr(os, "posix_fallocate"):
+        return
+    try:
+        os.posix_fallocate(fd, 0, asset_size)  # type: ignore
+    except OSError:
+        # e.g. not supported by file system
+        pass
 
-    return dl_request.local_path
 
+def _flush_chunk(
+    fd: int,
+    chunk: memoryview,
+    url: str,
+    hasher: Optional["hashlib._Hash"] = None,
+    throttle: Optional[DownloadThrottle] = None,
+    counter: Optional[DownloadCounter] = None,
+) -> None:
+    _write_all(fd, chunk)
+
+    if hasher is not None:
+        hasher.update(chunk)
+
+    if throttle is not None:
+        throttle.consume(url, len(chunk))
+
+    # sampled by progress renderer thread
+    if counter is not None:
+        counter.completed += len(chunk)
 
-def _register_progress_task(
-    dl_request: DownloadRequest, progress: rich.progress.Progress, asset_size: int
-) -> rich.progress.TaskID:
-    file_name_str = str(dl_request.local_path)
-    if dl_request.local_path and isinstance(dl_request.local_path, Path):
-        file_name_str = dl_request.local_path.name
-    download_task_id = progress.add_task("Download", total=asset_size, filename=file_name_str)
-    return download_task_id
+
+def _write_all(fd: int, chunk: Union[bytes, memoryview]) -> None:
+    view = memoryview(chunk)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
+def _part_path(local_path: Path) -> Path:
+    # unique per writer in case the same asset is requested multiple times concurrently
+    return local_path.with_name(f"{local_path.name}.{uuid.uuid4().hex[:8]}.part")
 
 
 def _get_filename(pre_signed_url: str) -> str:
@@ -270,12 +445,61 @@ def _get_filename(pre_signed_url: str) -> str:
 
 def _get_asset_bytesize(pre_signed_url: str) -> int:
     """get size in bytes of `pre_signed_url`"""
+    return int(_get_asset_headers(pre_signed_url)["Content-Length"])
+
+
+def _probe_asset(dl_request: DownloadRequest, throttle: Optional[DownloadThrottle] = None) -> None:
+    """set size and ETag of `dl_request` (size -1 if unknown)"""
+    if throttle is not None:
+        throttle.acquire_request(dl_request.url)
+
+    try:
+        headers = _get_asset_headers(dl_request.url)
+        dl_request.size = int(headers["Content-Length"])
+        dl_request.etag = headers.get("ETag")
+    except Exception:
+        dl_request.size = -1
+        dl_request.etag = None
+    dl_request.probed = True
+
+
+def _probe_sizes(
+    download_requests: List[DownloadRequest],
+    max_workers: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+    throttle: Optional[DownloadThrottle] = None,
+) -> None:
+    """probe size and ETag of `download_requests` of unknown size concurrently"""
+    unknown = [dl_request for dl_request in download_requests if dl_request.size == -1 and not dl_request.probed]
+    if not unknown:
+        return
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(unknown))) as executor:
+        list(executor.map(lambda dl_request: _probe_asset(dl_request, throttle), unknown))
+
+
+def _pending(download_requests: List[DownloadRequest], override: bool) -> List[DownloadRequest]:
+    """`download_requests` not skipped by `_download_asset` as already downloaded"""
+    if override:
+        return download_requests
+    return [
+        dl_request
+        for dl_request in download_requests
+        if dl_request.local_path is None or not Path(dl_request.local_path).exists()
+    ]
+
+
+def _get_asset_headers(pre_signed_url: str) -> httpx.Headers:
     try:
         with httpx.stream("GET", pre_signed_url) as resp:
-            total_size = int(resp.headers["Content-Length"])
+            headers = resp.headers
     except httpx.ConnectError as e:
         raise ConnectError(f"Could not connect to {pre_signed_url}: {e}") from None
-    return total_size
+    return headers
+
+
+def _stac_id_from_href(href: str) -> str:
+    match = STAC_ID_REGEX.findall(href)
+    return match[0] if match else ""
 
 
 def _sizeof_fmt(num, suffix="B"):
@@ -0,0 +1,359 @@
+"""
+non-interactive (scriptable) search, order and download
+
+filters are provided as flags (`--filter incidence_angle>=30`) and/ or a JSON query file (search kwargs, e.g. saved
+my-search-queries, one query per line for many AOIs), results are written to stdout as NDJSON (one JSON object per line,
+logs go to stderr) and can be piped into the next command, e.g.
+
+.. code:: bash
+
+    capella-console-wizard search -f bbox=[12.35,41.78,12.61,42] -f product_type=GEO \\
+        | capella-console-wizard order \\
+        | capella-console-wizard download --local-dir /data --manifest /data/manifest.sqlite
+
+exit codes (see EXIT_*): 0 success, 1 failure, 2 invalid usage, 3 authentication/ authorization failed, 4 no STAC items
+found (only if --fail-on-empty), 75 transient failure (connection, throttling, 5xx) - retry later
+"""
+
+import json
+import re
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Iterator, Iterable, Tuple, TextIO
+
+import typer
+
+from capella_console_client.config import ALL_SUPPORTED_FIELDS, OPERATOR_SUFFIXES, RETRYABLE_STATUS_CODES
+from capella_console_client.exceptions import (
+    CapellaConsoleClientError,
+    AuthenticationError,
+    AuthorizationError,
+    CollectionAccessDeniedError,
+    NoRefreshTokenError,
+    NoValidStacIdsError,
+    ConnectError,
+    CircuitOpenError,
+)
+from capella_console_client.cli.client_singleton import get_authenticated_client
+from capella_console_client.cli.config import CURRENT_SETTINGS, ENUM_CHOICES_BY_FIELD_NAME
+from capella_console_client.cli.search import STACQueryPayload, _add_default_filters
+from capella_console_client.cli.validate import get_caster, _parse_str_collection
+
+EXIT_FAILURE = 1
+EXIT_AUTH = 3
+EXIT_NO_RESULTS = 4
+# sysexits EX_TEMPFAIL
+EXIT_TEMPFAIL = 75
+
+FILTER_REGEX = re.compile(r"^(?P<field>\w+?)(?P<op>>=|<=|>|<|=)(?P<value>.*)$")
+
+FILTER_HELP = (
+    "search filter as <field><op><value> with op one of =, >, >=, <, <= (or <field>__<eq|in|gt|gte|lt|lte>=<value>),"
+    " e.g. product_type=GEO,SLC or incidence_angle>=30 - repeatable, overrides query file"
+)
+QUERY_FILE_HELP = "JSON query file ('-' for stdin): search kwargs object, list of objects or one object per line"
+INPUT_HELP = "NDJSON input ('-' for stdin, default if piped) - STAC items or ids (search), orders (order)"
+
+
+@contextmanager
+def _exit_on_error() -> Iterator[None]:
+    """report errors to stderr and exit with code suitable for schedulers"""
+    try:
+        yield
+    except (typer.Exit, typer.Abort, typer.BadParameter):
+        raise
+    except Exception as e:
+        message = getattr(e, "message", None) or str(e)
+        typer.echo(json.dumps({"error": type(e).__name__, "message": message}), err=True)
+        raise typer.Exit(_exit_code(e))
+
+
+def _exit_code(exc: Exception) -> int:
+    import httpx
+
+    if isinstance(exc, (AuthenticationError, AuthorizationError, CollectionAccessDeniedError, NoRefreshTokenError)):
+        return EXIT_AUTH
+    if isinstance(exc, NoValidStacIdsError):
+        return EXIT_NO_RESULTS
+    if isinstance(exc, (ConnectError, CircuitOpenError, httpx.TransportError)):
+        return EXIT_TEMPFAIL
+    if isinstance(exc, (CapellaConsoleClientError, httpx.HTTPStatusError)):
+        status_code = getattr(exc.response, "status_code", None)
+        if status_code in RETRYABLE_STATUS_CODES:
+            return EXIT_TEMPFAIL
+    return EXIT_FAILURE
+
+
+def _emit(record: Any) -> None:
+    typer.echo(json.dumps(record, default=str))
+
+
+def _parse_filters(filters: Iterable[str]) -> Dict[str, Any]:
+    parsed = STACQueryPayload()
+    for cur in filters:
+        match = FILTER_REGEX.match(cur.strip())
+        if not match:
+            raise typer.BadParameter(f"invalid filter '{cur}' - expected <field><op><value>", param_hint="--filter")
+
+        field, search_op, value = match.group("field", "op", "value")
+        if search_op == "=" and "__" in field:
+            field, _, op_suffix = field.partition("__")
+            search_op = STACQueryPayload.REV_OPS_MAP.get(op_suffix, op_suffix)
+
+        value = _cast_filter_value(field, search_op, value.strip())
+        try:
+            parsed.add(field, search_op, value)
+        except KeyError:
+            raise typer.BadParameter(f"invalid operator in filter '{cur}'", param_hint="--filter")
+    return parsed
+
+
+def _cast_filter_value(field: str, search_op: str, value: str) -> Any:
+    if value[:1] in ("[", "{"):
+        try:
+            return json.loads(value)
+        except ValueError:
+            raise typer.BadParameter(f"invalid JSON value of {field}: {value}", param_hint="--filter")
+
+    if field in ENUM_CHOICES_BY_FIELD_NAME or search_op == "in":
+        values = _parse_str_collection(value)
+        if field in ENUM_CHOICES_BY_FIELD_NAME:
+            enum_cls: Any = ENUM_CHOICES_BY_FIELD_NAME[field]
+            allowed = {e.value for e in enum_cls}
+            invalid = [v for v in values if v not in allowed]
+            if invalid:
+                raise typer.BadParameter(
+                    f"invalid {field} {', '.join(invalid)} - one of {', '.join(sorted(allowed))}", param_hint="--filter"
+                )
+        return values if len(values) > 1 or search_op == "in" else values[0]
+
+    cast_fct = get_caster(field)
+    if cast_fct is None:
+        return value
+    try:
+        return cast_fct(value)
+    except Exception:
+        raise typer.BadParameter(f"invalid value of {field}: {value}", param_hint="--filter")
+
+
+def _load_queries(query_file: TextIO) -> List[Dict[str, Any]]:
+    content = query_file.read()
+    try:
+        loaded = json.loads(content)
+    except ValueError:
+        try:
+            loaded = [json.loads(line) for line in content.splitlines() if line.strip()]
+        except ValueError as e:
+            raise typer.BadParameter(f"invalid JSON: {e}", param_hint="--query-file")
+
+    queries = loaded if isinstance(loaded, list) else [loaded]
+    if not all(isinstance(query, dict) for query in queries):
+        raise typer.BadParameter("expected JSON object(s) of search kwargs", param_hint="--query-file")
+    return queries
+
+
+def _validate_query(query: Dict[str, Any]) -> None:
+    for key in query:
+        field, _, op_suffix = key.partition("__")
+        if field != "sortby" and field not in ALL_SUPPORTED_FIELDS:
+            raise typer.BadParameter(f"unsupported search filter {field}", param_hint="--filter/ --query-file")
+        if op_suffix and op_suffix not in OPERATOR_SUFFIXES:
+            raise typer.BadParameter(
+                f"unsupported operator {op_suffix} of {field}", param_hint="--filter/ --query-file"
+            )
+
+
+def _search_queries(
+    filters: Optional[List[str]], query_file: Optional[TextIO], limit: Optional[int]
+) -> List[STACQueryPayload]:
+    queries = _load_queries(query_file) if query_file is not None else [{}]
+    flag_filters = _parse_filters(filters or [])
+
+    payloads = []
+    for query in queries:
+        payload = STACQueryPayload({**query, **flag_filters})
+        if limit is not None:
+            payload["limit"] = limit
+        _validate_query(payload)
+        payloads.append(_add_default_filters(payload))
+    return payloads
+
+
+def _read_ndjson(input_file: Optional[TextIO]) -> Iterator[Any]:
+    if input_file is None:
+        if sys.stdin.isatty():
+            return
+        input_file = sys.stdin
+
+    for line_no, line in enumerate(input_file, 1):
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError:
+            # bare STAC id
+            if re.match(r"^[\w-]+$", line.strip()):
+                yield line.strip()
+                continue
+            raise typer.BadParameter(f"line {line_no} is not valid JSON", param_hint="--input")
+
+
+def _items_and_orders(records: Iterable[Any]) -> Tuple[List[Dict[str, Any]], List[str], List[str]]:
+    """split input records into STAC items, bare STAC ids and order ids"""
+    items, stac_ids, order_ids = [], [], []
+    for record in records:
+        if isinstance(record, str):
+            stac_ids.append(record)
+        elif isinstance(record, dict) and "orderId" in record:
+            order_ids.append(record["orderId"])
+        elif isinstance(record, dict) and "id" in record:
+            items.append(record)
+        else:
+            raise typer.BadParameter(f"expected STAC item, STAC id or order, got {record!r:.80}", param_hint="--input")
+    return items, stac_ids, order_ids
+
+
+def _search_items(
+    filters: Optional[List[str]], query_file: Optional[TextIO], limit: Optional[int]
+) -> Iterator[Dict[str, Any]]:
+    client = get_authenticated_client(prompt=False)
+    for query in _search_queries(filters, query_file, limit):
+        yield from client.iter_search(**query)
+
+
+def _submit_order(items: List[Dict[str, Any]], stac_ids: List[str], check_active_orders: bool) -> Dict[str, Any]:
+    client = get_authenticated_client(prompt=False)
+    if stac_ids:
+        # bare STAC ids are validated by search
+        stac_ids = [item["id"] for item in items] + stac_ids
+        order_id = client.submit_order(stac_ids=stac_ids, check_active_orders=check_active_orders)
+    else:
+        stac_ids = [item["id"] for item in items]
+        order_id = client.submit_order(items=items, check_active_orders=check_active_orders, omit_search=True)
+    return {"orderId": order_id, "stac_ids": stac_ids}
+
+
+def _collect_order_input(
+    stac_ids: Optional[List[str]],
+    filters: Optional[List[str]],
+    query_file: Optional[TextIO],
+    limit: Optional[int],
+    input_file: Optional[TextIO],
+) -> Tuple[List[Dict[str, Any]], List[str], List[str]]:
+    if filters or query_file is not None:
+        return list(_search_items(filters, query_file, limit)), list(stac_ids or []), []
+
+    items, input_stac_ids, order_ids = _items_and_orders(_read_ndjson(input_file))
+    return items, list(stac_ids or []) + input_stac_ids, order_ids
+
+
+@_exit_on_error()
+def search(
+    filters: List[str] = typer.Option(None, "--filter", "-f", help=FILTER_HELP),
+    query_file: typer.FileText = typer.Option(None, "--query-file", "-q", help=QUERY_FILE_HELP),
+    limit: int = typer.Option(None, help="maximum number of STAC items per query", show_default="limit setting"),
+    fail_on_empty: bool = typer.Option(False, "--fail-on-empty", help=f"exit with {EXIT_NO_RESULTS} if nothing found"),
+):
+    """
+    search STAC items and write them as NDJSON to stdout (one item per line, streamed page by page)
+    """
+    if not filters and query_file is None:
+        raise typer.BadParameter("provide --filter and/ or --query-file")
+
+    num_items = 0
+    for item in _search_items(filters, query_file, limit):
+        _emit(item)
+        num_items += 1
+
+    if not num_items and fail_on_empty:
+        raise typer.Exit(EXIT_NO_RESULTS)
+
+
+@_exit_on_error()
+def order(
+    stac_ids: List[str] = typer.Option(None, "--stac-id", "-i", help="STAC id to order - repeatable"),
+    filters: List[str] = typer.Option(None, "--filter", "-f", help=f"{FILTER_HELP} - search and order matches"),
+    query_file: typer.FileText = typer.Option(None, "--query-file", "-q", help=QUERY_FILE_HELP),
+    limit: int = typer.Option(None, help="maximum number of STAC items per query", show_default="limit setting"),
+    input_file: typer.FileText = typer.Option(None, "--input", help=INPUT_HELP),
+    check_active_orders: bool = typer.Option(True, help="reuse active order containing all STAC ids"),
+):
+    """
+    order STAC items (from --stac-id, search filters or NDJSON input) and write order as NDJSON line to stdout
+    """
+    items, all_stac_ids, _ = _collect_order_input(stac_ids, filters, query_file, limit, input_file)
+    if not items and not all_stac_ids:
+        raise typer.Exit(EXIT_NO_RESULTS)
+
+    _emit(_submit_order(items, all_stac_ids, check_active_orders))
+
+
+@_exit_on_error()
+def download(
+    order_ids: List[str] = typer.Option(None, "--order-id", "-o", help="order id to download - repeatable"),
+    stac_ids: List[str] = typer.Option(None, "--stac-id", "-i", help="STAC id to order and download - repeatable"),
+    collect_id: str = typer.Option(None, help="download all products of collect"),
+    tasking_request_id: str = typer.Option(None, help="download all products of tasking request"),
+    filters: List[str] = typer.Option(None, "--filter", "-f", help=f"{FILTER_HELP} - search, order and download"),
+    query_file: typer.FileText = typer.Option(None, "--query-file", "-q", help=QUERY_FILE_HELP),
+    limit: int = typer.Option(None, help="maximum number of STAC items per query", show_default="limit setting"),
+    input_file: typer.FileText = typer.Option(None, "--input", help=f"{INPUT_HELP} or orders (download)"),
+    local_dir: Path = typer.Option(None, file_okay=False, help="download directory", show_default="out_path setting"),
+    include: List[str] = typer.Option(None, help="asset types to download, e.g. raster, metadata - repeatable"),
+    exclude: List[str] = typer.Option(None, help="asset types to skip, e.g. thumbnail - repeatable"),
+    product_types: List[str] = typer.Option(None, "--product-type", help="product type, e.g. GEO - repeatable"),
+    verify: bool = typer.Option(False, "--verify", help="verify size and md5 of downloads"),
+    manifest: Path = typer.Option(None, dir_okay=False, help="job manifest (SQLite) - re-runs skip done downloads"),
+    override: bool = typer.Option(False, "--override", help="override existing files"),
+    show_progress: bool = typer.Option(False, "--progress", help="show download progress (stderr)"),
+):
+    """
+    download products (of orders, STAC ids, collect, tasking request, search filters or NDJSON input) and write
+    local paths as NDJSON to stdout (one product per line)
+    """
+    client = get_authenticated_client(prompt=False)
+    download_kwargs: Dict[str, Any] = dict(
+        local_dir=local_dir or Path(CURRENT_SETTINGS["out_path"]),
+        include=include or None,
+        exclude=exclude or None,
+        product_types=product_types or None,
+        verify=verify,
+        manifest=manifest,
+        override=override,
+        show_progress=show_progress,
+    )
+
+    if collect_id or tasking_request_id:
+        paths = client.download_products(
+            collect_id=collect_id, tasking_request_id=tasking_request_id, **download_kwargs
+        )
+        _emit_products(paths)
+        return
+
+    items, all_stac_ids, input_order_ids = _collect_order_input(stac_ids, filters, query_file, limit, input_file)
+    all_order_ids = list(order_ids or []) + input_order_ids
+
+    # unordered STAC items - order first (reusing active orders)
+    order_stac_ids: Dict[str, Optional[List[str]]] = {order_id: None for order_id in all_order_ids}
+    if items or all_stac_ids:
+        submitted = _submit_order(items, all_stac_ids, check_active_orders=True)
+        order_stac_ids[submitted["orderId"]] = submitted["stac_ids"]
+
+    if not order_stac_ids:
+        raise typer.BadParameter(
+            "provide --order-id, --stac-id, --collect-id, --tasking-request-id, filters or --input"
+        )
+
+    for order_id, stac_ids_of_order in order_stac_ids.items():
+        assets_presigned = client.get_presigned_assets(order_id, stac_ids=stac_ids_of_order)
+        paths = client.download_products(assets_presigned=assets_presigned, **download_kwargs)
+        _emit_products(paths, order_id=order_id)
+
+
+def _emit_products(paths: Dict[str, Dict[str, Path]], order_id: Optional[str] = None) -> None:
+    for stac_id, asset_paths in paths.items():
+        record: Dict[str, Any] = {"id": stac_id, "assets": {k: str(v) for k, v in asset_paths.items()}}
+        if order_id is not None:
+            record["orderId"] = order_id
+        _emit(record)
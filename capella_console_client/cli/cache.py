@@ -1,30 +1,314 @@
 import json
+import os
+import sqlite3
+import tempfile
+import threading
 from pathlib import Path
-from typing import List, Dict, Any, Union
+from typing import List, Dict, Any, Union, Optional, Iterable
 from datetime import datetime
 
 from capella_console_client.logconf import logger
 
 
 def _safe_load_json(file_path: Path) -> Dict[str, Any]:
-    content = {}
     try:
-        content = json.loads(file_path.read_text())
-    except:
-        pass
+        content: Dict[str, Any] = json.loads(file_path.read_text())
+    except FileNotFoundError:
+        return {}
+    except ValueError:
+        logger.warning(f"ignoring corrupt {file_path}")
+        return {}
     return content
 
 
+def _atomic_write_text(file_path: Path, text: str) -> None:
+    # write and rename - readers never see partially written files
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=file_path.parent, prefix=f".{file_path.name}.")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(text)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def _now() -> str:
+    return str(datetime.now())[:-7]
+
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS saved_searches (
+        kind TEXT NOT NULL,
+        identifier TEXT NOT NULL,
+        data TEXT NOT NULL,
+        size INTEGER NOT NULL,
+        created_at TEXT,
+        updated_at TEXT NOT NULL,
+        PRIMARY KEY (kind, identifier)
+    )
+    """,
+    # STAC items matched by saved queries - max(datetime) is the high-water mark of incremental refreshes
+    """
+    CREATE TABLE IF NOT EXISTS materialized_items (
+        identifier TEXT NOT NULL,
+        stac_id TEXT NOT NULL,
+        datetime TEXT NOT NULL,
+        item TEXT NOT NULL,
+        PRIMARY KEY (identifier, stac_id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS materialized_items_datetime ON materialized_items (identifier, datetime)",
+)
+
+
+class SavedSearchStore:
+    """
+    saved search results (STAC ids) and queries of the wizard in SQLite - every update is a single transaction and
+    concurrent wizard processes are serialized by SQLite's file locking
+
+    Args:
+        path: SQLite file - created if it does not exist
+        legacy_paths: JSON files (by kind) of previous versions imported once into an empty store
+    """
+
+    RESULT = "result"
+    QUERY = "query"
+
+    def __init__(self, path: Union[Path, str], legacy_paths: Optional[Dict[str, Path]] = None):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._con = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False, isolation_level=None)
+        # journal mode can not be changed within a transaction
+        self._con.execute("PRAGMA journal_mode=WAL")
+        with self._transaction():
+            for statement in _SCHEMA:
+                self._con.execute(statement)
+
+        for kind, legacy_path in (legacy_paths or {}).items():
+            self._import_legacy(kind, legacy_path)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.path})"
+
+    def close(self) -> None:
+        with self._lock:
+            self._con.close()
+
+    def _transaction(self) -> "_Transaction":
+        return _Transaction(self._con, self._lock)
+
+    def upsert(self, kind: str, identifier: str, data: Any, is_new: bool = False) -> None:
+        """save `data` as `identifier` - created_at is (re)set if `is_new` or not yet saved"""
+        now = _now()
+        with self._transaction():
+            self._con.execute(
+                """
+                INSERT INTO saved_searches (kind, identifier, data, size, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (kind, identifier) DO UPDATE SET
+                    data = excluded.data,
+                    size = excluded.size,
+                    updated_at = excluded.updated_at,
+                    created_at = CASE WHEN ? THEN excluded.created_at ELSE created_at END
+                """,
+                (kind, identifier, json.dumps(data), len(data), now, now, is_new),
+            )
+
+    def get(self, kind: str, identifier: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._con.execute(
+                "SELECT data, created_at, updated_at FROM saved_searches WHERE kind = ? AND identifier = ?",
+                (kind, identifier),
+            ).fetchone()
+        if row is None:
+            return None
+        return {"data": json.loads(row[0]), "created_at": row[1], "updated_at": row[2]}
+
+    def load(self, kind: str) -> Dict[str, Dict[str, Any]]:
+        """all saved searches of `kind` by identifier (in order saved)"""
+        with self._lock:
+            rows = self._con.execute(
+                "SELECT identifier, data, created_at, updated_at FROM saved_searches WHERE kind = ? ORDER BY rowid",
+                (kind,),
+            ).fetchall()
+        return {
+            identifier: {"data": json.loads(data), "created_at": created_at, "updated_at": updated_at}
+            for identifier, data, created_at, updated_at in rows
+        }
+
+    def summaries(self, kind: str) -> List[Dict[str, Any]]:
+        """identifier, created_at, updated_at and size of saved searches of `kind` - without decoding their data"""
+        with self._lock:
+            rows = self._con.execute(
+                "SELECT identifier, created_at, updated_at, size FROM saved_searches WHERE kind = ? ORDER BY rowid",
+                (kind,),
+            ).fetchall()
+        return [dict(zip(("identifier", "created_at", "updated_at", "size"), row)) for row in rows]
+
+    def identifiers(self, kind: str) -> List[str]:
+        with self._lock:
+            rows = self._con.execute(
+                "SELECT identifier FROM saved_searches WHERE kind = ? ORDER BY rowid", (kind,)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def rename(self, kind: str, identifier: str, new_identifier: str) -> None:
+        """rename `identifier` - replaces saved search named `new_identifier` (if any)"""
+        with self._transaction():
+            self._con.execute("DELETE FROM saved_searches WHERE kind = ? AND identifier = ?", (kind, new_identifier))
+            self._con.execute(
+                "UPDATE saved_searches SET identifier = ?, updated_at = ? WHERE kind = ? AND identifier = ?",
+                (new_identifier, _now(), kind, identifier),
+            )
+            if kind == self.QUERY:
+                self._con.execute("DELETE FROM materialized_items WHERE identifier = ?", (new_identifier,))
+                self._con.execute(
+                    "UPDATE materialized_items SET identifier = ? WHERE identifier = ?", (new_identifier, identifier)
+                )
+
+    def delete(self, kind: str, identifiers: Iterable[str]) -> None:
+        identifiers = list(identifiers)
+        with self._transaction():
+            self._con.executemany(
+                "DELETE FROM saved_searches WHERE kind = ? AND identifier = ?",
+                [(kind, identifier) for identifier in identifiers],
+            )
+            if kind == self.QUERY:
+                self._con.executemany(
+                    "DELETE FROM materialized_items WHERE identifier = ?", [(identifier,) for identifier in identifiers]
+                )
+
+    def clear(self, kind: str) -> None:
+        with self._transaction():
+            self._con.execute("DELETE FROM saved_searches WHERE kind = ?", (kind,))
+            if kind == self.QUERY:
+                self._con.execute("DELETE FROM materialized_items")
+
+    def materialize(self, identifier: str, items: Iterable[Dict[str, Any]], replace: bool = False) -> int:
+        """
+        merge STAC items matched by saved query `identifier` into its materialized result
+
+        Args:
+            identifier: saved query identifier
+            items: STAC items - items already materialized are updated
+            replace: discard previously materialized items
+
+        Returns:
+            int: number of items not materialized before
+        """
+        rows = [(identifier, item["id"], item["properties"]["datetime"], json.dumps(item)) for item in items]
+        with self._transaction():
+            if replace:
+                self._con.execute("DELETE FROM materialized_items WHERE identifier = ?", (identifier,))
+            before = self._materialized_count(identifier)
+            self._con.executemany(
+                """
+                INSERT INTO materialized_items (identifier, stac_id, datetime, item) VALUES (?, ?, ?, ?)
+                ON CONFLICT (identifier, stac_id) DO UPDATE SET datetime = excluded.datetime, item = excluded.item
+                """,
+                rows,
+            )
+            return self._materialized_count(identifier) - before
+
+    def _materialized_count(self, identifier: str) -> int:
+        count: int = self._con.execute(
+            "SELECT COUNT(*) FROM materialized_items WHERE identifier = ?", (identifier,)
+        ).fetchone()[0]
+        return count
+
+    def materialized_items(self, identifier: str) -> List[Dict[str, Any]]:
+        """materialized STAC items of saved query `identifier` - most recent first"""
+        with self._lock:
+            rows = self._con.execute(
+                "SELECT item FROM materialized_items WHERE identifier = ? ORDER BY datetime DESC, stac_id",
+                (identifier,),
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def high_water_mark(self, identifier: str) -> Optional[str]:
+        """`datetime` of most recent materialized STAC item of saved query `identifier` (None if not materialized)"""
+        with self._lock:
+            mark: Optional[str] = self._con.execute(
+                "SELECT MAX(datetime) FROM materialized_items WHERE identifier = ?", (identifier,)
+            ).fetchone()[0]
+        return mark
+
+    def _import_legacy(self, kind: str, legacy_path: Path) -> None:
+        if not legacy_path.exists():
+            return
+
+        try:
+            legacy = json.loads(legacy_path.read_text())
+        except ValueError:
+            logger.warning(f"not importing corrupt {legacy_path}")
+            return
+
+        with self._transaction():
+            self._con.executemany(
+                """
+                INSERT OR IGNORE INTO saved_searches (kind, identifier, data, size, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    (
+                        kind,
+                        identifier,
+                        json.dumps(record["data"]),
+                        len(record["data"]),
+                        record.get("created_at"),
+                        record.get("updated_at", _now()),
+                    )
+                    for identifier, record in legacy.items()
+                ],
+            )
+        # keep as backup - not imported again
+        legacy_path.replace(legacy_path.with_name(f"{legacy_path.name}.imported"))
+        logger.info(f"imported {len(legacy)} saved search {kind}s from {legacy_path}")
+
+
+class _Transaction:
+    """BEGIN IMMEDIATE ... COMMIT (ROLLBACK on error) - takes SQLite's write lock up front"""
+
+    def __init__(self, con: sqlite3.Connection, lock: threading.Lock):
+        self._con = con
+        self._lock = lock
+
+    def __enter__(self) -> None:
+        self._lock.acquire()
+        try:
+            self._con.execute("BEGIN IMMEDIATE")
+        except BaseException:
+            self._lock.release()
+            raise
+
+    def __exit__(self, exc_type, *args) -> None:
+        try:
+            self._con.execute("ROLLBACK" if exc_type else "COMMIT")
+        finally:
+            self._lock.release()
+
+
 class CLICache:
     ROOT = Path.home() / ".capella-console-wizard"
     JWT = ROOT / "jwt.cache"
+    CREDENTIALS = ROOT / "credentials.json"
     SETTINGS = ROOT / "settings.json"
+    SAVED_SEARCHES = ROOT / "saved-searches.sqlite"
+    # previous versions - imported into SAVED_SEARCHES
     MY_SEARCH_RESULTS = ROOT / "my-search-results.json"
     MY_SEARCH_QUERIES = ROOT / "my-search-queries.json"
 
+    _saved_searches: Optional[SavedSearchStore] = None
+
     @classmethod
     def write_jwt(cls, jwt: str):
-        cls.JWT.write_text(jwt)
+        _atomic_write_text(cls.JWT, jwt)
         logger.info(f"Cached JWT to {cls.JWT}")
 
     @classmethod
@@ -35,50 +319,40 @@ class CLICache:
     def write_user_settings(cls, key: str, value: Any):
         settings = cls.load_user_settings()
         settings[key] = value
-        cls.SETTINGS.write_text(json.dumps(settings))
+        _atomic_write_text(cls.SETTINGS, json.dumps(settings))
 
     @classmethod
     def load_user_settings(cls) -> Dict[str, Any]:
         return _safe_load_json(cls.SETTINGS)
 
     @classmethod
-    def add_timestamps(cls, data: Union[Dict[str, Any], List[str]], is_new: bool = False) -> Dict[str, Any]:
-        now = str(datetime.now())[:-7]
-        record = {
-            "data": data,
-            "updated_at": now,
-        }
-        if is_new:
-            record["created_at"] = now
-        return record
-
-    @classmethod
-    def write_my_search_results(cls, my_search_results: Dict[str, Any]):
-        cls.MY_SEARCH_RESULTS.write_text(json.dumps(my_search_results))
+    def saved_searches(cls) -> SavedSearchStore:
+        """store of saved search results and queries - opened on first use"""
+        if cls._saved_searches is None or cls._saved_searches.path != cls.SAVED_SEARCHES:
+            cls._saved_searches = SavedSearchStore(
+                cls.SAVED_SEARCHES,
+                legacy_paths={
+                    SavedSearchStore.RESULT: cls.MY_SEARCH_RESULTS,
+                    SavedSearchStore.QUERY: cls.MY_SEARCH_QUERIES,
+                },
+            )
+        return cls._saved_searches
 
     @classmethod
     def update_my_search_results(cls, search_identifier: str, stac_ids: List[str], is_new: bool = False):
-        my_search_results = cls.load_my_search_results()
-        my_search_results[search_identifier] = cls.add_timestamps(stac_ids, is_new)
-        cls.write_my_search_results(my_search_results)
+        cls.saved_searches().upsert(SavedSearchStore.RESULT, search_identifier, stac_ids, is_new)
 
     @classmethod
     def load_my_search_results(cls) -> Dict[str, Any]:
-        return _safe_load_json(cls.MY_SEARCH_RESULTS)
-
-    @classmethod
-    def write_my_search_queries(cls, my_queries: Dict[str, Any]):
-        cls.MY_SEARCH_QUERIES.write_text(json.dumps(my_queries))
+        return cls.saved_searches().load(SavedSearchStore.RESULT)
 
     @classmethod
     def update_my_search_queries(cls, search_identifier: str, search_query: Dict[str, Any], is_new: bool = False):
-        my_queries = cls.load_my_search_queries()
-        my_queries[search_identifier] = cls.add_timestamps(search_query, is_new)
-        cls.write_my_search_queries(my_queries)
+        cls.saved_searches().upsert(SavedSearchStore.QUERY, search_identifier, search_query, is_new)
 
     @classmethod
     def load_my_search_queries(cls) -> Dict[str, Any]:
-        return _safe_load_json(cls.MY_SEARCH_QUERIES)
+        return cls.saved_searches().load(SavedSearchStore.QUERY)
 
 
 CLICache.ROOT.mkdir(exist_ok=True)
@@ -5,7 +5,7 @@ from questionary import prompt
 from capella_console_client.enumerations import ProductType
 from capella_console_client.cli.user_searches.core import _load_and_prompt, SearchEntity
 from capella_console_client.cli.config import CURRENT_SETTINGS
-from capella_console_client.cli.client_singleton import CLIENT
+from capella_console_client.cli.client_singleton import get_client
 from capella_console_client.cli.validate import _validate_uuid, _validate_dir_exists
 from capella_console_client.enumerations import BaseEnum
 from capella_console_client.cli.search import (
@@ -45,7 +45,7 @@ def interactive_search_order_and_download():
         answers = prompt(questions)
         if answers["include"] == "all":
             del answers["include"]
-        paths = CLIENT.download_products(**answers)
+        paths = get_client().download_products(**answers)
 
     elif start_from_opt in (
         CheckoutStartOptions.new_search,
@@ -55,7 +55,7 @@ def interactive_search_order_and_download():
             search_query = _prompt_search_filters()
             stac_items = search_and_post_actions(search_query)
             answers = prompt(questions)
-            order_id = CLIENT.submit_order(
+            order_id = get_client().submit_order(
                 items=stac_items,
                 check_active_orders=True,
                 omit_search=True,
@@ -65,19 +65,19 @@ def interactive_search_order_and_download():
         else:
             stac_ids = _stac_ids_from_saved_search()
             answers = prompt(questions)
-            order_id = CLIENT.submit_order(
+            order_id = get_client().submit_order(
                 stac_ids=stac_ids,
                 check_active_orders=True,
                 omit_search=True,
             )
 
-        assets_presigned = CLIENT.get_presigned_assets(order_id, stac_ids=stac_ids)
-        paths = CLIENT.download_products(assets_presigned=assets_presigned, **answers)
+        assets_presigned = get_client().get_presigned_assets(order_id, stac_ids=stac_ids)
+        paths = get_client().download_products(assets_presigned=assets_presigned, **answers)
     elif start_from_opt == CheckoutStartOptions.existing_order:
         orders = _list_orders_and_tabulate(is_active=False, limit=300)
         order_id = PostOrderListActions.prompt_and_reorder(orders)
         answers = prompt(questions)
-        paths = CLIENT.download_products(**answers, order_id=order_id)
+        paths = get_client().download_products(**answers, order_id=order_id)
 
     product_paths = set()
     for stac_id in paths:
@@ -1,3 +1,61 @@
-from capella_console_client import CapellaConsoleClient
+from typing import Optional, TYPE_CHECKING
 
-CLIENT = CapellaConsoleClient(no_auth=True, verbose=True)
+if TYPE_CHECKING:
+    from capella_console_client import CapellaConsoleClient
+
+_client: Optional["CapellaConsoleClient"] = None
+
+
+def get_client() -> "CapellaConsoleClient":
+    """CLI client - constructed on first use"""
+    global _client
+    if _client is None:
+        from capella_console_client import CapellaConsoleClient
+
+        _client = CapellaConsoleClient(no_auth=True, verbose=True)
+    return _client
+
+
+def __getattr__(name: str):
+    if name == "CLIENT":
+        return get_client()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def get_authenticated_client(prompt: bool = True) -> "CapellaConsoleClient":
+    """
+    CLI client authenticated by cached JWT or as configured console user (cached credentials, refreshed when expiring) -
+    prompts for credentials only if nothing is cached
+
+    Args:
+        prompt: prompt for credentials if nothing is cached - raises AuthenticationError instead if False
+    """
+    from capella_console_client.exceptions import AuthenticationError
+    from capella_console_client.logconf import logger
+    from capella_console_client.cli.cache import CLICache
+    from capella_console_client.cli.config import CURRENT_SETTINGS
+
+    client = get_client()
+
+    try:
+        client._sesh.authenticate(token=CLICache.load_jwt(), no_token_check=False)
+        return client
+    # first time or expired token
+    except (FileNotFoundError, AuthenticationError):
+        pass
+
+    if "console_user" in CURRENT_SETTINGS:
+        from capella_console_client.credentials import CredentialCache
+
+        logger.info(f"authenticating as {CURRENT_SETTINGS['console_user']}")
+        client._sesh.authenticate(
+            email=CURRENT_SETTINGS["console_user"],
+            credential_cache=CredentialCache(CLICache.CREDENTIALS),
+            prompt=prompt,
+        )
+    else:
+        client._sesh.authenticate(prompt=prompt)
+
+    jwt = client._sesh.headers["authorization"]
+    CLICache.write_jwt(jwt)
+    return client
@@ -1,6 +1,6 @@
-from copy import deepcopy
+from collections import UserDict
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 
 from capella_console_client.cli.cache import CLICache
 from capella_console_client.config import ALL_SUPPORTED_FIELDS
@@ -35,13 +35,29 @@ DEFAULT_SETTINGS = {
     "search_headers": DEFAULT_SEARCH_RESULT_HEADERS,
     "out_path": str(Path.home()),
     "order_list_limit": 50,
+    "result_table_page_size": 50,
     "search_filter_order": SearchFilterOrderOption.console_ui.name,
 }
 
 
-USER_SETTINGS = CLICache.load_user_settings()
+class _LazySettings(UserDict):
+    """DEFAULT_SETTINGS updated by user settings - read from disk on first access"""
 
-CURRENT_SETTINGS: Dict[str, Any] = {**DEFAULT_SETTINGS, **USER_SETTINGS}
+    def __init__(self) -> None:
+        self._data: Optional[Dict[str, Any]] = None
+
+    @property  # type: ignore
+    def data(self) -> Dict[str, Any]:  # type: ignore
+        if self._data is None:
+            self._data = {**DEFAULT_SETTINGS, **CLICache.load_user_settings()}
+        return self._data
+
+    @data.setter
+    def data(self, data: Dict[str, Any]) -> None:
+        self._data = data
+
+
+CURRENT_SETTINGS = _LazySettings()
 
 
 CLI_SEARCH_FIELDS = [
@@ -78,17 +94,29 @@ CLI_SEARCH_FIELDS = [
 ]
 
 
-def get_cli_supported_search_filters():
+def get_cli_supported_search_filters() -> List[str]:
     if CURRENT_SETTINGS["search_filter_order"] == SearchFilterOrderOption.alphabetical:
         return sorted(CLI_SEARCH_FIELDS)
     return CLI_SEARCH_FIELDS
 
 
-CLI_SUPPORTED_SEARCH_FILTERS = get_cli_supported_search_filters()
+def get_cli_supported_result_headers() -> List[str]:
+    result_headers = list(get_cli_supported_search_filters())
+    result_headers[result_headers.index("ids")] = "id"
+    result_headers[result_headers.index("collections")] = "collection"
+    return result_headers
+
+
+def __getattr__(name: str):
+    # settings dependent - computed on access
+    if name == "USER_SETTINGS":
+        return CLICache.load_user_settings()
+    if name == "CLI_SUPPORTED_SEARCH_FILTERS":
+        return get_cli_supported_search_filters()
+    if name == "CLI_SUPPORTED_RESULT_HEADERS":
+        return get_cli_supported_result_headers()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-CLI_SUPPORTED_RESULT_HEADERS = deepcopy(CLI_SUPPORTED_SEARCH_FILTERS)
-CLI_SUPPORTED_RESULT_HEADERS[CLI_SUPPORTED_RESULT_HEADERS.index("ids")] = "id"
-CLI_SUPPORTED_RESULT_HEADERS[CLI_SUPPORTED_RESULT_HEADERS.index("collections")] = "collection"
 
 PROMPT_OPERATORS = {
     "billable_area",
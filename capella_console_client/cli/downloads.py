@@ -0,0 +1,52 @@
+from pathlib import Path
+
+import typer
+
+from capella_console_client.config import DEFAULT_JOB_LEASE_SECONDS, DEFAULT_MAX_CONCURRENT_DOWNLOADS
+
+app = typer.Typer(help="sharded download jobs across processes and machines")
+
+
+@app.command()
+def work(
+    job_dir: Path = typer.Argument(..., exists=True, file_okay=False, help="job directory (see create_download_job)"),
+    processes: int = typer.Option(None, help="number of worker processes (default: number of CPUs)"),
+    threads: int = typer.Option(DEFAULT_MAX_CONCURRENT_DOWNLOADS, help="concurrent downloads per worker process"),
+    lease_seconds: float = typer.Option(DEFAULT_JOB_LEASE_SECONDS, help="lease duration of claimed shards"),
+    verify: bool = typer.Option(False, "--verify", help="verify size and md5 of downloads"),
+):
+    """
+    download shards of download job until all are done - re-running resumes unfinished shards, can be run
+    concurrently on multiple machines sharing the job directory
+    """
+    from capella_console_client.coordinator import run_download_job
+
+    summary = run_download_job(
+        job_dir, processes=processes, lease_seconds=lease_seconds, verify=verify, threads=threads
+    )
+    typer.echo(f"{summary['completed']} shards completed, {summary['failed']} failed")
+    if summary["failed"]:
+        raise typer.Exit(1)
+
+
+@app.command()
+def resume(
+    manifest: Path = typer.Argument(..., exists=True, dir_okay=False, help="job manifest of download_products"),
+    verify: bool = typer.Option(False, "--verify", help="verify size and md5 of downloads"),
+    show_progress: bool = typer.Option(True, help="show download progress"),
+):
+    """
+    resume interrupted download run recorded in job manifest - only unfinished downloads are downloaded
+    """
+    from capella_console_client import CapellaConsoleClient
+    from capella_console_client.job_manifest import JobManifest
+
+    job_manifest = JobManifest(manifest)
+    # presigned urls recorded in manifest - works with expired or missing credentials
+    client = CapellaConsoleClient(no_auth=True, verbose=True)
+    client.resume_downloads(job_manifest, verify=verify, show_progress=show_progress)
+
+    counts = job_manifest.counts()
+    typer.echo(", ".join(f"{cnt} {state}" for state, cnt in counts.items()))
+    if counts["failed"] or counts["pending"] or counts["in_flight"]:
+        raise typer.Exit(1)
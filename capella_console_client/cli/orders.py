@@ -1,4 +1,4 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from uuid import UUID
 import typer
 import questionary
@@ -6,7 +6,7 @@ import questionary
 from capella_console_client.cli.config import (
     CURRENT_SETTINGS,
 )
-from capella_console_client.cli.client_singleton import CLIENT
+from capella_console_client.cli.client_singleton import get_client
 from capella_console_client.enumerations import BaseEnum
 from capella_console_client.cli.visualize import (
     show_orders_tabulated,
@@ -41,7 +41,7 @@ class PostOrderListActions(str, BaseEnum):
         selected_order = cls._select_order(question="Specify the orderId you'd like to resubmit:", orders=orders)
 
         stac_ids = [item["granuleId"] for item in selected_order["items"]]
-        order_id = CLIENT.submit_order(stac_ids=stac_ids)
+        order_id = get_client().submit_order(stac_ids=stac_ids)
         download_hint(order_id)
         return order_id
 
@@ -61,10 +61,10 @@ def _prompt_post_order_list_actions(orders: List[Dict[str, Any]]):
             PostOrderListActions.prompt_and_reorder(orders)
 
 
-def _list_orders_and_tabulate(
-    is_active: bool, limit: int = CURRENT_SETTINGS["order_list_limit"]
-) -> List[Dict[str, Any]]:
-    orders = CLIENT.list_orders(is_active=is_active)
+def _list_orders_and_tabulate(is_active: bool, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    if limit is None:
+        limit = CURRENT_SETTINGS["order_list_limit"]
+    orders = get_client().list_orders(is_active=is_active)
     if not orders:
         typer.echo("Currently no orders available")
         raise typer.Exit(0)
@@ -78,8 +78,9 @@ def _list_orders_and_tabulate(
 def list_orders(
     is_active: bool = typer.Option(False, "--active", help="only show active (non-expired) orders"),
     limit: int = typer.Option(
-        CURRENT_SETTINGS["order_list_limit"],
+        None,
         help="limit orders to display (up to 300 currently)",
+        show_default="order_list_limit setting",
     ),
 ):
     """
@@ -111,7 +112,7 @@ def review(
         )
         stac_ids = [item["granuleId"] for item in selected_order["items"]]
 
-    order_review = CLIENT.review_order(stac_ids=stac_ids)
+    order_review = get_client().review_order(stac_ids=stac_ids)
     show_order_review_tabulated(order_review)
 
 
@@ -120,7 +121,7 @@ def reorder(order_id: UUID):
     """
     re-order by order ID
     """
-    order = CLIENT.list_orders(str(order_id))[0]
+    order = get_client().list_orders(str(order_id))[0]
     stac_ids = [item["granuleId"] for item in order["items"]]
-    new_order_id = CLIENT.submit_order(stac_ids=stac_ids)
+    new_order_id = get_client().submit_order(stac_ids=stac_ids)
     download_hint(new_order_id)
@@ -1,8 +1,10 @@
-from typing import List
-import questionary
+from typing import List, TYPE_CHECKING
 
+if TYPE_CHECKING:
+    import questionary
 
-def get_first_checked(choices: List[questionary.Choice], prev_search=None) -> questionary.Choice:
+
+def get_first_checked(choices: List["questionary.Choice"], prev_search=None) -> "questionary.Choice":
     first_checked = choices[0]
     if prev_search:
         first_checked = next(c for c in choices if c.checked)
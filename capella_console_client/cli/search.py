@@ -1,5 +1,5 @@
 import os
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, TYPE_CHECKING
 import json
 from collections import defaultdict
 
@@ -7,8 +7,7 @@ import typer
 import questionary
 
 from capella_console_client.enumerations import BaseEnum
-from capella_console_client.search import SearchResult
-from capella_console_client.cli.client_singleton import CLIENT
+from capella_console_client.cli.client_singleton import get_client
 from capella_console_client.cli.validate import (
     get_validator,
     get_caster,
@@ -18,18 +17,21 @@ from capella_console_client.cli.validate import (
 )
 from capella_console_client.cli.cache import CLICache
 from capella_console_client.cli.config import (
-    CLI_SUPPORTED_SEARCH_FILTERS,
+    get_cli_supported_search_filters,
     CURRENT_SETTINGS,
     PROMPT_OPERATORS,
     ENUM_CHOICES_BY_FIELD_NAME,
 )
 from capella_console_client.cli.user_searches.my_search_results import _load_and_prompt
-from capella_console_client.cli.user_searches.core import SearchEntity
+from capella_console_client.cli.user_searches.core import SearchEntity, refresh_materialized, saved_query_items
 from capella_console_client.cli.visualize import show_tabulated
 from capella_console_client.cli.settings import _prompt_search_result_headers
 from capella_console_client.cli.info import my_search_entity_info
 from capella_console_client.cli.prompt_helpers import get_first_checked
 
+if TYPE_CHECKING:
+    from capella_console_client.search import SearchResult
+
 
 # TODO: autocomplete option
 def interactive_search():
@@ -139,11 +141,11 @@ def _prompt_operator_value(field: str, search_op: str, init: Any = ""):
     return str_val
 
 
-def _prompt_search_filters(prev_search: STACQueryPayload = None) -> STACQueryPayload:
+def _prompt_search_filters(prev_search: Optional[STACQueryPayload] = None) -> STACQueryPayload:
     if prev_search is None:
         prev_search = STACQueryPayload()
 
-    choices = [questionary.Choice(cur, checked=cur in prev_search) for cur in CLI_SUPPORTED_SEARCH_FILTERS]
+    choices = [questionary.Choice(cur, checked=cur in prev_search) for cur in get_cli_supported_search_filters()]
 
     search_filter_names = questionary.checkbox(
         "Select your search filters:",
@@ -173,6 +175,10 @@ def _prompt_search_filters(prev_search: STACQueryPayload = None) -> STACQueryPay
             value = _prompt_operator_value(field, search_op, init)
             query.add(field, search_op, value)
 
+    return _add_default_filters(query)
+
+
+def _add_default_filters(query: STACQueryPayload) -> STACQueryPayload:
     if "limit" not in query:
         query["limit"] = CURRENT_SETTINGS["limit"]
 
@@ -191,7 +197,7 @@ class PostSearchActions(str, BaseEnum):
     quit = "quit"
 
     @classmethod
-    def save_search(cls, result: SearchResult, search_kwargs: STACQueryPayload):
+    def save_search(cls, result: "SearchResult", search_kwargs: STACQueryPayload):
         identifier = questionary.text(
             message="Please provide an identifier for your search:",
             default=str(search_kwargs),
@@ -199,10 +205,11 @@ class PostSearchActions(str, BaseEnum):
         ).ask()
         CLICache.update_my_search_results(identifier, result.stac_ids, is_new=True)
         CLICache.update_my_search_queries(identifier, search_kwargs, is_new=True)  # type: ignore
+        CLICache.saved_searches().materialize(identifier, result, replace=True)
         my_search_entity_info(identifier)
 
     @classmethod
-    def export_search(cls, result: SearchResult, search_kwargs: STACQueryPayload) -> str:
+    def export_search(cls, result: "SearchResult", search_kwargs: STACQueryPayload) -> str:
         default = CURRENT_SETTINGS["out_path"]
         if default[-1] != os.sep:
             default += os.sep
@@ -221,14 +228,14 @@ class PostSearchActions(str, BaseEnum):
         return path
 
     @classmethod
-    def refine_search_cmd(cls, prev_search: STACQueryPayload) -> Tuple[STACQueryPayload, SearchResult]:
+    def refine_search_cmd(cls, prev_search: STACQueryPayload) -> Tuple[STACQueryPayload, "SearchResult"]:
         prev_search.pop("constellation", None)
         if prev_search["limit"][0][1] == CURRENT_SETTINGS["limit"]:
             prev_search.pop("limit")
 
         typer.echo(f"Refining\n\t{json.dumps(prev_search)}")
         search_query = _prompt_search_filters(prev_search=prev_search)
-        stac_items = CLIENT.search(**search_query)
+        stac_items = get_client().search(**search_query)
         return (search_query, stac_items)
 
     @classmethod
@@ -239,8 +246,13 @@ class PostSearchActions(str, BaseEnum):
             return [PostSearchActions.refine_search, PostSearchActions.quit]
 
 
-def search_and_post_actions(search_query: STACQueryPayload, choices: List[PostSearchActions] = None):
-    result = CLIENT.search(**search_query)
+def search_and_post_actions(
+    search_query: STACQueryPayload,
+    choices: Optional[List[PostSearchActions]] = None,
+    result: Optional["SearchResult"] = None,
+):
+    if result is None:
+        result = get_client().search(**search_query)
     if result:
         show_tabulated(result, show_row_number=True)
 
@@ -249,9 +261,9 @@ def search_and_post_actions(search_query: STACQueryPayload, choices: List[PostSe
 
 
 def _prompt_post_search_actions(
-    result: SearchResult,
+    result: "SearchResult",
     search_kwargs: STACQueryPayload,
-    choices: List[PostSearchActions] = None,
+    choices: Optional[List[PostSearchActions]] = None,
 ):
     if not choices:
         choices = PostSearchActions._get_choices(results_found=len(result) > 0)
@@ -306,9 +318,44 @@ def from_saved():
         multiple=False,
     )
 
+    store = CLICache.saved_searches()
     if search_entity == SearchEntity.result:
         search_query = dict(ids=saved[selection]["data"])
+        # saved along with query of same identifier - no need to search if all materialized
+        materialized = {item["id"]: item for item in store.materialized_items(selection)}
+        if not all(stac_id in materialized for stac_id in search_query["ids"]):
+            search_and_post_actions(search_query)
+            return
+        items = [materialized[stac_id] for stac_id in search_query["ids"]]
     else:
         search_query = saved[selection]["data"]
+        _refresh_or_warn(selection)
+        items = saved_query_items(selection)
+
+    search_and_post_actions(search_query, result=_to_search_result(search_query, items))
+
 
-    search_and_post_actions(search_query)
+def _refresh_or_warn(identifier: str) -> None:
+    """refresh materialized result of saved query - falls back to previously materialized STAC items on errors"""
+    import httpx
+    from capella_console_client.exceptions import CapellaConsoleClientError
+
+    try:
+        refresh_materialized(identifier)
+    except (CapellaConsoleClientError, httpx.TransportError) as e:
+        if CLICache.saved_searches().high_water_mark(identifier) is None:
+            typer.secho(f"Unable to search for {identifier}: {e}", fg=typer.colors.RED, err=True)
+            raise typer.Exit(code=1)
+        typer.secho(
+            f"Unable to refresh {identifier} ({e}) ... showing previously materialized STAC items",
+            fg=typer.colors.YELLOW,
+            err=True,
+        )
+
+
+def _to_search_result(search_query: Dict[str, Any], items: List[Dict[str, Any]]) -> "SearchResult":
+    from capella_console_client.search import SearchResult
+
+    result = SearchResult(request_body=search_query)
+    result.add({"features": items})
+    return result
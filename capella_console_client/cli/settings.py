@@ -1,9 +1,6 @@
 from typing import List
 
 import typer
-import questionary
-
-from tabulate import tabulate
 
 from capella_console_client.cli.validate import (
     _must_be_type,
@@ -14,8 +11,8 @@ from capella_console_client.cli.validate import (
 )
 from capella_console_client.cli.cache import CLICache
 from capella_console_client.cli.config import (
-    CLI_SUPPORTED_RESULT_HEADERS,
     CURRENT_SETTINGS,
+    get_cli_supported_result_headers,
     SearchFilterOrderOption,
 )
 from capella_console_client.cli.prompt_helpers import get_first_checked
@@ -26,9 +23,11 @@ app = typer.Typer(help="fine tune settings")
 
 
 def _prompt_search_result_headers() -> List[str]:
+    import questionary
+
     choices = [
         questionary.Choice(cur, checked=cur in CURRENT_SETTINGS["search_headers"])
-        for cur in CLI_SUPPORTED_RESULT_HEADERS
+        for cur in get_cli_supported_result_headers()
     ]
 
     search_result_fields = questionary.checkbox(
@@ -47,6 +46,8 @@ def show():
     """
     show current settings
     """
+    from tabulate import tabulate
+
     typer.secho("Current settings:\n", underline=True)
     table_data = list(CURRENT_SETTINGS.items())
     typer.echo(tabulate(table_data, tablefmt="fancy_grid", headers=["setting", "value"]))
@@ -68,6 +69,8 @@ def limit():
     """
     set default limit to be used in searches
     """
+    import questionary
+
     limit = questionary.text(
         "Specify default limit to be used in searches (can be overridden at search time):",
         default=str(CURRENT_SETTINGS["limit"]),
@@ -82,11 +85,34 @@ def limit():
         typer.echo("invalid limit")
 
 
+@app.command()
+def page_size():
+    """
+    set number of rows per page of search results table
+    """
+    import questionary
+
+    page_size = questionary.text(
+        "Specify number of rows per page of search results table:",
+        default=str(CURRENT_SETTINGS["result_table_page_size"]),
+        validate=_must_be_type(int),
+    ).ask()
+    _no_selection_bye(page_size, info_msg="no valid page size provided")
+
+    if int(page_size) > 0:
+        CLICache.write_user_settings("result_table_page_size", int(page_size))
+        typer.echo(f"updated search results table page size to {page_size}")
+    else:
+        typer.echo("invalid page size")
+
+
 @app.command()
 def user():
     """
     set user for Capella Console
     """
+    import questionary
+
     console_user = questionary.path(
         "User on console.capellaspace.com (user@email.com):",
         default=CURRENT_SETTINGS.get("console_user", ""),
@@ -104,6 +130,8 @@ def output():
     """
     set default output location for downloads and .json STAC exports
     """
+    import questionary
+
     out_path = questionary.path(
         "Specify the default location for downloads and .json STAC exports: (press <tab>)",
         default=CURRENT_SETTINGS["out_path"],
@@ -120,6 +148,8 @@ def search_filter_order():
     """
     set order of search filters to be used in searches
     """
+    import questionary
+
     search_filter_order = questionary.select(
         "Specify the order of search filters to be used in searches:",
         choices=list(SearchFilterOrderOption),
@@ -1,10 +1,14 @@
-from typing import Tuple, Dict, Any, List
-from datetime import datetime
+from datetime import datetime, timedelta
+from typing import Tuple, Dict, Any, List, Optional
 
 import typer
 import questionary
+from dateutil.parser import parse
+from dateutil.tz import tzutc
 
+from capella_console_client.config import DEFAULT_MAX_FEATURE_COUNT, STAC_PREFIXED_BY_QUERY_FIELDS
 from capella_console_client.enumerations import BaseEnum
+from capella_console_client.cli.client_singleton import get_client
 from capella_console_client.cli.validate import _no_selection_bye
 from capella_console_client.cli.cache import CLICache
 from capella_console_client.cli.info import no_data_info
@@ -15,37 +19,28 @@ class SearchEntity(str, BaseEnum):
     query = 2
 
 
-def _get_load_fct(search_entity: SearchEntity):
-    return {
-        SearchEntity.result: CLICache.load_my_search_results,
-        SearchEntity.query: CLICache.load_my_search_queries,
-    }[search_entity]
-
-
-def _get_write_fct(search_entity):
-    return {
-        SearchEntity.result: CLICache.write_my_search_results,
-        SearchEntity.query: CLICache.write_my_search_queries,
-    }[search_entity]
-
-
 def _load_and_prompt(
     question: str,
     search_entity: SearchEntity,
     multiple: bool = True,
 ) -> Tuple[Dict[str, Any], List[str]]:
 
-    saved = _get_load_fct(search_entity)()
+    """prompt for saved search(es) of `search_entity` - returns selected saved searches by identifier and selection"""
+    store = CLICache.saved_searches()
+    identifiers = store.identifiers(search_entity.name)
 
-    if not saved:
+    if not identifiers:
         no_data_info(search_entity)
 
     typer.echo("\n\n")
 
     question_cls = questionary.checkbox if multiple else questionary.select
-    selection = question_cls(message=question, choices=saved).ask()  # type: ignore
+    selection = question_cls(message=question, choices=identifiers).ask()  # type: ignore
     _no_selection_bye(selection)
-    return (saved, selection)
+
+    selected = selection if multiple else [selection]
+    saved = {identifier: store.get(search_entity.name, identifier) for identifier in selected}
+    return (saved, selection)  # type: ignore
 
 
 def rename_search_entity(search_entity: SearchEntity):
@@ -60,12 +55,91 @@ def rename_search_entity(search_entity: SearchEntity):
         ).ask()
 
         if new_name != selected:
-            val = saved[selected]
-            saved[new_name] = val
-            saved[new_name]["updated_at"] = str(datetime.now())[:-7]
-            del saved[selected]
+            CLICache.saved_searches().rename(search_entity.name, selected, new_name)
             change_cnt += 1
 
     if change_cnt > 0:
-        _get_write_fct(search_entity)(saved)
         typer.echo(f"Renamed {change_cnt} search {search_entity.name}")
+
+
+def refresh_materialized(identifier: str, lookback: Optional[timedelta] = None) -> int:
+    """
+    fetch STAC items of saved query `identifier` not older than its high-water mark (`datetime` of most recent
+    materialized item) and merge them into its materialized result
+
+    The first refresh materializes the result of the saved query (up to its `limit`), later refreshes add every
+    newer match, i.e. the materialized result holds all STAC items seen so far - see :py:func:`saved_query_items`
+    for the subset matching the saved query
+
+    Args:
+        identifier: saved query identifier
+        lookback: additionally re-fetch STAC items up to `lookback` older than the high-water mark, e.g. to pick up
+            late published items
+
+    Returns:
+        int: number of newly materialized STAC items
+    """
+    store = CLICache.saved_searches()
+    saved = store.get(SearchEntity.query.name, identifier)
+    if saved is None:
+        raise KeyError(f"no saved search query {identifier}")
+
+    query = dict(saved["data"])
+    mark = store.high_water_mark(identifier)
+    if mark is None:
+        added = store.materialize(identifier, get_client().iter_search(**query))
+        store.upsert(SearchEntity.query.name, identifier, saved["data"])
+        return added
+
+    # oldest first - items beyond `limit` are fetched in the next round
+    since = _as_utc(parse(mark)) - (lookback or timedelta())
+    lower_bounds = [_as_utc(parse(query.pop(key))) for key in ("datetime__gt", "datetime__gte") if key in query]
+    since = max([since, *lower_bounds])
+    query["sortby"] = "+datetime"
+    limit = query.get("limit", DEFAULT_MAX_FEATURE_COUNT)
+
+    added = 0
+    while True:
+        query["datetime__gte"] = since.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+        items = list(get_client().iter_search(**query))
+        added += store.materialize(identifier, items)
+        if len(items) < limit:
+            break
+
+        newest = _as_utc(parse(items[-1]["properties"]["datetime"]))
+        # all of `limit` items share `since` - can not advance further
+        if newest <= since:
+            break
+        since = newest
+
+    store.upsert(SearchEntity.query.name, identifier, saved["data"])
+    return added
+
+
+def _as_utc(dt: datetime) -> datetime:
+    return dt.replace(tzinfo=tzutc()) if dt.tzinfo is None else dt
+
+
+def saved_query_items(identifier: str) -> List[Dict[str, Any]]:
+    """
+    materialized STAC items of saved query `identifier` as the saved query returns them, i.e. ordered by its `sortby`
+    (most recent first if not specified) and truncated to its `limit`
+    """
+    store = CLICache.saved_searches()
+    saved = store.get(SearchEntity.query.name, identifier)
+    if saved is None:
+        raise KeyError(f"no saved search query {identifier}")
+
+    query = saved["data"]
+    items = store.materialized_items(identifier)
+    sortby = query.get("sortby") or []
+    for sort_arg in reversed(sortby if isinstance(sortby, list) else [sortby]):
+        field = sort_arg.lstrip("+-")
+        items.sort(key=lambda item: _sort_key(item, field), reverse=sort_arg.startswith("-"))
+    return items[: query.get("limit", DEFAULT_MAX_FEATURE_COUNT)]
+
+
+def _sort_key(item: Dict[str, Any], field: str) -> Tuple[bool, Any]:
+    value = item["id"] if field == "id" else item["properties"].get(STAC_PREFIXED_BY_QUERY_FIELDS.get(field, field))
+    # missing values last
+    return (value is None, value)
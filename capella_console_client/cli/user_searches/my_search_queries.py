@@ -1,4 +1,6 @@
 import json
+from datetime import timedelta
+from typing import List, Optional
 
 import typer
 from tabulate import tabulate
@@ -10,6 +12,7 @@ from capella_console_client.cli.user_searches.core import (
     rename_search_entity,
     SearchEntity,
     _load_and_prompt,
+    refresh_materialized,
 )
 
 app = typer.Typer(help="manage saved search queries")
@@ -54,12 +57,47 @@ def rename():
     rename_search_entity(search_entity=SearchEntity.query)
 
 
+@app.command()
+def refresh(
+    identifiers: Optional[List[str]] = typer.Argument(
+        None, help="saved search queries to refresh (prompted if omitted)"
+    ),
+    all_: bool = typer.Option(False, "--all", help="refresh all saved search queries"),
+    lookback_hours: float = typer.Option(
+        0.0,
+        "--lookback-hours",
+        min=0,
+        help="also re-fetch STAC items up to this many hours older than the most recent materialized STAC item",
+    ),
+):
+    """
+    fetch STAC items of saved search queries newer than their most recent materialized STAC item and merge them in
+    """
+    store = CLICache.saved_searches()
+    if all_:
+        identifiers = store.identifiers(SearchEntity.query.name)
+    elif not identifiers:
+        _, identifiers = _load_and_prompt(
+            "Which saved search queries would you like to refresh?",
+            search_entity=SearchEntity.query,
+        )
+
+    assert identifiers is not None
+    unknown = set(identifiers) - set(store.identifiers(SearchEntity.query.name))
+    if unknown:
+        raise typer.BadParameter(f"no saved search queries {', '.join(sorted(unknown))}", param_hint="IDENTIFIERS")
+
+    for identifier in identifiers:
+        added = refresh_materialized(identifier, lookback=timedelta(hours=lookback_hours))
+        typer.echo(f"{identifier}: {added} new STAC items")
+
+
 @app.command()
 def delete():
     """
     delete previously saved search query
     """
-    saved_search_queries, selection = _load_and_prompt(
+    _, selection = _load_and_prompt(
         "Which saved search queries would you like to delete?",
         search_entity=SearchEntity.query,
     )
@@ -67,10 +105,7 @@ def delete():
     if not selection:
         return
 
-    for selected in selection:
-        del saved_search_queries[selected]
-
-    CLICache.write_my_search_queries(saved_search_queries)
+    CLICache.saved_searches().delete(SearchEntity.query.name, selection)
     typer.echo(f"Deleted {len(selection)} search queries")
 
 
@@ -82,8 +117,5 @@ def prune():
     if questionary.confirm(
         "Please confirm you'd like to delete ALL of your saved search queries. This action cannot be undone."
     ).ask():
-        try:
-            CLICache.MY_SEARCH_QUERIES.unlink()
-        except FileNotFoundError:
-            pass
+        CLICache.saved_searches().clear(SearchEntity.query.name)
         typer.echo(f"Deleted ALL saved search queries")
@@ -20,22 +20,24 @@ def list(detailed: bool = typer.Option(False, "--detailed", help="Show STAC ids
     """
     list previously saved search results
     """
-    saved_search_results = CLICache.load_my_search_results()
-    if not saved_search_results:
+    store = CLICache.saved_searches()
+    # STAC ids only decoded if shown
+    saved_search_results = store.load(SearchEntity.result.name) if detailed else None
+    summaries = store.summaries(SearchEntity.result.name)
+    if not summaries:
         no_data_info(search_entity=SearchEntity.result)
 
     table_data = []
-    for k, v in saved_search_results.items():
-        stac_ids = v["data"]
-        cur = [k, v["created_at"], v["updated_at"], f"{len(stac_ids)} items"]
-        if detailed:
-            cur.append("\n".join(stac_ids))
+    for summary in summaries:
+        cur = [summary["identifier"], summary["created_at"], summary["updated_at"], f"{summary['size']} items"]
+        if saved_search_results is not None:
+            cur.append("\n".join(saved_search_results[summary["identifier"]]["data"]))
         table_data.append(cur)
 
     headers = ["identifier", "created", "updated", "size", "STAC ids"]
     logger.info(typer.style("My saved search results\n", bold=True))
     typer.secho(tabulate(table_data, tablefmt="fancy_grid", headers=headers))
-    return saved_search_results
+    return summaries
 
 
 @app.command()
@@ -51,20 +53,15 @@ def delete():
     """
     delete previously saved search result
     """
-    saved_search_results, selection = _load_and_prompt(
-        "Which saved search result would you like to delete?", SearchEntity.result
-    )
+    _, selection = _load_and_prompt("Which saved search result would you like to delete?", SearchEntity.result)
 
     if not selection:
         return
 
-    for selected in selection:
-        del saved_search_results[selected]
-
-    CLICache.write_my_search_results(saved_search_results)
+    CLICache.saved_searches().delete(SearchEntity.result.name, selection)
     suffix = "s" if len(selection) > 1 else ""
     logger.info(f"Deleted the following search result{suffix}:")
-    logger.info("\n".join(selected))
+    logger.info("\n".join(selection))
 
 
 @app.command()
@@ -75,8 +72,5 @@ def prune():
     if questionary.confirm(
         "Please confirm you'd like to delete ALL of your saved search results. This action cannot be undone."
     ).ask():
-        try:
-            CLICache.MY_SEARCH_RESULTS.unlink()
-        except FileNotFoundError:
-            pass
+        CLICache.saved_searches().clear(SearchEntity.result.name)
         logger.info(f"Deleted ALL saved search results")
@@ -10,9 +10,6 @@ from typing import Union
 
 import typer
 
-from capella_console_client.validate import _validate_uuid as _validate_core_uuid
-from capella_console_client.assets import STAC_ID_REGEX
-
 
 EMAIL_REGEX = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b")
 
@@ -47,6 +44,8 @@ def _validate_bbox(val):
 
 def _validate_uuid(val):
     err_msg = "please specify a valid uuid (e.g. aaaaaaaa-bbbb-cccc-dddd-eeeeeeeeeeee)"
+    from capella_console_client.validate import _validate_uuid as _validate_core_uuid
+
     try:
         _validate_core_uuid(val)
     except ValueError as e:
@@ -101,6 +100,8 @@ def _parse_str_collection(list_str):
 def _validate_stac_ids(stac_id_str: str):
     err_msg = "please specify one or more , or whitespace separated STAC Ids (e.g. CAPELLA_C03_SM_GEO_HH_20210512034455_20210512034459,CAPELLA_C03_SP_GEO_HH_20210511101416_20210511101439)"
 
+    from capella_console_client.assets import STAC_ID_REGEX
+
     stac_ids = _parse_str_collection(stac_id_str)
     if all(STAC_ID_REGEX.match(stac_id) for stac_id in stac_ids):
         return True
@@ -111,6 +112,8 @@ def _validate_stac_ids(stac_id_str: str):
 def _validate_collections(stac_id_str: str):
     err_msg = "please specify one or more , or whitespace separated collections (e.g. capella-open-data)"
 
+    from capella_console_client.assets import STAC_ID_REGEX
+
     stac_ids = _parse_str_collection(stac_id_str)
     if all(STAC_ID_REGEX.match(stac_id) for stac_id in stac_ids):
         return True
@@ -154,7 +157,7 @@ def get_caster(field: str):
         "looks_range": int,
         "pixel_spacing_azimuth": float,
         "pixel_spacing_range": float,
-        "polarizations": float,
+        "polarizations": _parse_str_collection,
         "resolution_azimuth": float,
         "resolution_ground_range": float,
         "resolution_range": float,
@@ -1,5 +1,5 @@
-from typing import List, Dict, Any, Optional
-from collections import defaultdict
+from itertools import islice
+from typing import List, Dict, Any, Optional, Iterable, Iterator, TYPE_CHECKING
 
 import typer
 from tabulate import tabulate
@@ -7,46 +7,98 @@ from tabulate import tabulate
 from capella_console_client.config import (
     STAC_PREFIXED_BY_QUERY_FIELDS,
 )
-from capella_console_client.search import SearchResult
-
 from capella_console_client.cli.config import (
     CURRENT_SETTINGS,
 )
 
+if TYPE_CHECKING:
+    from capella_console_client.search import SearchResult
+
+MISSING_VALUE = "n/a"
+
 
 def show_tabulated(
-    stac_items: SearchResult,
+    stac_items: "SearchResult",
     search_headers: Optional[List[str]] = None,
     show_row_number: bool = False,
+    page_size: Optional[int] = None,
 ):
+    """
+    render table of `stac_items` page by page - prompts before each next page if stdout is a terminal
+
+    Args:
+        stac_items: STAC items to render
+        search_headers: fields of table (default: search_headers setting)
+        show_row_number: prepend row number column
+        page_size: rows per page (default: result_table_page_size setting)
+    """
+    from rich.console import Console
+    from rich.table import Table
+
     if not search_headers:
         search_headers = CURRENT_SETTINGS["search_headers"]  # type: ignore
-
-    table_data = defaultdict(list)
+    if not page_size:
+        page_size = CURRENT_SETTINGS["result_table_page_size"]
 
     assert search_headers is not None
     # force id left if specified
-    if "id" in search_headers:
-        del search_headers[search_headers.index("id")]
-        search_headers.insert(0, "id")
-
+    headers = [h for h in search_headers if h == "id"] + [h for h in search_headers if h != "id"]
     if show_row_number:
-        table_data["#"] = list(range(1, len(stac_items) + 1))
+        headers.insert(0, "#")
+
+    console = Console()
+    num_items = len(stac_items)
+    rendered = 0
+    for page in _pages(_project(stac_items, headers), page_size):
+        table = Table(*headers, show_lines=True)
+        for row in page:
+            table.add_row(*row)
+        console.print(table)
+        rendered += len(page)
+
+        remaining = num_items - rendered
+        if (
+            remaining
+            and console.is_terminal
+            and not typer.confirm(f"show next {min(page_size, remaining)} of {remaining} remaining?", default=True)
+        ):
+            break
+
+    typer.echo("\n")
 
-    for field in search_headers:
-        for it in stac_items:
-            if field in STAC_PREFIXED_BY_QUERY_FIELDS:
-                value = it["properties"].get(STAC_PREFIXED_BY_QUERY_FIELDS[field])
-            else:
-                value = it["properties"].get(field)
-                if value is None:
-                    value = it.get(field, "n/a")
 
-            if value is not None:
-                table_data[field].append(value)
+def _project(stac_items: Iterable[Dict[str, Any]], headers: List[str]) -> Iterator[List[str]]:
+    """table rows (values of `headers`) of `stac_items` - one pass, missing values rendered as MISSING_VALUE"""
+    getters = [_field_getter(header) for header in headers]
+    for row_number, it in enumerate(stac_items, start=1):
+        yield [str(get(it, row_number)) for get in getters]
 
-    typer.echo(tabulate(table_data, tablefmt="fancy_grid", headers="keys"))
-    typer.echo("\n")
+
+def _field_getter(field: str):
+    if field == "#":
+        return lambda it, row_number: row_number
+
+    if field in STAC_PREFIXED_BY_QUERY_FIELDS:
+        stac_field = STAC_PREFIXED_BY_QUERY_FIELDS[field]
+        return lambda it, _: _or_missing(it["properties"].get(stac_field))
+
+    def _get(it, _):
+        value = it["properties"].get(field)
+        return _or_missing(it.get(field) if value is None else value)
+
+    return _get
+
+
+def _or_missing(value: Any) -> Any:
+    return MISSING_VALUE if value is None else value
+
+
+def _pages(rows: Iterator[List[str]], page_size: int) -> Iterator[List[List[str]]]:
+    while True:
+        page = list(islice(rows, page_size))
+        if not page:
+            return
+        yield page
 
 
 def show_orders_tabulated(orders: List[Dict[str, Any]]):
@@ -1,22 +1,77 @@
 """
+entrypoint of capella-console-wizard
 
+subcommands are imported when invoked (see LAZY_SUBCOMMANDS) and the client is constructed on first use - `--help` or
+`settings show` do not pay for importing httpx, questionary, ...
 """
 
+import importlib
 import sys
+from typing import Dict, List, Optional, Tuple
 
-
+import click
 import typer
-
-from capella_console_client.exceptions import AuthenticationError
-from capella_console_client.cli.client_singleton import CLIENT
-from capella_console_client.cli.config import CURRENT_SETTINGS
-import capella_console_client.cli.settings
-import capella_console_client.cli.user_searches.my_searches
-import capella_console_client.cli.orders
-import capella_console_client.cli.checkout
-import capella_console_client.cli.workflows
-from capella_console_client.cli.cache import CLICache
-from capella_console_client.logconf import logger
+from typer.core import TyperGroup
+
+from capella_console_client.cli.client_singleton import get_authenticated_client
+
+# subcommand name -> ("<module>:<typer app or command function>", help)
+LAZY_SUBCOMMANDS: Dict[str, Tuple[str, str]] = {
+    "settings": ("capella_console_client.cli.settings:app", "fine tune settings"),
+    "my-searches": (
+        "capella_console_client.cli.user_searches.my_searches:app",
+        "manage my-searches (queries and results)",
+    ),
+    "orders": ("capella_console_client.cli.orders:app", "explore order history"),
+    "workflows": ("capella_console_client.cli.workflows:app", "interactive workflows"),
+    "downloads": ("capella_console_client.cli.downloads:app", "sharded download jobs across processes and machines"),
+    "search": ("capella_console_client.cli.batch:search", "non-interactive search - STAC items as NDJSON to stdout"),
+    "order": ("capella_console_client.cli.batch:order", "non-interactive order - orders as NDJSON to stdout"),
+    "download": (
+        "capella_console_client.cli.batch:download",
+        "non-interactive download - products as NDJSON to stdout",
+    ),
+}
+
+# authenticate themselves - map authentication errors to exit codes
+NON_INTERACTIVE_SUBCOMMANDS = ("search", "order", "download")
+
+
+class LazyTyperGroup(TyperGroup):
+    """imports subcommand module on first resolution - top level help is rendered from LAZY_SUBCOMMANDS"""
+
+    _rendering_help = False
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return list(LAZY_SUBCOMMANDS) + [name for name in super().list_commands(ctx) if name not in LAZY_SUBCOMMANDS]
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        command = super().get_command(ctx, cmd_name)
+        if command is not None or cmd_name not in LAZY_SUBCOMMANDS:
+            return command
+
+        import_path, help = LAZY_SUBCOMMANDS[cmd_name]
+        if self._rendering_help:
+            return click.Group(cmd_name, help=help)
+
+        module_name, attr = import_path.split(":")
+        target = getattr(importlib.import_module(module_name), attr)
+        if not isinstance(target, typer.Typer):
+            single_command_app = typer.Typer()
+            single_command_app.command(name=cmd_name)(target)
+            target = single_command_app
+
+        command = typer.main.get_command(target)
+        command.name = cmd_name
+        self.add_command(command, cmd_name)
+        return command
+
+    def format_help(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        self._rendering_help = True
+        try:
+            super().format_help(ctx, formatter)
+        finally:
+            self._rendering_help = False
 
 
 def auto_auth_callback(ctx: typer.Context):
@@ -29,6 +84,8 @@ def auto_auth_callback(ctx: typer.Context):
         "settings",
         "my-search-results",
         "my-search-queries",
+        "downloads",
+        *NON_INTERACTIVE_SUBCOMMANDS,
         None,
     ):
         return
@@ -36,30 +93,14 @@ def auto_auth_callback(ctx: typer.Context):
     if ctx.invoked_subcommand == sys.argv[-1]:
         return
 
-    try:
-        CLIENT._sesh.authenticate(token=CLICache.load_jwt(), no_token_check=False)
-    # first time or expired token
-    except (FileNotFoundError, AuthenticationError):
-        auth_kwargs = {}
-        if "console_user" in CURRENT_SETTINGS:
-            auth_kwargs["email"] = CURRENT_SETTINGS["console_user"]
-            logger.info(f"authenticating as {auth_kwargs['email']}")
-        CLIENT._sesh.authenticate(**auth_kwargs)  # type: ignore
-        jwt = CLIENT._sesh.headers["authorization"]
-        CLICache.write_jwt(jwt)
+    get_authenticated_client()
 
 
 app = typer.Typer(
+    cls=LazyTyperGroup,
     help="Interactive wizard for api.capellaspace.com",
     callback=auto_auth_callback,
 )
-app.add_typer(capella_console_client.cli.settings.app, name="settings")
-app.add_typer(
-    capella_console_client.cli.user_searches.my_searches.app,
-    name="my-searches",
-)
-app.add_typer(capella_console_client.cli.orders.app, name="orders")
-app.add_typer(capella_console_client.cli.workflows.app, name="workflows")
 
 
 @app.command()
@@ -67,7 +108,9 @@ def configure():
     """
     configure capella-console-wizard
     """
-    capella_console_client.cli.settings.configure()
+    from capella_console_client.cli.settings import configure
+
+    configure()
 
 
 def main():
@@ -11,7 +11,7 @@ def search():
     interactive_search()
 
 
-@app.command(help="re-search a previously saved query")
+@app.command(help="show STAC items of a previously saved query (refreshed incrementally) or result")
 def search_from_saved():
     from_saved()
 
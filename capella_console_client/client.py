@@ -1,22 +1,44 @@
 import logging
-import sys
+import random
+import time
 
 from datetime import datetime
-from typing import List, Dict, Any, Union, Optional, no_type_check, Tuple
+from typing import List, Dict, Any, Union, Optional, no_type_check, Tuple, Callable, Sequence, Iterator
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import tempfile
 
 import dateutil.parser
 
-from capella_console_client.config import CONSOLE_API_URL
+from capella_console_client.config import (
+    CONSOLE_API_URL,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_MAX_CONCURRENT_DOWNLOADS,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_TASK_POLL_INTERVAL,
+    DEFAULT_TASK_MAX_POLL_INTERVAL,
+    DEFAULT_TASK_POLL_BACKOFF,
+    DEFAULT_TASK_POLL_JITTER,
+    DEFAULT_TASK_MAX_POLL_FAILURES,
+    DEFAULT_TASK_BATCH_THRESHOLD,
+    TERMINAL_TASKING_REQUEST_STATUSES,
+    DEFAULT_JOB_SHARD_SIZE,
+    DEFAULT_RANGE_BLOCK_SIZE,
+    DEFAULT_RANGE_CACHE_BLOCKS,
+    DEFAULT_RANGE_READ_AHEAD,
+)
 from capella_console_client.session import CapellaConsoleSession
+from capella_console_client.instrumentation import Instrumentation
+from capella_console_client.credentials import CredentialCache, _as_credential_cache
 from capella_console_client.logconf import logger
 from capella_console_client.exceptions import (
     InsufficientFundsError,
     OrderRejectedError,
     NoValidStacIdsError,
     TaskNotCompleteError,
+    TaskWaitTimeoutError,
+    PartialResultError,
 )
 
 from capella_console_client.assets import (
@@ -28,6 +50,21 @@ from capella_console_client.assets import (
     _filter_assets_by_product_types,
 )
 from capella_console_client.search import StacSearch, SearchResult
+from capella_console_client.pipeline import DownloadPipeline
+from capella_console_client.coordinator import DownloadJob
+from capella_console_client.job_manifest import JobManifest, _as_job_manifest
+from capella_console_client.store import ProductStore, _as_store
+from capella_console_client.throttle import DownloadThrottle, _get_throttle
+from capella_console_client.progress import ProgressCallback
+from capella_console_client.range_reader import RangeReader
+from capella_console_client.streaming import (
+    AssetReader,
+    Sink,
+    SinkFactory,
+    _iter_asset,
+    _stream_to_sink,
+    _stream_products_to,
+)
 from capella_console_client.validate import (
     _validate_uuid,
     _validate_stac_id_or_stac_items,
@@ -53,6 +90,21 @@ class CapellaConsoleClient:
         base_url: Capella console API base URL override
         search_url: Capella catalog/search/ override
         no_auth: bypass authentication
+        instrumentation: request metrics/ tracing of Console API requests (defaults to process wide
+            instrumentation, see :py:func:`capella_console_client.instrumentation.set_instrumentation`)
+        background_token_refresh: refresh access token ahead of expiry on a background timer - by default it is
+            refreshed on the first request within one minute of expiry
+        max_connections: connection pool size (all connections kept alive) - size for the number of threads sharing
+            this client
+        credential_cache: persist tokens and user info across processes (True: ~/.capella-console-client/credentials.json
+            or path or :py:class:`CredentialCache`) - cached users authenticate without any request. NOTE: cached
+            credentials are looked up by email, i.e. `password` is only checked if no valid credentials are cached
+        lazy: authenticate on first request and look up user info (GET /user) only when needed (e.g. by
+            :py:meth:`list_orders` or :py:meth:`list_tasking_requests`) - invalid credentials raise on first request
+
+    NOTE:
+        the client is thread-safe - credentials are swapped atomically and token refreshes are single-flight, i.e.
+        one client (with a pool sized via `max_connections`) can be shared by all threads of a process
 
     NOTE:
         not providing either email and password or a jwt token for authentication
@@ -73,12 +125,34 @@ class CapellaConsoleClient:
         base_url: Optional[str] = CONSOLE_API_URL,
         search_url: Optional[str] = None,
         no_auth: bool = False,
+        instrumentation: Optional[Instrumentation] = None,
+        background_token_refresh: bool = False,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        credential_cache: Union[CredentialCache, Path, str, bool, None] = None,
+        lazy: bool = False,
     ):
         self._set_verbosity(verbose)
-        self._sesh = CapellaConsoleSession(base_url=base_url, search_url=search_url, verbose=verbose)
+        self._sesh = CapellaConsoleSession(
+            base_url=base_url,
+            search_url=search_url,
+            verbose=verbose,
+            instrumentation=instrumentation,
+            background_token_refresh=background_token_refresh,
+            max_connections=max_connections,
+        )
 
         if not no_auth:
-            self._sesh.authenticate(email, password, token, no_token_check)
+            auth_kwargs = dict(
+                email=email,
+                password=password,
+                token=token,
+                no_token_check=no_token_check,
+                credential_cache=_as_credential_cache(credential_cache),
+            )
+            if lazy:
+                self._sesh.defer_authentication(**auth_kwargs)
+            else:
+                self._sesh.authenticate(**auth_kwargs)  # type: ignore
 
     def _set_verbosity(self, verbose: bool = False):
         self.verbose = verbose
@@ -103,6 +177,8 @@ class CapellaConsoleClient:
         *tasking_request_ids: Optional[str],
         for_org: Optional[bool] = False,
         status: Optional[str] = None,
+        max_workers: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+        raise_on_error: bool = True,
     ) -> List[Dict[str, Any]]:
         """
         list tasking requests
@@ -111,9 +187,14 @@ class CapellaConsoleClient:
             tasking_request_ids: list only specific tasking_request_ids (variadic, specify multiple)
             for_org: list all tasking requests of your organization (instead of only yours) - **requires** organization index/ admin permission
             status: list only tasking requests that are in this/ have passed this status, e.g. completed
+            max_workers: maximum number of concurrent requests when fetching specific `tasking_request_ids`
+            raise_on_error: raise :py:class:`PartialResultError` if fetching any of `tasking_request_ids` fails
+                (successful results and errors by tasking request id are attached to the exception's `data`).
+                If only a single id is requested, its original exception is re-raised instead.
+                If False, failures are logged and only the successfully fetched tasking requests are returned
 
         Returns:
-            List[Dict[str, Any]]: metadata of tasking requests
+            List[Dict[str, Any]]: metadata of tasking requests (in order of `tasking_request_ids` if specified)
         """
         tasking_request_meta = []
 
@@ -123,7 +204,12 @@ class CapellaConsoleClient:
 
         # get selected
         if tasking_request_ids:
-            tasking_request_meta = [self.get_task(t_req_id) for t_req_id in tasking_request_ids]  # type: ignore
+            tasking_request_meta = _fetch_concurrently(
+                self.get_task,
+                tasking_request_ids,  # type: ignore
+                max_workers=max_workers,
+                raise_on_error=raise_on_error,
+            )
             if status:
                 tasking_request_meta = [
                     t_meta for t_meta in tasking_request_meta if self._task_contains_status(t_meta, status)
@@ -166,6 +252,128 @@ class CapellaConsoleClient:
         """
         return self._task_contains_status(task, "completed")
 
+    def wait_for_tasks(
+        self,
+        tasking_request_ids: List[str],
+        for_org: bool = False,
+        timeout: Optional[float] = None,
+        poll_interval: float = DEFAULT_TASK_POLL_INTERVAL,
+        max_poll_interval: float = DEFAULT_TASK_MAX_POLL_INTERVAL,
+        batch_threshold: int = DEFAULT_TASK_BATCH_THRESHOLD,
+        max_workers: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+        max_poll_failures: int = DEFAULT_TASK_MAX_POLL_FAILURES,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        poll tasking requests until they reach a final status (completed, rejected, expired, ...) and yield them as they do
+
+        The polling interval starts at `poll_interval` and backs off (with jitter) up to `max_poll_interval` while no
+        task reaches a final status. It resets once any task does.
+
+        Args:
+            tasking_request_ids: tasking request UUIDs to wait for
+            for_org: poll through the organization tasks listing instead of yours (see :py:meth:`list_tasking_requests`)
+            timeout: maximum time to wait in seconds - raises :py:class:`TaskWaitTimeoutError` if exceeded
+            poll_interval: initial polling interval in seconds
+            max_poll_interval: maximum polling interval in seconds
+            batch_threshold: poll via a single GET /tasks listing instead of one request per task if more than
+                `batch_threshold` tasks are pending
+            max_workers: maximum number of concurrent requests when polling tasks individually
+            max_poll_failures: consecutive failed polls of a tasking request (or of the GET /tasks listing) after
+                which its error is raised - failed polls are retried on the next poll
+
+        Returns:
+            Iterator[Dict[str, Any]]: task metadata, see :py:meth:`get_task` - check :py:meth:`is_task_completed`
+        """
+        pending = list(dict.fromkeys(tasking_request_ids))
+        for t_req_id in pending:
+            _validate_uuid(t_req_id)
+
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        delay = poll_interval
+        failures: Dict[str, int] = {}
+
+        while pending:
+            tasks, errors_by_id = self._poll_tasks(pending, for_org, batch_threshold, max_workers)
+            for task in tasks:
+                failures.pop(task["properties"]["taskingrequestId"], None)
+            for t_req_id, exc in errors_by_id.items():
+                failures[t_req_id] = failures.get(t_req_id, 0) + 1
+                if failures[t_req_id] >= max_poll_failures:
+                    logger.error(f"giving up on TaskingRequest<{t_req_id}> after {failures[t_req_id]} failed polls")
+                    raise exc
+                logger.warning(f"failed to poll TaskingRequest<{t_req_id}>: {exc!r} ... retrying on next poll")
+
+            finished = [t for t in tasks if _task_is_final(t)]
+
+            for task in finished:
+                pending.remove(task["properties"]["taskingrequestId"])
+                yield task
+
+            if not pending:
+                break
+
+            delay = poll_interval if finished else min(delay * DEFAULT_TASK_POLL_BACKOFF, max_poll_interval)
+            sleep_for = _jitter(delay)
+
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TaskWaitTimeoutError(
+                        f"{len(pending)} tasking request(s) did not finish within {timeout}s: {', '.join(pending)}"
+                    )
+                sleep_for = min(sleep_for, remaining)
+
+            logger.info(f"{len(pending)} tasking request(s) pending ... polling again in {sleep_for:.1f}s")
+            time.sleep(sleep_for)
+
+    def _poll_tasks(
+        self, tasking_request_ids: List[str], for_org: bool, batch_threshold: int, max_workers: int
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, Exception]]:
+        """tasks polled and errors by tasking request id of failed polls"""
+        if len(tasking_request_ids) > batch_threshold:
+            try:
+                listed = self.list_tasking_requests(for_org=for_org)
+            except Exception as e:
+                return [], {t_req_id: e for t_req_id in tasking_request_ids}
+
+            by_id = {t["properties"]["taskingrequestId"]: t for t in listed}
+            tasks = [by_id[t_req_id] for t_req_id in tasking_request_ids if t_req_id in by_id]
+            missing = [t_req_id for t_req_id in tasking_request_ids if t_req_id not in by_id]
+        else:
+            tasks, missing = [], tasking_request_ids
+
+        fetched, errors_by_id = _fetch_each(self.get_task, missing, max_workers=max_workers)
+        return tasks + fetched, errors_by_id
+
+    def wait_for_tasks_and_download(
+        self,
+        tasking_request_ids: List[str],
+        download_kwargs: Optional[Dict[str, Any]] = None,
+        **wait_kwargs,
+    ) -> Iterator[Tuple[Dict[str, Any], Dict[str, Dict[str, Path]]]]:
+        """
+        wait for tasking requests (see :py:meth:`wait_for_tasks`) and order and download all products of each
+        completed tasking request as soon as it completes
+
+        Args:
+            tasking_request_ids: tasking request UUIDs to wait for
+            download_kwargs: keyword arguments passed to :py:meth:`download_products`, e.g. `local_dir` or `include`
+            wait_kwargs: keyword arguments passed to :py:meth:`wait_for_tasks`
+
+        Returns:
+            Iterator[Tuple[Dict[str, Any], Dict[str, Dict[str, Path]]]]: task metadata and local paths of
+            downloaded files keyed by STAC id and asset type (empty if the task did not complete)
+        """
+        download_kwargs = download_kwargs or {}
+        for task in self.wait_for_tasks(tasking_request_ids, **wait_kwargs):
+            t_req_id = task["properties"]["taskingrequestId"]
+            if not self.is_task_completed(task):
+                logger.warning(f"TaskingRequest<{t_req_id}> finished without completing ... skipping download")
+                yield task, {}
+                continue
+
+            yield task, self.download_products(tasking_request_id=t_req_id, **download_kwargs)
+
     def get_collects_for_task(self, tasking_request_id: str) -> List[Dict[str, Any]]:
         """
         get all the collects associated with this task (see :py:meth:`get_task()`)
@@ -186,16 +394,27 @@ class CapellaConsoleClient:
         return collects_list_resp.json()
 
     # ORDER
-    def list_orders(self, *order_ids: Optional[str], is_active: Optional[bool] = False) -> List[Dict[str, Any]]:
+    def list_orders(
+        self,
+        *order_ids: Optional[str],
+        is_active: Optional[bool] = False,
+        max_workers: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+        raise_on_error: bool = True,
+    ) -> List[Dict[str, Any]]:
         """
         list orders
 
         Args:
             order_id: list only specific orders (variadic, specify multiple)
             is_active: list only active (non-expired) orders
+            max_workers: maximum number of concurrent requests when fetching specific `order_ids`
+            raise_on_error: raise :py:class:`PartialResultError` if fetching any of `order_ids` fails
+                (successful results and errors by order id are attached to the exception's `data`).
+                If only a single id is requested, its original exception is re-raised instead.
+                If False, failures are logged and only the successfully fetched orders are returned
 
         Returns:
-            List[Dict[str, Any]]: metadata of orders
+            List[Dict[str, Any]]: metadata of orders (in order of `order_ids` if specified)
         """
         orders = []
 
@@ -220,12 +439,19 @@ class CapellaConsoleClient:
 
             # list specific orders
             else:
-                for order_id in order_ids:
-                    resp = self._sesh.get(f"/orders/{order_id}")
-                    orders.append(resp.json())
+                orders = _fetch_concurrently(
+                    self._get_order,
+                    order_ids,  # type: ignore
+                    max_workers=max_workers,
+                    raise_on_error=raise_on_error,
+                )
 
         return orders
 
+    def _get_order(self, order_id: str) -> Dict[str, Any]:
+        resp = self._sesh.get(f"/orders/{order_id}")
+        return resp.json()
+
     def get_stac_items_of_order(self, order_id: str, ids_only: bool = False) -> Union[List[str], SearchResult]:
         """
         get stac items of an existing order
@@ -418,9 +644,13 @@ class CapellaConsoleClient:
     def download_asset(
         self,
         pre_signed_url: str,
-        local_path: Union[Path, str] = None,
+        local_path: Optional[Union[Path, str]] = None,
         override: bool = False,
         show_progress: bool = False,
+        store: Union[ProductStore, Path, str, None] = None,
+        verify: bool = False,
+        throttle: Optional[DownloadThrottle] = None,
+        progress_callback: Optional[ProgressCallback] = None,
     ) -> Path:
         """
         downloads a presigned asset url to disk
@@ -430,6 +660,15 @@ class CapellaConsoleClient:
             local_path: local output path - file is written to OS's temp dir if not provided
             override: override already existing `local_path`
             show_progress: show download status progressbar
+            store: content-addressed product store (directory or :py:class:`ProductStore`) - assets already held in
+                the store are hardlinked (or copied) to `local_path` instead of downloaded again
+            verify: verify size and md5 (against ETag) while downloading and record them in a manifest - an existing
+                `local_path` is only skipped if it matches the manifest
+            throttle: bandwidth and request rate limits, see :py:class:`DownloadThrottle` - defaults to limits
+                configured via CAPELLA_MAX_BYTES_PER_SECOND, CAPELLA_MAX_BYTES_PER_SECOND_PER_HOST and
+                CAPELLA_MAX_REQUESTS_PER_SECOND environment variables (if any)
+            progress_callback: called with machine readable progress events (sampled in a separate thread), e.g.
+                :py:class:`JsonProgressSink` - see :py:class:`DownloadProgress`
         """
         dl_request = DownloadRequest(
             url=pre_signed_url,
@@ -441,8 +680,146 @@ class CapellaConsoleClient:
             override=override,
             threaded=False,
             show_progress=show_progress,
+            store=_as_store(store),
+            verify=verify,
+            throttle=_get_throttle(throttle),
+            progress_callback=progress_callback,
         )["asset"]
 
+    # STREAMING
+    def stream_asset(
+        self, pre_signed_url: str, chunk_size: Optional[int] = None, throttle: Optional[DownloadThrottle] = None
+    ) -> Iterator[bytes]:
+        """
+        stream presigned asset url as chunks of bytes without writing to disk
+
+        Args:
+            pre_signed_url: presigned asset url, see :py:meth:`get_presigned_assets`
+            chunk_size: bytes per chunk, defaults to CAPELLA_DOWNLOAD_CHUNK_SIZE or 1 MiB
+            throttle: bandwidth and request rate limits, see :py:class:`DownloadThrottle`
+
+        Returns:
+            Iterator[bytes]: chunks of asset content
+        """
+        return _iter_asset(pre_signed_url, chunk_size, _get_throttle(throttle))
+
+    def open_asset(
+        self, pre_signed_url: str, chunk_size: Optional[int] = None, throttle: Optional[DownloadThrottle] = None
+    ) -> AssetReader:
+        """
+        open presigned asset url as read-only, forward-only file-like object, e.g.
+
+        .. highlight:: python
+        .. code-block:: python
+
+            with client.open_asset(pre_signed_url) as f:
+                s3_client.upload_fileobj(f, "my-bucket", "my-key")
+
+        see :py:meth:`stream_asset` for arguments
+        """
+        return AssetReader(pre_signed_url, chunk_size, _get_throttle(throttle))
+
+    def open_asset_ranged(
+        self,
+        pre_signed_url: str,
+        block_size: int = DEFAULT_RANGE_BLOCK_SIZE,
+        cache_blocks: int = DEFAULT_RANGE_CACHE_BLOCKS,
+        read_ahead: int = DEFAULT_RANGE_READ_AHEAD,
+        throttle: Optional[DownloadThrottle] = None,
+    ) -> RangeReader:
+        """
+        open presigned asset url as seekable, read-only file-like object backed by HTTP range requests, i.e. only
+        the parts actually read are transferred, e.g.
+
+        .. highlight:: python
+        .. code-block:: python
+
+            import rasterio
+
+            with client.open_asset_ranged(pre_signed_url) as f, rasterio.open(f) as src:
+                chip = src.read(1, window=((0, 512), (0, 512)))
+
+        Args:
+            pre_signed_url: presigned asset url, see :py:meth:`get_presigned_assets`
+            block_size: bytes per range request/ cache block
+            cache_blocks: maximum number of blocks kept in LRU cache
+            read_ahead: number of blocks additionally fetched on sequential reads
+            throttle: bandwidth and request rate limits, see :py:class:`DownloadThrottle`
+        """
+        return RangeReader(pre_signed_url, block_size, cache_blocks, read_ahead, _get_throttle(throttle))
+
+    def download_asset_to(
+        self,
+        pre_signed_url: str,
+        sink: Sink,
+        verify: bool = False,
+        throttle: Optional[DownloadThrottle] = None,
+    ) -> int:
+        """
+        pipe presigned asset into `sink` without writing to disk
+
+        Args:
+            pre_signed_url: presigned asset url, see :py:meth:`get_presigned_assets`
+            sink: writable binary file-like object (e.g. io.BytesIO) or callable receiving each chunk of bytes (e.g.
+                hashlib.sha256().update) - not closed
+            verify: verify size and md5 (against ETag) once streamed, raises :py:class:`ChecksumMismatchError`
+            throttle: bandwidth and request rate limits, see :py:class:`DownloadThrottle`
+
+        Returns:
+            int: number of bytes streamed into `sink`
+        """
+        return _stream_to_sink(pre_signed_url, sink, verify=verify, throttle=_get_throttle(throttle))
+
+    def download_products_to(
+        self,
+        sink_factory: SinkFactory,
+        assets_presigned: Optional[List[Dict[str, Any]]] = None,
+        order_id: Optional[str] = None,
+        include: Optional[Union[List[str], str]] = None,
+        exclude: Optional[Union[List[str], str]] = None,
+        product_types: Optional[List[str]] = None,
+        verify: bool = False,
+        threaded: bool = True,
+        throttle: Optional[DownloadThrottle] = None,
+    ) -> Dict[str, Dict[str, int]]:
+        """
+        pipe all assets of multiple products into sinks without writing to disk, e.g. to re-upload them
+
+        Args:
+            sink_factory: called with STAC id, asset type and file name of each asset, returns its sink, see
+                :py:meth:`download_asset_to`
+            assets_presigned: mapping of presigned assets of multiple products, see :py:meth:`get_presigned_assets`
+            order_id: optionally provide `order_id` instead of `assets_presigned`, see :py:meth:`submit_order`
+
+            see :py:meth:`download_products` for remaining arguments
+
+        Returns:
+            Dict[str, Dict[str, int]]: number of bytes streamed keyed by STAC id and asset type
+        """
+        if not assets_presigned and not order_id:
+            raise ValueError("please provide either assets_presigned or order_id")
+
+        product_types = _validate_and_filter_product_types(product_types)
+        include = _validate_and_filter_asset_types(include)
+        exclude = _validate_and_filter_asset_types(exclude)
+
+        if not assets_presigned:
+            _validate_uuid(order_id)
+            assets_presigned = self.get_presigned_assets(order_id)  # type: ignore
+
+        if product_types:
+            assets_presigned = _filter_assets_by_product_types(assets_presigned, product_types)
+
+        return _stream_products_to(
+            assets_presigned,  # type: ignore
+            sink_factory,
+            include=include,
+            exclude=exclude,
+            verify=verify,
+            max_workers=DEFAULT_MAX_CONCURRENT_DOWNLOADS if threaded else 1,
+            throttle=_get_throttle(throttle),
+        )
+
     def download_products(
         self,
         assets_presigned: Optional[List[Dict[str, Any]]] = None,
@@ -450,13 +827,19 @@ class CapellaConsoleClient:
         tasking_request_id: Optional[str] = None,
         collect_id: Optional[str] = None,
         local_dir: Union[Path, str] = Path(tempfile.gettempdir()),
-        include: Union[List[str], str] = None,
-        exclude: Union[List[str], str] = None,
+        include: Optional[Union[List[str], str]] = None,
+        exclude: Optional[Union[List[str], str]] = None,
         override: bool = False,
         threaded: bool = True,
         show_progress: bool = False,
         separate_dirs: bool = True,
-        product_types: List[str] = None,
+        product_types: Optional[List[str]] = None,
+        store: Union[ProductStore, Path, str, None] = None,
+        verify: bool = False,
+        throttle: Optional[DownloadThrottle] = None,
+        progress_callback: Optional[ProgressCallback] = None,
+        asset_priority: Optional[List[str]] = None,
+        manifest: Union[JobManifest, Path, str, None] = None,
     ) -> Dict[str, Dict[str, Path]]:
         """
         download all assets of multiple products
@@ -497,6 +880,23 @@ class CapellaConsoleClient:
                                /tmp/<stac_id_2>.tif
                                ...
             product_types: filter by product type, e.g. ["SLC", "GEO"]
+            store: content-addressed product store (directory or :py:class:`ProductStore`) - assets already held in
+                the store are hardlinked (or copied) into `local_dir` instead of downloaded again
+            verify: verify size and md5 (against ETag) while downloading and record them in a manifest - existing
+                files are only skipped if they match the manifest
+            throttle: bandwidth and request rate limits, see :py:class:`DownloadThrottle` - defaults to limits
+                configured via CAPELLA_MAX_BYTES_PER_SECOND, CAPELLA_MAX_BYTES_PER_SECOND_PER_HOST and
+                CAPELLA_MAX_REQUESTS_PER_SECOND environment variables (if any)
+            progress_callback: called with machine readable progress events (sampled in a separate thread), e.g.
+                :py:class:`JsonProgressSink` - see :py:class:`DownloadProgress`
+            asset_priority: asset keys downloaded ahead of all other assets (in this order), e.g. ["metadata"] for
+                quick indexing - other assets are downloaded largest first with small assets batched
+            manifest: durable job manifest (SQLite file or :py:class:`JobManifest`) recording state, bytes and md5 of
+                each download - downloads already done are skipped, see :py:meth:`resume_downloads`
+
+        NOTE: for `tasking_request_id` and `collect_id` searching, ordering and downloading is pipelined, i.e.
+            downloads of the first products start while the remaining collects are still being searched and ordered.
+            Raises :py:class:`NoValidStacIdsError` if no products are found.
 
         Returns:
             Dict[str, Dict[str, Path]]: Local paths of downloaded files keyed by STAC id and asset type, e.g.
@@ -521,6 +921,29 @@ class CapellaConsoleClient:
         product_types = _validate_and_filter_product_types(product_types)
         include = _validate_and_filter_asset_types(include)
         exclude = _validate_and_filter_asset_types(exclude)
+        product_store = _as_store(store)
+        job_manifest = _as_job_manifest(manifest)
+
+        # pipeline search, order and download of products associated with tasking request or collect
+        if not assets_presigned and not order_id:
+            pipeline = DownloadPipeline(
+                client=self,
+                local_dir=local_dir,
+                include=include,
+                exclude=exclude,
+                override=override,
+                show_progress=show_progress,
+                separate_dirs=separate_dirs,
+                product_types=product_types,
+                max_workers=DEFAULT_MAX_CONCURRENT_DOWNLOADS if threaded else 1,
+                store=product_store,
+                verify=verify,
+                throttle=_get_throttle(throttle),
+                progress_callback=progress_callback,
+                asset_priority=asset_priority,
+                manifest=job_manifest,
+            )
+            return pipeline.run(self._resolve_collect_ids(tasking_request_id, collect_id))
 
         if not assets_presigned:
             assets_presigned = self._resolve_assets_presigned(order_id, tasking_request_id, collect_id, product_types)
@@ -553,15 +976,70 @@ class CapellaConsoleClient:
             override=override,
             threaded=threaded,
             show_progress=show_progress,
+            store=product_store,
+            verify=verify,
+            throttle=_get_throttle(throttle),
+            progress_callback=progress_callback,
+            asset_priority=asset_priority,
+            manifest=job_manifest,
         )
         return by_stac_id  # type: ignore
 
+    def resume_downloads(
+        self,
+        manifest: Union[JobManifest, Path, str],
+        threaded: bool = True,
+        show_progress: bool = False,
+        verify: bool = False,
+        throttle: Optional[DownloadThrottle] = None,
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> Dict[str, Dict[str, Path]]:
+        """
+        resume interrupted :py:meth:`download_products` run recorded in `manifest`
+
+        downloads that are not done (pending, in flight or failed) are downloaded again from scratch, done ones are
+        skipped without transfer as long as their file still has the recorded size
+
+        NOTE: presigned asset urls expire - to resume after expiry re-run :py:meth:`download_products` with the same
+            `manifest` (urls are refreshed, done downloads are skipped)
+
+        Args:
+            manifest: job manifest of :py:meth:`download_products` (SQLite file or :py:class:`JobManifest`)
+
+            see :py:meth:`download_products` for remaining arguments
+
+        Returns:
+            Dict[str, Dict[str, Path]]: Local paths of resumed files keyed by STAC id and asset type
+        """
+        job_manifest = _as_job_manifest(manifest)
+        download_requests = job_manifest.unfinished()  # type: ignore
+
+        by_stac_id: Dict[str, Dict[str, Path]] = defaultdict(dict)
+        for dl_request in download_requests:
+            by_stac_id[dl_request.stac_id][dl_request.asset_key] = dl_request.local_path
+
+        if not download_requests:
+            logger.info(f"all downloads of {job_manifest} done")
+            return {}
+
+        _perform_download(
+            download_requests=download_requests,
+            override=True,
+            threaded=threaded,
+            show_progress=show_progress,
+            verify=verify,
+            throttle=_get_throttle(throttle),
+            progress_callback=progress_callback,
+            manifest=job_manifest,
+        )
+        return dict(by_stac_id)
+
     def _resolve_assets_presigned(
         self,
         order_id: Optional[str] = None,
         tasking_request_id: Optional[str] = None,
         collect_id: Optional[str] = None,
-        product_types: List[str] = None,
+        product_types: Optional[List[str]] = None,
     ) -> List[Dict[str, Any]]:
 
         stac_ids = None
@@ -583,8 +1061,18 @@ class CapellaConsoleClient:
 
         return self.get_presigned_assets(order_id, stac_ids)  # type: ignore
 
+    def _resolve_collect_ids(
+        self, tasking_request_id: Optional[str] = None, collect_id: Optional[str] = None
+    ) -> List[str]:
+        if tasking_request_id:
+            _validate_uuid(tasking_request_id)
+            return [coll["collectId"] for coll in self.get_collects_for_task(tasking_request_id)]
+
+        _validate_uuid(collect_id)
+        return [collect_id]  # type: ignore
+
     def _order_products_for_task(
-        self, tasking_request_id: str, product_types: List[str] = None
+        self, tasking_request_id: str, product_types: Optional[List[str]] = None
     ) -> Tuple[str, List[str]]:
         """
         order all products associated with a tasking request
@@ -597,7 +1085,7 @@ class CapellaConsoleClient:
         return self._order_products_for_collect_ids(collect_ids, product_types)
 
     def _order_products_for_collect_ids(
-        self, collect_ids: List[str], product_types: List[str] = None
+        self, collect_ids: List[str], product_types: Optional[List[str]] = None
     ) -> Tuple[str, List[str]]:
         search_kwargs = dict(
             collect_id__in=collect_ids,
@@ -607,22 +1095,73 @@ class CapellaConsoleClient:
 
         result = self.search(**search_kwargs)
         if not result:
-            logger.warning("No STAC items found ... aborting")
-            sys.exit(0)
+            raise NoValidStacIdsError(f"No STAC items found for collect ids {', '.join(collect_ids)}")
 
         order_id = self.submit_order(items=result, omit_search=True, check_active_orders=True)
         return order_id, result.stac_ids
 
+    def create_download_job(
+        self,
+        job_dir: Union[Path, str],
+        assets_presigned: Optional[List[Dict[str, Any]]] = None,
+        order_id: Optional[str] = None,
+        tasking_request_id: Optional[str] = None,
+        collect_id: Optional[str] = None,
+        local_dir: Union[Path, str] = Path(tempfile.gettempdir()),
+        include: Optional[Union[List[str], str]] = None,
+        exclude: Optional[Union[List[str], str]] = None,
+        separate_dirs: bool = True,
+        product_types: Optional[List[str]] = None,
+        shard_size: int = DEFAULT_JOB_SHARD_SIZE,
+    ) -> DownloadJob:
+        """
+        create sharded download job of all assets of multiple products to be downloaded by multiple processes and/
+        or machines sharing `job_dir` and `local_dir`, see :py:func:`run_download_job` or
+        `capella-console-wizard downloads work <job_dir>`
+
+        Args:
+            job_dir: job directory
+            shard_size: number of assets per shard (unit of work claimed by a worker)
+
+            see :py:meth:`download_products` for remaining arguments
+
+        Returns:
+            DownloadJob: created job
+        """
+        if not any(map(bool, (assets_presigned, order_id, tasking_request_id, collect_id))):
+            raise ValueError("please provide one of assets_presigned, order_id, tasking_request_id or collect_id")
+
+        product_types = _validate_and_filter_product_types(product_types)
+        include = _validate_and_filter_asset_types(include)
+        exclude = _validate_and_filter_asset_types(exclude)
+
+        if not assets_presigned:
+            assets_presigned = self._resolve_assets_presigned(order_id, tasking_request_id, collect_id, product_types)
+
+        if product_types:
+            assets_presigned = _filter_assets_by_product_types(assets_presigned, product_types)
+
+        download_requests = []
+        for cur_assets in assets_presigned:
+            download_requests.extend(_gather_download_requests(cur_assets, local_dir, include, exclude, separate_dirs))
+
+        return DownloadJob.create(job_dir, download_requests, shard_size=shard_size)
+
     def download_product(
         self,
         assets_presigned: Optional[Dict[str, Any]] = None,
         order_id: Optional[str] = None,
         local_dir: Union[Path, str] = Path(tempfile.gettempdir()),
-        include: Union[List[str], str] = None,
-        exclude: Union[List[str], str] = None,
+        include: Optional[Union[List[str], str]] = None,
+        exclude: Optional[Union[List[str], str]] = None,
         override: bool = False,
         threaded: bool = True,
         show_progress: bool = False,
+        store: Union[ProductStore, Path, str, None] = None,
+        verify: bool = False,
+        throttle: Optional[DownloadThrottle] = None,
+        progress_callback: Optional[ProgressCallback] = None,
+        asset_priority: Optional[List[str]] = None,
     ) -> Dict[str, Path]:
         """
         download all assets of a product
@@ -648,6 +1187,17 @@ class CapellaConsoleClient:
             override: override already existing
             threaded: download assets of product in multiple threads
             show_progress: show download status progressbar
+            store: content-addressed product store (directory or :py:class:`ProductStore`) - assets already held in
+                the store are hardlinked (or copied) into `local_dir` instead of downloaded again
+            verify: verify size and md5 (against ETag) while downloading and record them in a manifest - existing
+                files are only skipped if they match the manifest
+            throttle: bandwidth and request rate limits, see :py:class:`DownloadThrottle` - defaults to limits
+                configured via CAPELLA_MAX_BYTES_PER_SECOND, CAPELLA_MAX_BYTES_PER_SECOND_PER_HOST and
+                CAPELLA_MAX_REQUESTS_PER_SECOND environment variables (if any)
+            progress_callback: called with machine readable progress events (sampled in a separate thread), e.g.
+                :py:class:`JsonProgressSink` - see :py:class:`DownloadProgress`
+            asset_priority: asset keys downloaded ahead of all other assets (in this order), e.g. ["metadata"] for
+                quick indexing - other assets are downloaded largest first with small assets batched
 
         Returns:
             Dict[str, Path]: Local paths of downloaded files keyed by asset type, e.g.
@@ -680,6 +1230,11 @@ class CapellaConsoleClient:
             override=override,
             threaded=threaded,
             show_progress=show_progress,
+            store=_as_store(store),
+            verify=verify,
+            throttle=_get_throttle(throttle),
+            progress_callback=progress_callback,
+            asset_priority=asset_priority,
         )
 
     @no_type_check
@@ -750,6 +1305,88 @@ class CapellaConsoleClient:
         search = StacSearch(session=self._sesh, **kwargs)
         return search.fetch_all()
 
+    def iter_search(self, **kwargs) -> Iterator[Dict[str, Any]]:
+        """
+        same as :py:meth:`search` but yields STAC items page by page as they are fetched
+
+        Returns:
+            Iterator[Dict[str, Any]]: STAC items matched
+        """
+        search = StacSearch(session=self._sesh, **kwargs)
+        for page_data in search.iter_pages():
+            yield from page_data["features"]
+
+
+def _task_is_final(task: Dict[str, Any]) -> bool:
+    # most recent status first
+    status_history = task["properties"]["statusHistory"]
+    return bool(status_history) and status_history[0]["code"] in TERMINAL_TASKING_REQUEST_STATUSES
+
+
+def _jitter(delay: float, jitter: float = DEFAULT_TASK_POLL_JITTER) -> float:
+    return delay * random.uniform(1 - jitter, 1 + jitter)
+
+
+def _fetch_concurrently(
+    fetch_fct: Callable[[str], Dict[str, Any]],
+    identifiers: Sequence[str],
+    max_workers: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+    raise_on_error: bool = True,
+) -> List[Dict[str, Any]]:
+    """
+    call `fetch_fct` for each of `identifiers` in up to `max_workers` threads
+
+    a single failing identifier re-raises its original error, several failures raise `PartialResultError`
+
+    Returns:
+        List[Dict[str, Any]]: successful results in order of `identifiers`
+    """
+    results, errors_by_id = _fetch_each(fetch_fct, identifiers, max_workers)
+    if not errors_by_id:
+        return results
+
+    if raise_on_error:
+        if len(identifiers) == 1:
+            raise next(iter(errors_by_id.values()))
+        raise PartialResultError(
+            f"failed to fetch {len(errors_by_id)} of {len(identifiers)}: {', '.join(errors_by_id)}",
+            data={"results": results, "errors": errors_by_id},
+        ) from next(iter(errors_by_id.values()))
+
+    for cur_id, exc in errors_by_id.items():
+        logger.warning(f"failed to fetch {cur_id}: {exc!r}")
+    return results
+
+
+def _fetch_each(
+    fetch_fct: Callable[[str], Dict[str, Any]],
+    identifiers: Sequence[str],
+    max_workers: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+) -> Tuple[List[Dict[str, Any]], Dict[str, Exception]]:
+    """
+    call `fetch_fct` for each of `identifiers` in up to `max_workers` threads
+
+    never raises - errors of `fetch_fct` are collected by identifier
+
+    Returns:
+        Tuple[List[Dict[str, Any]], Dict[str, Exception]]: successful results in order of `identifiers` and errors by
+        identifier
+    """
+    if not identifiers:
+        return [], {}
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(identifiers)))) as executor:
+        futures = [(cur_id, executor.submit(fetch_fct, cur_id)) for cur_id in identifiers]
+
+    results = []
+    errors_by_id = {}
+    for cur_id, fut in futures:
+        try:
+            results.append(fut.result())
+        except Exception as e:
+            errors_by_id[cur_id] = e
+    return results, errors_by_id
+
 
 def _get_non_expired_orders(session: CapellaConsoleSession) -> List[Dict[str, Any]]:
     params = {"customerId": session.customer_id}
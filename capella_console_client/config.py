@@ -1,7 +1,73 @@
+from pathlib import Path
+
 CONSOLE_API_URL = "https://api.capellaspace.com"
 DEFAULT_TIMEOUT = 60
 DEFAULT_PAGE_SIZE = 1000
 DEFAULT_MAX_FEATURE_COUNT = 500
+DEFAULT_MAX_CONCURRENT_REQUESTS = 10
+DEFAULT_MAX_CONCURRENT_DOWNLOADS = 8
+# connection pool size of CapellaConsoleSession
+DEFAULT_MAX_CONNECTIONS = 100
+
+# seconds before JWT expiry the access token is refreshed proactively
+DEFAULT_TOKEN_REFRESH_MARGIN = 60
+# credentials shared across processes, see capella_console_client.credentials
+DEFAULT_CREDENTIAL_CACHE_PATH = Path.home() / ".capella-console-client" / "credentials.json"
+
+# bytes per read/ write of asset downloads
+DEFAULT_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+DOWNLOAD_CHUNK_SIZE_ENV = "CAPELLA_DOWNLOAD_CHUNK_SIZE"
+
+# sharded download jobs, see capella_console_client.coordinator
+DEFAULT_JOB_SHARD_SIZE = 50
+DEFAULT_JOB_LEASE_SECONDS = 300
+
+# download scheduling: assets below SMALL_ASSET_BYTES are batched into work units of up to SMALL_ASSET_BATCH_BYTES
+SMALL_ASSET_BYTES = 1024 * 1024
+SMALL_ASSET_BATCH_BYTES = 8 * 1024 * 1024
+
+# random access via HTTP range requests, see capella_console_client.range_reader
+DEFAULT_RANGE_BLOCK_SIZE = 256 * 1024
+DEFAULT_RANGE_CACHE_BLOCKS = 64
+DEFAULT_RANGE_READ_AHEAD = 4
+
+# seconds between download progress samples
+DEFAULT_PROGRESS_REFRESH_INTERVAL = 0.1
+
+# retries, see capella_console_client.retry
+DEFAULT_RETRY_BUDGET_PER_SECOND = 10
+DEFAULT_RETRY_BUDGET_BURST = 50
+DEFAULT_CIRCUIT_FAILURE_THRESHOLD = 8
+DEFAULT_CIRCUIT_RESET_SECONDS = 30
+RETRYABLE_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+
+# download throttling, see capella_console_client.throttle
+MAX_BYTES_PER_SECOND_ENV = "CAPELLA_MAX_BYTES_PER_SECOND"
+MAX_BYTES_PER_SECOND_PER_HOST_ENV = "CAPELLA_MAX_BYTES_PER_SECOND_PER_HOST"
+MAX_REQUESTS_PER_SECOND_ENV = "CAPELLA_MAX_REQUESTS_PER_SECOND"
+
+# pipelined search -> order -> download
+DEFAULT_COLLECTS_PER_ORDER = 5
+DEFAULT_PIPELINE_QUEUE_SIZE = 16
+
+# task polling (seconds)
+DEFAULT_TASK_POLL_INTERVAL = 30
+DEFAULT_TASK_MAX_POLL_INTERVAL = 600
+DEFAULT_TASK_POLL_BACKOFF = 1.5
+DEFAULT_TASK_POLL_JITTER = 0.1
+# consecutive failed polls of a tasking request before giving up on it
+DEFAULT_TASK_MAX_POLL_FAILURES = 5
+# number of pending tasks above which a single GET /tasks listing is used instead of one GET /task/<id> each
+DEFAULT_TASK_BATCH_THRESHOLD = 5
+
+TERMINAL_TASKING_REQUEST_STATUSES = {
+    "completed",
+    "rejected",
+    "expired",
+    "anomaly",
+    "canceled",
+    "error",
+}
 
 
 SUPPORTED_SEARCH_FIELDS = {
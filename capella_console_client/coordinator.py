@@ -0,0 +1,289 @@
+"""
+sharded downloads across processes and machines
+
+a download job is a directory (e.g. on a shared/ cluster file system) holding the download requests split into
+shards. Workers - processes of a process pool, possibly on multiple machines - claim shards via exclusively created
+lease files, keep their lease alive while downloading and mark shards done once all assets are downloaded. Leases
+of crashed workers expire and are taken over by other workers, i.e. re-running a job resumes unfinished shards.
+
+    job.json                job definition (shards of download requests)
+    claims/<shard>.claim    lease of worker currently downloading <shard>
+    done/<shard>.done       <shard> completely downloaded
+
+NOTE: presigned asset urls expire - jobs need to be worked on before their urls expire.
+"""
+
+import json
+import os
+import socket
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple, Union
+
+from capella_console_client.config import (
+    DEFAULT_JOB_SHARD_SIZE,
+    DEFAULT_JOB_LEASE_SECONDS,
+    DEFAULT_MAX_CONCURRENT_DOWNLOADS,
+)
+from capella_console_client.logconf import logger
+from capella_console_client.assets import DownloadRequest, _perform_download
+from capella_console_client.throttle import _get_throttle
+
+
+class DownloadJob:
+    """
+    Args:
+        job_dir: job directory created by :py:meth:`DownloadJob.create`
+    """
+
+    JOB_FILE_NAME = "job.json"
+    CLAIMS_DIR_NAME = "claims"
+    DONE_DIR_NAME = "done"
+
+    def __init__(self, job_dir: Union[Path, str]):
+        self.job_dir = Path(job_dir)
+        content = json.loads((self.job_dir / self.JOB_FILE_NAME).read_text())
+        self.shards: List[List[Dict[str, Any]]] = content["shards"]
+        self.claims_dir = self.job_dir / self.CLAIMS_DIR_NAME
+        self.done_dir = self.job_dir / self.DONE_DIR_NAME
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.job_dir})"
+
+    @classmethod
+    def create(
+        cls,
+        job_dir: Union[Path, str],
+        download_requests: List[DownloadRequest],
+        shard_size: int = DEFAULT_JOB_SHARD_SIZE,
+    ) -> "DownloadJob":
+        job_dir = Path(job_dir)
+        (job_dir / cls.CLAIMS_DIR_NAME).mkdir(parents=True, exist_ok=True)
+        (job_dir / cls.DONE_DIR_NAME).mkdir(exist_ok=True)
+
+        serialized = [_serialize(dl_request) for dl_request in download_requests]
+        shard_size = max(1, shard_size)
+        shards = [serialized[start : start + shard_size] for start in range(0, len(serialized), shard_size)]
+
+        job_path = job_dir / cls.JOB_FILE_NAME
+        tmp_path = job_path.with_name(f"{job_path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps({"shards": shards}, indent=2))
+        os.replace(tmp_path, job_path)
+
+        logger.info(f"created download job {job_dir} ({len(serialized)} assets in {len(shards)} shards)")
+        return cls(job_dir)
+
+    def download_requests(self, shard: int) -> List[DownloadRequest]:
+        return [_deserialize(cur) for cur in self.shards[shard]]
+
+    def is_done(self, shard: int) -> bool:
+        return self._done_path(shard).exists()
+
+    def pending(self) -> List[int]:
+        return [shard for shard in range(len(self.shards)) if not self.is_done(shard)]
+
+    def claim(self, worker_id: str, lease_seconds: float = DEFAULT_JOB_LEASE_SECONDS) -> Optional[int]:
+        """claim next pending shard not leased by another worker, None if there is none"""
+        for shard in self.pending():
+            if self._try_claim(shard, worker_id, lease_seconds):
+                return shard
+        return None
+
+    def _try_claim(self, shard: int, worker_id: str, lease_seconds: float) -> bool:
+        claim_path = self._claim_path(shard)
+        try:
+            fd = os.open(claim_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+        except FileExistsError:
+            lease = _read_lease(claim_path)
+            if lease is not None and time.time() - lease[1] <= lease_seconds:
+                return False
+
+            # take over expired lease - rename is atomic, i.e. only one worker wins
+            stale_path = claim_path.with_name(f"{claim_path.name}.{worker_id}.stale")
+            try:
+                os.rename(claim_path, stale_path)
+            except FileNotFoundError:
+                return False
+
+            # renewed or taken over by another worker since inspected - hand back
+            if lease is None or _read_lease(stale_path) != lease:
+                _restore_claim(stale_path, claim_path)
+                return False
+
+            stale_path.unlink()
+            logger.info(f"taking over expired lease of shard {shard}")
+            return self._try_claim(shard, worker_id, lease_seconds)
+
+        with os.fdopen(fd, "w") as f:
+            f.write(worker_id)
+
+        # completed in the meantime
+        if self.is_done(shard):
+            self.release(shard, worker_id)
+            return False
+        return True
+
+    def heartbeat(self, shard: int) -> None:
+        """renew lease of `shard`"""
+        try:
+            os.utime(self._claim_path(shard))
+        except FileNotFoundError:
+            pass
+
+    def release(self, shard: int, worker_id: str) -> None:
+        """release lease of `shard` - unless taken over by another worker"""
+        claim_path = self._claim_path(shard)
+        lease = _read_lease(claim_path)
+        if lease is None or lease[0] != worker_id:
+            return
+
+        try:
+            claim_path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def complete(self, shard: int, worker_id: str) -> None:
+        self._done_path(shard).touch()
+        self.release(shard, worker_id)
+
+    def _claim_path(self, shard: int) -> Path:
+        return self.claims_dir / f"{shard}.claim"
+
+    def _done_path(self, shard: int) -> Path:
+        return self.done_dir / f"{shard}.done"
+
+
+def _read_lease(claim_path: Path) -> Optional[Tuple[str, float]]:
+    """worker id and last renewal of lease, None if not leased"""
+    try:
+        with open(claim_path) as f:
+            return (f.read(), os.fstat(f.fileno()).st_mtime)
+    except FileNotFoundError:
+        return None
+
+
+def _restore_claim(stale_path: Path, claim_path: Path) -> None:
+    # link fails instead of replacing if claimed again in the meantime
+    try:
+        os.link(stale_path, claim_path)
+    except FileExistsError:
+        logger.warning(f"unable to restore lease {claim_path} - claimed again in the meantime")
+    stale_path.unlink()
+
+
+def _serialize(dl_request: DownloadRequest) -> Dict[str, Any]:
+    serialized = asdict(dl_request)
+    serialized["local_path"] = str(dl_request.local_path)
+    return serialized
+
+
+def _deserialize(serialized: Dict[str, Any]) -> DownloadRequest:
+    return DownloadRequest(**{**serialized, "local_path": Path(serialized["local_path"])})
+
+
+class _LeaseKeeper:
+    """renews lease of `shard` in background while downloading"""
+
+    def __init__(self, job: DownloadJob, shard: int, lease_seconds: float):
+        self.job = job
+        self.shard = shard
+        self.interval = lease_seconds / 3
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.job.heartbeat(self.shard)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self._stop.set()
+        self._thread.join()
+
+
+def _work(
+    job_dir: str,
+    worker_id: str,
+    lease_seconds: float = DEFAULT_JOB_LEASE_SECONDS,
+    override: bool = False,
+    verify: bool = False,
+    threads: int = DEFAULT_MAX_CONCURRENT_DOWNLOADS,
+) -> Dict[str, int]:
+    """claim and download shards until no claimable shard is left"""
+    job = DownloadJob(job_dir)
+    throttle = _get_throttle()
+    summary = {"completed": 0, "failed": 0}
+
+    shard = job.claim(worker_id, lease_seconds)
+    while shard is not None:
+        try:
+            with _LeaseKeeper(job, shard, lease_seconds):
+                _perform_download(
+                    download_requests=job.download_requests(shard),
+                    override=override,
+                    threaded=True,
+                    verify=verify,
+                    throttle=throttle,
+                    max_workers=threads,
+                )
+        except Exception as e:
+            logger.error(f"{worker_id}: shard {shard} of {job_dir} failed: {e}")
+            job.release(shard, worker_id)
+            summary["failed"] += 1
+            break
+
+        job.complete(shard, worker_id)
+        summary["completed"] += 1
+        shard = job.claim(worker_id, lease_seconds)
+
+    return summary
+
+
+def run_download_job(
+    job_dir: Union[Path, str],
+    processes: Optional[int] = None,
+    lease_seconds: float = DEFAULT_JOB_LEASE_SECONDS,
+    override: bool = False,
+    verify: bool = False,
+    threads: int = DEFAULT_MAX_CONCURRENT_DOWNLOADS,
+) -> Dict[str, int]:
+    """
+    work on download job with a pool of worker processes until no claimable shard is left
+
+    can run concurrently on multiple machines sharing `job_dir` - re-running resumes unfinished shards
+
+    Args:
+        job_dir: job directory, see :py:meth:`DownloadJob.create`
+        processes: number of worker processes, defaults to number of CPUs
+        lease_seconds: lease duration of claimed shards - leases of crashed workers are taken over after expiry
+        override: override already existing files
+        verify: verify size and md5 of downloads - existing files are only skipped if verified before
+        threads: concurrent downloads per worker process
+
+    Returns:
+        Dict[str, int]: number of completed and failed shards, e.g. {"completed": 10, "failed": 0}
+    """
+    processes = processes or os.cpu_count() or 1
+    worker_prefix = f"{socket.gethostname()}-{os.getpid()}"
+    work_kwargs: Dict[str, Any] = dict(lease_seconds=lease_seconds, override=override, verify=verify, threads=threads)
+
+    if processes == 1:
+        summaries = [_work(str(job_dir), f"{worker_prefix}-0", **work_kwargs)]
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            futures = [
+                executor.submit(_work, str(job_dir), f"{worker_prefix}-{idx}", **work_kwargs)
+                for idx in range(processes)
+            ]
+        summaries = [fut.result() for fut in futures]
+
+    summary = {key: sum(cur[key] for cur in summaries) for key in ("completed", "failed")}
+    pending = len(DownloadJob(job_dir).pending())
+    logger.info(f"download job {job_dir}: {summary['completed']} shards completed, {pending} pending")
+    return summary
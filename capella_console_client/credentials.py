@@ -0,0 +1,182 @@
+"""
+persistent credential cache shared across processes
+
+stores access token, refresh token, expiry, user info (customer_id, organization_id, email) and a salted password hash per
+API and user in a local JSON file (readable only by its owner) guarded by an OS file lock. Processes authenticating with a cached user
+start without any auth round trip and pick up tokens refreshed by other processes instead of refreshing again.
+"""
+
+import hashlib
+import hmac
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Optional, Union, Dict, Any, Iterator
+
+from capella_console_client.config import DEFAULT_CREDENTIAL_CACHE_PATH
+from capella_console_client.logconf import logger
+
+PASSWORD_HASH_ITERATIONS = 10_000
+
+
+@dataclass
+class CachedCredentials:
+    access_token: str
+    refresh_token: Optional[str] = None
+    expires_at: Optional[float] = None
+    customer_id: Optional[str] = None
+    organization_id: Optional[str] = None
+    email: Optional[str] = None
+    password_hash: Optional[str] = None
+    updated_at: float = 0.0
+
+
+class CredentialCache:
+    """
+    Args:
+        path: JSON cache file - created (mode 0600) on first write
+    """
+
+    def __init__(self, path: Union[Path, str] = DEFAULT_CREDENTIAL_CACHE_PATH):
+        self.path = Path(path)
+        self._lock_path = self.path.with_name(f"{self.path.name}.lock")
+        self._thread_lock = threading.RLock()
+        self._depth = 0
+        self._lock_fd: Optional[int] = None
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.path})"
+
+    @contextmanager
+    def lock(self) -> Iterator[None]:
+        """exclusive lock across threads and processes - reentrant within a thread"""
+        with self._thread_lock:
+            if self._depth == 0:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                fd = os.open(self._lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+                try:
+                    _lock_file(fd)
+                except BaseException:
+                    os.close(fd)
+                    raise
+                self._lock_fd = fd
+            self._depth += 1
+            try:
+                yield
+            finally:
+                self._depth -= 1
+                if self._depth == 0 and self._lock_fd is not None:
+                    _unlock_file(self._lock_fd)
+                    os.close(self._lock_fd)
+                    self._lock_fd = None
+
+    def load(self, key: str) -> Optional[CachedCredentials]:
+        entry = self._read().get(key)
+        if entry is None:
+            return None
+        try:
+            return CachedCredentials(**entry)
+        except TypeError:
+            return None
+
+    def store(self, key: str, credentials: CachedCredentials) -> None:
+        credentials.updated_at = time.time()
+        with self.lock():
+            entries = self._read()
+            entries[key] = asdict(credentials)
+            self._write(entries)
+
+    def clear(self, key: Optional[str] = None) -> None:
+        """remove cached credentials of `key` (all if None)"""
+        with self.lock():
+            entries = self._read() if key is not None else {}
+            entries.pop(key, None)  # type: ignore
+            self._write(entries)
+
+    def _read(self) -> Dict[str, Any]:
+        try:
+            entries: Dict[str, Any] = json.loads(self.path.read_text())
+        except FileNotFoundError:
+            return {}
+        except ValueError:
+            logger.warning(f"ignoring corrupt credential cache {self.path}")
+            return {}
+        return entries
+
+    def _write(self, entries: Dict[str, Any]) -> None:
+        # write and rename - readers never see partially written files
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=f".{self.path.name}.")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(entries, f)
+            os.chmod(tmp_path, 0o600)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+
+def _credential_key(base_url: str, email: Optional[str] = None, token: Optional[str] = None) -> Optional[str]:
+    """cache key by API and user (email) or token (hashed)"""
+    if email:
+        return f"{base_url}|{email.lower()}"
+    if token:
+        token = token.split(" ")[-1].strip()
+        return f"{base_url}|token:{hashlib.sha256(token.encode()).hexdigest()[:32]}"
+    return None
+
+
+def _hash_password(password: str, salt: Optional[str] = None) -> str:
+    """salted PBKDF2 hash of `password` as <salt>$<digest>"""
+    salt = salt or os.urandom(16).hex()
+    digest = hashlib.pbkdf2_hmac("sha256", password.encode(), salt.encode(), PASSWORD_HASH_ITERATIONS).hex()
+    return f"{salt}${digest}"
+
+
+def _password_matches(password: str, password_hash: Optional[str]) -> bool:
+    if not password_hash:
+        return False
+    salt = password_hash.split("$")[0]
+    return hmac.compare_digest(_hash_password(password, salt), password_hash)
+
+
+def _as_credential_cache(credential_cache: Union[CredentialCache, Path, str, bool, None]) -> Optional[CredentialCache]:
+    if credential_cache is None or credential_cache is False:
+        return None
+    if credential_cache is True:
+        return CredentialCache()
+    if isinstance(credential_cache, CredentialCache):
+        return credential_cache
+    return CredentialCache(credential_cache)
+
+
+if os.name == "nt":
+    import msvcrt
+
+    def _lock_file(fd: int) -> None:
+        # blocks (retrying for ~10s per call) until lock acquired
+        while True:
+            try:
+                msvcrt.locking(fd, msvcrt.LK_LOCK, 1)  # type: ignore
+                return
+            except OSError:
+                continue
+
+    def _unlock_file(fd: int) -> None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)  # type: ignore
+
+else:
+    import fcntl
+
+    def _lock_file(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+
+    def _unlock_file(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
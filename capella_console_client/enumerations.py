@@ -62,3 +62,24 @@ class InstrumentMode(str, BaseEnum):
     stripmap = "stripmap"
     spotlight = "spotlight"
     sliding_spotlight = "sliding_spotlight"
+
+
+class TaskingRequestStatus(str, BaseEnum):
+    received = "received"
+    review = "review"
+    submitted = "submitted"
+    active = "active"
+    accepted = "accepted"
+    rejected = "rejected"
+    expired = "expired"
+    completed = "completed"
+    anomaly = "anomaly"
+    canceled = "canceled"
+    error = "error"
+
+
+class DownloadState(str, BaseEnum):
+    pending = "pending"
+    in_flight = "in_flight"
+    done = "done"
+    failed = "failed"
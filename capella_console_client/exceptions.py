@@ -32,6 +32,10 @@ class InsufficientFundsError(CapellaConsoleClientError):
     pass
 
 
+class TaskWaitTimeoutError(CapellaConsoleClientError):
+    pass
+
+
 class OrderRejectedError(CapellaConsoleClientError):
     pass
 
@@ -44,6 +48,10 @@ class ConnectError(CapellaConsoleClientError):
     pass
 
 
+class ChecksumMismatchError(CapellaConsoleClientError):
+    pass
+
+
 class CollectionAccessDeniedError(CapellaConsoleClientError):
     pass
 
@@ -56,6 +64,22 @@ class NoRefreshTokenError(CapellaConsoleClientError):
     pass
 
 
+class CircuitOpenError(CapellaConsoleClientError):
+    """raised without sending a request while the circuit breaker of an endpoint is open"""
+
+    pass
+
+
+class PartialResultError(CapellaConsoleClientError):
+    """
+    raised if some but not necessarily all of several concurrent requests failed
+
+    data["results"] holds the successful results (in input order), data["errors"] the exception by identifier
+    """
+
+    pass
+
+
 DEFAULT_ERROR_CODE = "GENERAL_API_ERROR"
 INVALID_TOKEN_ERROR_CODE = "INVALID_TOKEN"
 ORDER_EXPIRED_ERROR_CODE = "ORDER_EXPIRED"
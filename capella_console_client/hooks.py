@@ -4,6 +4,7 @@ from dataclasses import dataclass
 
 import httpx
 
+from capella_console_client.config import RETRYABLE_STATUS_CODES
 from capella_console_client.exceptions import (
     CapellaConsoleClientError,
     handle_error_response,
@@ -25,6 +26,8 @@ SILENCE_REQUESTS: List[RequestMeta] = []
 
 def translate_error_to_exception(response):
     if response.status_code >= 500:
+        # response hooks run before the body is read
+        response.read()
         handle_error_response(response)
 
 
@@ -54,6 +57,25 @@ def retry_if_httpx_status_error(exception):
     return isinstance(exception, httpx.HTTPStatusError)
 
 
+def retry_if_transient_httpx_error(exception):
+    """Return upon transport errors and retryable (429, 5xx) httpx.HTTPStatusError"""
+    if isinstance(exception, httpx.HTTPStatusError):
+        return exception.response.status_code in RETRYABLE_STATUS_CODES
+    return isinstance(exception, httpx.TransportError)
+
+
+def retry_if_gateway_error(exception):
+    """Return upon transport errors and errors translated from 502, 503 and 504 responses"""
+    response = getattr(exception, "response", None)
+    if isinstance(exception, CapellaConsoleClientError) and response is not None:
+        return response.status_code in (502, 503, 504)
+    return isinstance(exception, httpx.TransportError)
+
+
+def retry_if_rate_limited(response):
+    return isinstance(response, httpx.Response) and response.status_code == 429
+
+
 def log_attempt_delay(attempts, delay):
     logger.info(f"Attempt #{attempts}, retrying in {delay} ms")
     return delay
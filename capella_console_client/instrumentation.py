@@ -0,0 +1,209 @@
+"""
+request level metrics and tracing
+
+every Console API request (:py:class:`CapellaConsoleSession`) and asset download reports a :py:class:`RequestMetrics`
+to the active :py:class:`Instrumentation` - a no-op unless configured, e.g.
+
+.. code:: python3
+
+    from capella_console_client.instrumentation import PrometheusMetrics, set_instrumentation
+
+    metrics = PrometheusMetrics()
+    set_instrumentation(metrics)
+    ...
+    print(metrics.render())
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Optional, Dict, Tuple, List, Any, Iterator
+
+
+DEFAULT_LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+
+
+@dataclass
+class RequestMetrics:
+    """
+    Args:
+        kind: api (Console API request) or download (presigned asset)
+        method: HTTP method
+        endpoint: endpoint template (ids replaced) for api requests, host for downloads
+        start: epoch seconds
+        duration: seconds including retries and token refreshes
+        status: HTTP status code of final response (None if no response was received)
+        num_bytes: response bytes
+        retries: number of retried attempts
+        token_refreshes: number of access token refreshes
+        error: exception class name if request failed
+    """
+
+    kind: str
+    method: str
+    endpoint: str
+    start: float = 0.0
+    duration: float = 0.0
+    status: Optional[int] = None
+    num_bytes: int = 0
+    retries: int = 0
+    token_refreshes: int = 0
+    error: Optional[str] = None
+
+
+class Instrumentation:
+    """no-op instrumentation - subclass and override :py:meth:`on_request` and/ or :py:meth:`on_retry`"""
+
+    def on_request(self, metrics: RequestMetrics) -> None:
+        pass
+
+    def on_retry(self, endpoint: str, attempt: int, delay: float) -> None:
+        pass
+
+
+class PrometheusMetrics(Instrumentation):
+    """
+    in-memory prometheus style counters and latency histograms, see :py:meth:`render` for text exposition format
+
+    Args:
+        prefix: metric name prefix
+        buckets: latency histogram bucket upper bounds (seconds)
+    """
+
+    def __init__(self, prefix: str = "capella", buckets: Tuple[float, ...] = DEFAULT_LATENCY_BUCKETS):
+        self.prefix = prefix
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self.requests: Dict[Tuple[str, ...], int] = defaultdict(int)
+        self.bytes: Dict[Tuple[str, ...], int] = defaultdict(int)
+        self.retries: Dict[Tuple[str, ...], int] = defaultdict(int)
+        self.token_refreshes = 0
+        self._bucket_counts: Dict[Tuple[str, ...], List[int]] = {}
+        self._duration_sums: Dict[Tuple[str, ...], float] = defaultdict(float)
+
+    def on_request(self, metrics: RequestMetrics) -> None:
+        status = str(metrics.status) if metrics.status is not None else (metrics.error or "error")
+        endpoint_labels = (metrics.kind, metrics.method, metrics.endpoint)
+
+        with self._lock:
+            self.requests[endpoint_labels + (status,)] += 1
+            self.bytes[endpoint_labels] += metrics.num_bytes
+            self.token_refreshes += metrics.token_refreshes
+
+            counts = self._bucket_counts.setdefault(endpoint_labels, [0] * (len(self.buckets) + 1))
+            counts[bisect_left(self.buckets, metrics.duration)] += 1
+            self._duration_sums[endpoint_labels] += metrics.duration
+
+    def on_retry(self, endpoint: str, attempt: int, delay: float) -> None:
+        with self._lock:
+            self.retries[(endpoint,)] += 1
+
+    def render(self) -> str:
+        """prometheus text exposition format"""
+        endpoint_names = ("kind", "method", "endpoint")
+        lines: List[str] = []
+
+        with self._lock:
+            lines += _counter(f"{self.prefix}_requests_total", "requests", endpoint_names + ("status",), self.requests)
+            lines += _counter(f"{self.prefix}_response_bytes_total", "response bytes", endpoint_names, self.bytes)
+            lines += _counter(f"{self.prefix}_retries_total", "retried attempts", ("endpoint",), self.retries)
+            lines += _counter(
+                f"{self.prefix}_token_refreshes_total", "access token refreshes", (), {(): self.token_refreshes}
+            )
+
+            name = f"{self.prefix}_request_duration_seconds"
+            lines += [f"# HELP {name} request latency", f"# TYPE {name} histogram"]
+            for labels, counts in self._bucket_counts.items():
+                cumulative = 0
+                for upper, count in zip(self.buckets + (float("inf"),), counts):
+                    cumulative += count
+                    le = "+Inf" if upper == float("inf") else repr(upper)
+                    lines.append(f"{name}_bucket{_labels(endpoint_names + ('le',), labels + (le,))} {cumulative}")
+                lines.append(f"{name}_sum{_labels(endpoint_names, labels)} {self._duration_sums[labels]}")
+                lines.append(f"{name}_count{_labels(endpoint_names, labels)} {cumulative}")
+
+        return "\n".join(lines) + "\n"
+
+
+class OpenTelemetrySpans(Instrumentation):
+    """
+    one OpenTelemetry span per request (requires opentelemetry-api)
+
+    Args:
+        tracer: OpenTelemetry tracer - defaults to global tracer provider's tracer for capella_console_client
+    """
+
+    def __init__(self, tracer: Any = None):
+        if tracer is None:
+            try:
+                from opentelemetry import trace
+            except ImportError:
+                raise ImportError("OpenTelemetrySpans requires opentelemetry-api (pip install opentelemetry-api)")
+            tracer = trace.get_tracer("capella_console_client")
+        self.tracer = tracer
+
+    def on_request(self, metrics: RequestMetrics) -> None:
+        attributes = {
+            "http.method": metrics.method,
+            "http.route": metrics.endpoint,
+            "capella.kind": metrics.kind,
+            "capella.response_bytes": metrics.num_bytes,
+            "capella.retries": metrics.retries,
+            "capella.token_refreshes": metrics.token_refreshes,
+        }
+        if metrics.status is not None:
+            attributes["http.status_code"] = metrics.status
+        if metrics.error is not None:
+            attributes["error.type"] = metrics.error
+
+        span = self.tracer.start_span(
+            f"{metrics.method} {metrics.endpoint}", start_time=int(metrics.start * 1e9), attributes=attributes
+        )
+        span.end(end_time=int((metrics.start + metrics.duration) * 1e9))
+
+
+_instrumentation = Instrumentation()
+
+
+def get_instrumentation() -> Instrumentation:
+    return _instrumentation
+
+
+def set_instrumentation(instrumentation: Optional[Instrumentation]) -> None:
+    """set process wide instrumentation - None restores no-op default"""
+    global _instrumentation
+    _instrumentation = instrumentation if instrumentation is not None else Instrumentation()
+
+
+@contextmanager
+def _measure(metrics: RequestMetrics, instrumentation: Optional[Instrumentation] = None) -> Iterator[RequestMetrics]:
+    """time enclosed block, record error (and status of attached response) and report `metrics`"""
+    metrics.start = time.time()
+    started = time.perf_counter()
+    try:
+        yield metrics
+    except BaseException as e:
+        metrics.error = type(e).__name__
+        response = getattr(e, "response", None)
+        if metrics.status is None and response is not None:
+            metrics.status = getattr(response, "status_code", None)
+        raise
+    finally:
+        metrics.duration = time.perf_counter() - started
+        (instrumentation or _instrumentation).on_request(metrics)
+
+
+def _counter(name: str, help: str, names: Tuple[str, ...], values: Dict[Tuple[str, ...], int]) -> List[str]:
+    lines = [f"# HELP {name} {help}", f"# TYPE {name} counter"]
+    lines += [f"{name}{_labels(names, labels)} {value}" for labels, value in values.items()]
+    return lines
+
+
+def _labels(names: Tuple[str, ...], values: Tuple[str, ...]) -> str:
+    if not names:
+        return ""
+    escaped = (str(v).replace("\\", "\\\\").replace('"', '\\"') for v in values)
+    return "{" + ",".join(f'{n}="{v}"' for n, v in zip(names, escaped)) + "}"
@@ -0,0 +1,138 @@
+"""
+download integrity verification
+
+MD5 checksums are computed while writing downloaded chunks and compared against the (single part) S3 ETag.
+Verified downloads are recorded in a per directory manifest so that re-runs only skip existing files that match.
+The manifest is shared by concurrent download processes (e.g. download jobs) - updates are serialized by a file lock.
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional, Dict, Any, Union, Iterator
+
+from capella_console_client.credentials import _lock_file, _unlock_file
+from capella_console_client.exceptions import ChecksumMismatchError
+
+
+MD5_ETAG_REGEX = re.compile("^[0-9a-f]{32}$")
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def _md5_from_etag(etag: Optional[str]) -> Optional[str]:
+    """ETag of single part S3 uploads is the MD5 of the object, multipart ETags (<md5>-<part count>) are not"""
+    if not etag:
+        return None
+    etag = etag.strip().strip('"').lower()
+    if etag.startswith("w/"):
+        return None
+    return etag if MD5_ETAG_REGEX.match(etag) else None
+
+
+def _verify(local_path: Union[Path, str], num_bytes: int, md5: str, expected_size: int, etag: Optional[str]) -> None:
+    if expected_size != -1 and num_bytes != expected_size:
+        raise ChecksumMismatchError(f"{local_path}: size mismatch ({num_bytes} instead of {expected_size} bytes)")
+
+    expected_md5 = _md5_from_etag(etag)
+    if expected_md5 and md5 != expected_md5:
+        raise ChecksumMismatchError(f"{local_path}: md5 mismatch ({md5} instead of {expected_md5})")
+
+
+def _file_md5(local_path: Path) -> str:
+    hasher = hashlib.md5()
+    with open(local_path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+class DownloadManifest:
+    """
+    per directory manifest (.capella-manifest.json) of verified downloads, keyed by file name
+    """
+
+    FILE_NAME = ".capella-manifest.json"
+    _lock = threading.Lock()
+
+    @classmethod
+    def _path(cls, local_path: Path) -> Path:
+        return local_path.parent / cls.FILE_NAME
+
+    @classmethod
+    def _load(cls, manifest_path: Path) -> Dict[str, Any]:
+        try:
+            content: Dict[str, Any] = json.loads(manifest_path.read_text())
+        except (FileNotFoundError, ValueError):
+            content = {}
+        return content
+
+    @classmethod
+    @contextmanager
+    def _locked(cls, manifest_path: Path) -> Iterator[None]:
+        """exclusive lock of `manifest_path` across threads and processes"""
+        with cls._lock:
+            fd = os.open(manifest_path.with_name(f"{manifest_path.name}.lock"), os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                _lock_file(fd)
+                try:
+                    yield
+                finally:
+                    _unlock_file(fd)
+            finally:
+                os.close(fd)
+
+    @classmethod
+    def record(cls, local_path: Path, num_bytes: int, md5: str, etag: Optional[str] = None) -> None:
+        manifest_path = cls._path(local_path)
+        with cls._locked(manifest_path):
+            manifest = cls._load(manifest_path)
+            manifest[local_path.name] = {
+                "size": num_bytes,
+                "md5": md5,
+                "etag": etag,
+                "mtime_ns": local_path.stat().st_mtime_ns,
+            }
+
+            tmp_path = manifest_path.with_name(f"{manifest_path.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(manifest, indent=2))
+            os.replace(tmp_path, manifest_path)
+
+    @classmethod
+    def get(cls, local_path: Path) -> Optional[Dict[str, Any]]:
+        # manifest replaced atomically - no lock required
+        return cls._load(cls._path(local_path)).get(local_path.name)
+
+    @classmethod
+    def is_verified(cls, local_path: Path, rehash: bool = False) -> bool:
+        """
+        check if existing `local_path` matches size and md5 recorded in manifest
+
+        Args:
+            local_path: downloaded file
+            rehash: compare md5 even if size and modification time match the manifest (unchanged since verified)
+        """
+        entry = cls.get(local_path)
+        if not entry:
+            return False
+
+        try:
+            stat = local_path.stat()
+        except FileNotFoundError:
+            return False
+
+        if stat.st_size != entry["size"]:
+            return False
+
+        if not rehash and stat.st_mtime_ns == entry.get("mtime_ns"):
+            return True
+
+        if _file_md5(local_path) != entry["md5"]:
+            return False
+
+        # modified (e.g. touched or copied) but identical - no need to hash again next time
+        cls.record(local_path, entry["size"], entry["md5"], entry.get("etag"))
+        return True
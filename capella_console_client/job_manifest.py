@@ -0,0 +1,160 @@
+"""
+durable download job manifest
+
+records state (pending, in_flight, done, failed), bytes and md5 of every download request in SQLite so that
+interrupted download runs can be resumed exactly, see :py:meth:`CapellaConsoleClient.resume_downloads`
+"""
+
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional, Union, Dict, Iterable
+
+from capella_console_client.enumerations import DownloadState
+from capella_console_client.logconf import logger
+from capella_console_client.assets import DownloadRequest
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS requests (
+    local_path TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    asset_key TEXT NOT NULL,
+    stac_id TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    state TEXT NOT NULL,
+    bytes INTEGER,
+    md5 TEXT,
+    error TEXT,
+    updated_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS requests_state ON requests (state);
+"""
+
+
+class JobManifest:
+    """
+    Args:
+        path: SQLite manifest file - created if it does not exist
+    """
+
+    def __init__(self, path: Union[Path, str]):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._con = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        with self._lock, self._con:
+            self._con.execute("PRAGMA journal_mode=WAL")
+            self._con.execute("PRAGMA synchronous=NORMAL")
+            self._con.executescript(_SCHEMA)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.path})"
+
+    def close(self) -> None:
+        with self._lock:
+            self._con.close()
+
+    def add(self, download_requests: Iterable[DownloadRequest]) -> None:
+        """register `download_requests` as pending - state of already registered requests is kept, urls updated"""
+        now = _now()
+        rows = [
+            (
+                str(dl_request.local_path),
+                dl_request.url,
+                dl_request.asset_key,
+                dl_request.stac_id,
+                dl_request.size,
+                DownloadState.pending.value,
+                now,
+            )
+            for dl_request in download_requests
+        ]
+        with self._lock, self._con:
+            self._con.executemany(
+                """
+                INSERT INTO requests (local_path, url, asset_key, stac_id, size, state, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (local_path) DO UPDATE SET url = excluded.url
+                """,
+                rows,
+            )
+
+    def mark_in_flight(self, dl_request: DownloadRequest) -> None:
+        self._update(dl_request, DownloadState.in_flight)
+
+    def mark_done(self, dl_request: DownloadRequest) -> None:
+        num_bytes = Path(dl_request.local_path).stat().st_size
+        self._update(dl_request, DownloadState.done, num_bytes=num_bytes, md5=dl_request.md5)
+
+    def mark_failed(self, dl_request: DownloadRequest, error: BaseException) -> None:
+        self._update(dl_request, DownloadState.failed, error=f"{type(error).__name__}: {error}")
+
+    def _update(
+        self,
+        dl_request: DownloadRequest,
+        state: DownloadState,
+        num_bytes: Optional[int] = None,
+        md5: Optional[str] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        with self._lock, self._con:
+            self._con.execute(
+                "UPDATE requests SET state = ?, bytes = ?, md5 = ?, error = ?, updated_at = ? WHERE local_path = ?",
+                (state.value, num_bytes, md5, error, _now(), str(dl_request.local_path)),
+            )
+
+    def is_done(self, dl_request: DownloadRequest) -> bool:
+        """`dl_request` is done and its file still has the recorded size"""
+        with self._lock:
+            row = self._con.execute(
+                "SELECT bytes FROM requests WHERE local_path = ? AND state = ?",
+                (str(dl_request.local_path), DownloadState.done.value),
+            ).fetchone()
+
+        return row is not None and _has_size(Path(dl_request.local_path), row[0])
+
+    def counts(self) -> Dict[str, int]:
+        """number of requests by state"""
+        with self._lock:
+            rows = self._con.execute("SELECT state, COUNT(*) FROM requests GROUP BY state").fetchall()
+        counts = {state.value: 0 for state in DownloadState}
+        counts.update(dict(rows))
+        return counts
+
+    def unfinished(self) -> List[DownloadRequest]:
+        """requests not done (yet), including done ones whose file is missing or has changed size"""
+        with self._lock:
+            rows = self._con.execute(
+                "SELECT local_path, url, asset_key, stac_id, size, state, bytes FROM requests ORDER BY rowid"
+            ).fetchall()
+
+        unfinished = []
+        for local_path, url, asset_key, stac_id, size, state, num_bytes in rows:
+            if state == DownloadState.done.value and _has_size(Path(local_path), num_bytes):
+                continue
+            unfinished.append(
+                DownloadRequest(url=url, local_path=Path(local_path), asset_key=asset_key, stac_id=stac_id, size=size)
+            )
+
+        logger.info(f"{len(unfinished)} of {len(rows)} downloads of {self.path} unfinished")
+        return unfinished
+
+
+def _has_size(local_path: Path, num_bytes: Optional[int]) -> bool:
+    try:
+        return local_path.stat().st_size == num_bytes
+    except FileNotFoundError:
+        return False
+
+
+def _now() -> str:
+    return datetime.utcnow().isoformat()
+
+
+def _as_job_manifest(manifest: Union[JobManifest, Path, str, None]) -> Optional[JobManifest]:
+    if manifest is None or isinstance(manifest, JobManifest):
+        return manifest
+    return JobManifest(manifest)
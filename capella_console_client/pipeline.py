@@ -0,0 +1,240 @@
+"""
+pipelined search -> order -> download of all products associated with collects
+
+downloads of the first products start while the remaining collects are still being searched and ordered.
+stages are connected by bounded queues.
+"""
+
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Union, Iterator, TYPE_CHECKING
+
+from capella_console_client.config import (
+    DEFAULT_COLLECTS_PER_ORDER,
+    DEFAULT_PIPELINE_QUEUE_SIZE,
+    DEFAULT_MAX_CONCURRENT_DOWNLOADS,
+)
+from capella_console_client.logconf import logger
+from capella_console_client.exceptions import NoValidStacIdsError
+from capella_console_client.store import ProductStore
+from capella_console_client.throttle import DownloadThrottle
+from capella_console_client.assets import (
+    _gather_download_requests,
+    _download_assets,
+    _pending,
+    _probe_sizes,
+    _filter_assets_by_product_types,
+)
+from capella_console_client.progress import ProgressCallback, _open_progress
+from capella_console_client.scheduling import _schedule
+from capella_console_client.job_manifest import JobManifest
+
+if TYPE_CHECKING:
+    from capella_console_client.client import CapellaConsoleClient
+
+
+_DONE = object()
+_QUEUE_POLL_TIMEOUT = 0.1
+
+
+class DownloadPipeline:
+    """
+    search, order and download all products of `collect_ids` in pipelined stages
+
+    Args:
+        client: authenticated client
+        local_dir: local directory where assets are saved to
+        include: white-listing of asset types, see :py:meth:`CapellaConsoleClient.download_products`
+        exclude: black-listing of asset types, see :py:meth:`CapellaConsoleClient.download_products`
+        override: override already existing
+        show_progress: show download status progressbar
+        separate_dirs: save the respective product assets into product directories
+        product_types: filter by product type, e.g. ["SLC", "GEO"]
+        collects_per_order: number of collects searched and ordered per order stage iteration
+        queue_size: maximum number of products/ downloads buffered between stages
+        max_workers: maximum number of concurrent asset downloads
+        store: content-addressed product store, see :py:class:`ProductStore`
+        verify: verify size and md5 of downloads, see :py:class:`DownloadManifest`
+        throttle: bandwidth and request rate limits, see :py:class:`DownloadThrottle`
+        progress_callback: called with download progress events, see :py:class:`DownloadProgress`
+        asset_priority: asset keys downloaded ahead of all other assets of a product, e.g. ["metadata"]
+        manifest: durable job manifest recording the state of each download, see :py:class:`JobManifest`
+    """
+
+    def __init__(
+        self,
+        client: "CapellaConsoleClient",
+        local_dir: Path,
+        include: Optional[Union[List[str], str]] = None,
+        exclude: Optional[Union[List[str], str]] = None,
+        override: bool = False,
+        show_progress: bool = False,
+        separate_dirs: bool = True,
+        product_types: Optional[List[str]] = None,
+        collects_per_order: int = DEFAULT_COLLECTS_PER_ORDER,
+        queue_size: int = DEFAULT_PIPELINE_QUEUE_SIZE,
+        max_workers: int = DEFAULT_MAX_CONCURRENT_DOWNLOADS,
+        store: Optional[ProductStore] = None,
+        verify: bool = False,
+        throttle: Optional[DownloadThrottle] = None,
+        progress_callback: Optional[ProgressCallback] = None,
+        asset_priority: Optional[List[str]] = None,
+        manifest: Optional[JobManifest] = None,
+    ):
+        self.client = client
+        self.local_dir = Path(local_dir)
+        self.include = include
+        self.exclude = exclude
+        self.override = override
+        self.show_progress = show_progress
+        self.separate_dirs = separate_dirs
+        self.product_types = product_types
+        self.collects_per_order = max(1, collects_per_order)
+        self.queue_size = max(1, queue_size)
+        self.max_workers = max(1, max_workers)
+        self.store = store
+        self.verify = verify
+        self.throttle = throttle
+        self.progress_callback = progress_callback
+        self.asset_priority = asset_priority
+        self.manifest = manifest
+
+        self._stop = threading.Event()
+        self._errors: List[BaseException] = []
+        self._product_cnt = 0
+
+    def run(self, collect_ids: List[str]) -> Dict[str, Dict[str, Path]]:
+        """
+        Returns:
+            Dict[str, Dict[str, Path]]: Local paths of downloaded files keyed by STAC id and asset type
+        """
+        assets_queue: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        order_stage = threading.Thread(target=self._order_stage, args=(collect_ids, assets_queue), daemon=True)
+
+        by_stac_id: Dict[str, Dict[str, Path]] = {}
+        futures: List[Future] = []
+
+        # bounds downloads submitted but not yet finished
+        in_flight = threading.BoundedSemaphore(self.max_workers + self.queue_size)
+
+        with _open_progress(self.show_progress, self.progress_callback) as progress:
+            order_stage.start()
+
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                for assets_presigned in self._drain(assets_queue):
+                    download_requests = _gather_download_requests(
+                        assets_presigned, self.local_dir, self.include, self.exclude, self.separate_dirs
+                    )
+                    if not download_requests:
+                        continue
+
+                    by_stac_id[download_requests[0].stac_id] = {
+                        cur.asset_key: cur.local_path for cur in download_requests
+                    }
+
+                    if self.manifest is not None:
+                        self.manifest.add(download_requests)
+
+                    # largest first, small assets batched
+                    _probe_sizes(_pending(download_requests, self.override), throttle=self.throttle)
+                    for unit in _schedule(download_requests, self.asset_priority):
+                        while not in_flight.acquire(timeout=_QUEUE_POLL_TIMEOUT):
+                            if self._stop.is_set():
+                                break
+                        if self._stop.is_set():
+                            break
+
+                        fut = executor.submit(
+                            _download_assets,
+                            unit,
+                            override=self.override,
+                            show_progress=self.show_progress,
+                            progress=progress,
+                            store=self.store,
+                            verify=self.verify,
+                            throttle=self.throttle,
+                            manifest=self.manifest,
+                        )
+                        fut.add_done_callback(lambda f: self._on_download_done(f, in_flight))
+                        futures.append(fut)
+
+            order_stage.join()
+
+        if self._errors:
+            raise self._errors[0]
+
+        for fut in futures:
+            fut.result()
+
+        if not self._product_cnt:
+            raise NoValidStacIdsError(f"No STAC items found for collect ids {', '.join(collect_ids)}")
+
+        if not by_stac_id:
+            logger.warning("Nothing to download")
+
+        return by_stac_id
+
+    def _drain(self, assets_queue: queue.Queue) -> Iterator[Dict[str, Any]]:
+        while not self._stop.is_set():
+            try:
+                item = assets_queue.get(timeout=_QUEUE_POLL_TIMEOUT)
+            except queue.Empty:
+                continue
+
+            if item is _DONE:
+                return
+            yield item
+
+    def _put(self, assets_queue: queue.Queue, item: Any) -> None:
+        while not self._stop.is_set():
+            try:
+                assets_queue.put(item, timeout=_QUEUE_POLL_TIMEOUT)
+                return
+            except queue.Full:
+                continue
+
+    def _on_download_done(self, fut: Future, in_flight: threading.BoundedSemaphore) -> None:
+        in_flight.release()
+        exc = fut.exception()
+        if exc is not None:
+            self._fail(exc)
+
+    def _fail(self, exc: BaseException) -> None:
+        self._errors.append(exc)
+        self._stop.set()
+
+    def _order_stage(self, collect_ids: List[str], assets_queue: queue.Queue) -> None:
+        try:
+            for start in range(0, len(collect_ids), self.collects_per_order):
+                if self._stop.is_set():
+                    return
+
+                cur_collect_ids = collect_ids[start : start + self.collects_per_order]
+                for assets_presigned in self._search_and_order(cur_collect_ids):
+                    self._put(assets_queue, assets_presigned)
+        except Exception as e:
+            self._fail(e)
+        finally:
+            self._put(assets_queue, _DONE)
+
+    def _search_and_order(self, collect_ids: List[str]) -> List[Dict[str, Any]]:
+        search_kwargs: Dict[str, Any] = dict(collect_id__in=collect_ids)
+        if self.product_types:
+            search_kwargs["product_type__in"] = self.product_types
+
+        result = self.client.search(**search_kwargs)
+        if not result:
+            logger.info(f"No STAC items found for collect ids {', '.join(collect_ids)}")
+            return []
+
+        self._product_cnt += len(result)
+        order_id = self.client.submit_order(items=result, omit_search=True, check_active_orders=True)
+        assets_presigned = self.client.get_presigned_assets(order_id, result.stac_ids)
+
+        if self.product_types:
+            assets_presigned = _filter_assets_by_product_types(assets_presigned, self.product_types)
+
+        logger.info(f"downloading {len(assets_presigned)} product(s) of order {order_id}")
+        return assets_presigned
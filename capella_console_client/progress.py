@@ -0,0 +1,227 @@
+"""
+download progress reporting decoupled from the download loop
+
+download workers only increment a plain per download byte counter (single writer, no locks). A single renderer
+thread samples all counters of active downloads at a fixed rate and forwards changes to the rich progress bar and/ or
+a callback (e.g. :py:class:`JsonProgressSink` for headless services). Finished and failed downloads are dropped by the
+renderer thread after their last sample, only aggregate totals are kept. Nothing is tracked if progress reporting is disabled.
+"""
+
+import json
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Callable, Dict, Any, List, Iterator, IO, TYPE_CHECKING
+
+import rich.progress
+
+from capella_console_client.config import DEFAULT_PROGRESS_REFRESH_INTERVAL
+from capella_console_client.logconf import logger
+
+if TYPE_CHECKING:
+    from capella_console_client.assets import DownloadRequest
+
+
+ProgressCallback = Callable[[Dict[str, Any]], None]
+
+
+@dataclass
+class DownloadCounter:
+    local_path: Path
+    asset_key: str
+    stac_id: str = ""
+    total: int = -1
+    completed: int = 0
+    done: bool = False
+    failed: bool = False
+
+
+def _new_progress_bar() -> rich.progress.Progress:
+    return rich.progress.Progress(
+        rich.progress.TextColumn("[bold blue]{task.fields[filename]}", justify="left"),
+        rich.progress.BarColumn(bar_width=None),
+        "[progress.percentage]{task.percentage:>3.1f}%",
+        "•",
+        rich.progress.DownloadColumn(),
+        "•",
+        rich.progress.TransferSpeedColumn(),
+        "•",
+        rich.progress.TimeRemainingColumn(),
+    )
+
+
+class DownloadProgress:
+    """
+    Args:
+        show_progress: render rich progress bar
+        callback: called (from the renderer thread) with a progress event for each changed download, e.g.
+
+            .. highlight:: python
+            .. code-block:: python
+
+                {
+                    "event": "progress",  # "progress" | "done" | "failed"
+                    "local_path": "/tmp/<stac_id>/<stac_id>.tif",
+                    "asset_key": "HH",
+                    "stac_id": "<stac_id>",
+                    "completed": 1048576,
+                    "total": 4194304,  # -1 if unknown
+                }
+
+        interval: seconds between samples
+    """
+
+    def __init__(
+        self,
+        show_progress: bool = False,
+        callback: Optional[ProgressCallback] = None,
+        interval: float = DEFAULT_PROGRESS_REFRESH_INTERVAL,
+    ):
+        self.callback = callback
+        self.interval = interval
+        self.progress_bar = _new_progress_bar() if show_progress else None
+
+        self._counters: List[DownloadCounter] = []
+        # finished downloads
+        self.num_done = 0
+        self.bytes_done = 0
+        self.num_failed = 0
+        self._reported: Dict[int, Any] = {}
+        self._task_ids: Dict[int, rich.progress.TaskID] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._renderer: Optional[threading.Thread] = None
+
+    def register(self, dl_request: "DownloadRequest", total: int) -> DownloadCounter:
+        counter = DownloadCounter(
+            local_path=dl_request.local_path,
+            asset_key=dl_request.asset_key,
+            stac_id=dl_request.stac_id,
+            total=total,
+        )
+        with self._lock:
+            self._counters.append(counter)
+        return counter
+
+    def discard(self, counter: DownloadCounter) -> None:
+        """mark download of `counter` failed - dropped (and reported as failed) by next sample"""
+        counter.failed = True
+
+    def start(self) -> None:
+        if self.progress_bar is not None:
+            self.progress_bar.start()
+        self._renderer = threading.Thread(target=self._render, name="capella-progress", daemon=True)
+        self._renderer.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._renderer is not None:
+            self._renderer.join()
+        self.sample()
+        if self.progress_bar is not None:
+            self.progress_bar.stop()
+            suffix = f", {self.num_failed} failed" if self.num_failed else ""
+            logger.info(f"downloaded {self.num_done} files ({self.bytes_done} bytes){suffix}")
+
+    def _render(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def sample(self) -> None:
+        """forward counters changed since last sample - drops finished and failed downloads"""
+        with self._lock:
+            counters = list(self._counters)
+
+        finished = []
+        for counter in counters:
+            state = (counter.completed, counter.done, counter.failed)
+            if self._reported.get(id(counter)) == state:
+                continue
+            self._reported[id(counter)] = state
+
+            if self.progress_bar is not None:
+                self._update_progress_bar(counter)
+
+            if self.callback is not None:
+                self.callback(_to_event(counter))
+
+            if counter.done or counter.failed:
+                finished.append(counter)
+
+        if not finished:
+            return
+
+        finished_ids = {id(counter) for counter in finished}
+        with self._lock:
+            self._counters = [counter for counter in self._counters if id(counter) not in finished_ids]
+        for counter in finished:
+            if counter.failed:
+                self.num_failed += 1
+            else:
+                self.num_done += 1
+                self.bytes_done += counter.completed
+            self._forget(counter)
+
+    def _forget(self, counter: DownloadCounter) -> None:
+        self._reported.pop(id(counter), None)
+        task_id = self._task_ids.pop(id(counter), None)
+        if task_id is not None and self.progress_bar is not None:
+            self.progress_bar.remove_task(task_id)
+
+    def _update_progress_bar(self, counter: DownloadCounter) -> None:
+        assert self.progress_bar is not None
+        task_id = self._task_ids.get(id(counter))
+        if task_id is None:
+            task_id = self.progress_bar.add_task(
+                "Download", total=counter.total, filename=Path(counter.local_path).name
+            )
+            self._task_ids[id(counter)] = task_id
+        self.progress_bar.update(task_id, completed=counter.completed)
+
+
+def _to_event(counter: DownloadCounter) -> Dict[str, Any]:
+    return {
+        "event": "failed" if counter.failed else "done" if counter.done else "progress",
+        "local_path": str(counter.local_path),
+        "asset_key": counter.asset_key,
+        "stac_id": counter.stac_id,
+        "completed": counter.completed,
+        "total": counter.total,
+    }
+
+
+class JsonProgressSink:
+    """
+    progress callback writing one JSON object per event and line (NDJSON) to `stream` (default: stdout)
+    """
+
+    def __init__(self, stream: Optional[IO[str]] = None):
+        self.stream = stream
+        self._lock = threading.Lock()
+
+    def __call__(self, event: Dict[str, Any]) -> None:
+        stream = self.stream or sys.stdout
+        line = json.dumps({"ts": time.time(), **event})
+        with self._lock:
+            stream.write(f"{line}\n")
+            stream.flush()
+
+
+@contextmanager
+def _open_progress(
+    show_progress: bool = False, callback: Optional[ProgressCallback] = None
+) -> Iterator[Optional[DownloadProgress]]:
+    """None if progress reporting is disabled, i.e. no renderer thread and no counting"""
+    if not show_progress and callback is None:
+        yield None
+        return
+
+    progress = DownloadProgress(show_progress=show_progress, callback=callback)
+    progress.start()
+    try:
+        yield progress
+    finally:
+        progress.stop()
@@ -0,0 +1,233 @@
+"""
+random access to presigned assets via HTTP range requests
+
+:py:class:`RangeReader` is a seekable, read-only file-like object fetching fixed size blocks on demand. Blocks are
+kept in an LRU cache, sequential reads trigger read-ahead and adjacent missing blocks are coalesced into a single
+range request. Tools like rasterio or tifffile can read only the tiles/ overviews they need of cloud optimized assets.
+"""
+
+import io
+import re
+import threading
+from collections import OrderedDict
+from typing import Optional, List, Tuple
+
+import httpx
+
+from capella_console_client.config import (
+    DEFAULT_TIMEOUT,
+    DEFAULT_RANGE_BLOCK_SIZE,
+    DEFAULT_RANGE_CACHE_BLOCKS,
+    DEFAULT_RANGE_READ_AHEAD,
+)
+from capella_console_client.exceptions import ConnectError
+from capella_console_client.retry import DEFAULT_RETRY_ENGINE, DOWNLOAD_RETRY_POLICY, _url_host, _last_call_retries
+from capella_console_client.instrumentation import RequestMetrics, _measure
+from capella_console_client.throttle import DownloadThrottle
+
+
+CONTENT_RANGE_REGEX = re.compile(r"^bytes (\d+)-(\d+)/(\d+|\*)$")
+
+
+class RangeReader(io.RawIOBase):
+    """
+    Args:
+        pre_signed_url: presigned asset url
+        block_size: bytes per block (unit of fetching and caching)
+        cache_blocks: maximum number of blocks kept in LRU cache
+        read_ahead: number of blocks additionally fetched on sequential reads
+        throttle: bandwidth and request rate limits, see :py:class:`DownloadThrottle`
+    """
+
+    def __init__(
+        self,
+        pre_signed_url: str,
+        block_size: int = DEFAULT_RANGE_BLOCK_SIZE,
+        cache_blocks: int = DEFAULT_RANGE_CACHE_BLOCKS,
+        read_ahead: int = DEFAULT_RANGE_READ_AHEAD,
+        throttle: Optional[DownloadThrottle] = None,
+    ):
+        super().__init__()
+        self.pre_signed_url = pre_signed_url
+        self.block_size = max(1, block_size)
+        self.cache_blocks = max(1, cache_blocks)
+        self.read_ahead = max(0, read_ahead)
+        self.throttle = throttle
+
+        # transfer stats
+        self.num_requests = 0
+        self.bytes_fetched = 0
+
+        self._client = httpx.Client(timeout=DEFAULT_TIMEOUT)
+        self._cache: "OrderedDict[int, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._position = 0
+        self._last_block = -1
+        # server does not support range requests
+        self._full_content: Optional[bytes] = None
+
+        # first block (e.g. TIFF header) also reveals total size
+        self.size = -1
+        self._fetch_blocks(0, 0)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(size={self.size}, block_size={self.block_size})"
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self.size + offset
+        else:
+            raise ValueError(f"invalid whence ({whence})")
+
+        if position < 0:
+            raise ValueError(f"negative seek position {position}")
+        self._position = position
+        return position
+
+    def readinto(self, buffer) -> int:  # type: ignore
+        length = min(len(buffer), self.size - self._position)
+        if length <= 0:
+            return 0
+
+        data = self._read_range(self._position, length)
+        buffer[: len(data)] = data
+        self._position += len(data)
+        return len(data)
+
+    def close(self) -> None:
+        if not self.closed:
+            self._client.close()
+            self._cache.clear()
+            self._full_content = None
+        super().close()
+
+    def _read_range(self, start: int, length: int) -> bytes:
+        if self._full_content is not None:
+            return self._full_content[start : start + length]
+
+        first, last = start // self.block_size, (start + length - 1) // self.block_size
+
+        # span exceeds cache - read through
+        if last - first + 1 > self.cache_blocks:
+            return self._get(start, start + length - 1)[1]
+
+        with self._lock:
+            self._ensure(first, last)
+            blocks = []
+            for idx in range(first, last + 1):
+                self._cache.move_to_end(idx)
+                blocks.append(self._cache[idx])
+            self._last_block = last
+
+        offset = start - first * self.block_size
+        return b"".join(blocks)[offset : offset + length]
+
+    def _ensure(self, first: int, last: int) -> None:
+        if all(idx in self._cache for idx in range(first, last + 1)):
+            return
+
+        # sequential access - extend miss by read-ahead
+        if self.read_ahead and first in (self._last_block, self._last_block + 1):
+            last_block = (self.size - 1) // self.block_size
+            last = min(last + self.read_ahead, last_block, first + self.cache_blocks - 1)
+
+        for run_first, run_last in _missing_runs([idx for idx in range(first, last + 1) if idx not in self._cache]):
+            self._fetch_blocks(run_first, run_last, keep=(first, last))
+
+    def _fetch_blocks(self, first: int, last: int, keep: Optional[Tuple[int, int]] = None) -> None:
+        """
+        fetch blocks `first` to `last` into cache
+
+        Args:
+            first: first block index
+            last: last block index (inclusive)
+            keep: (first, last) block indices exempt from eviction - defaults to the fetched blocks
+        """
+        start, content = self._get(first * self.block_size, (last + 1) * self.block_size - 1)
+        if self._full_content is not None:
+            return
+
+        for offset in range(0, len(content), self.block_size):
+            self._cache[(start + offset) // self.block_size] = content[offset : offset + self.block_size]
+            self._cache.move_to_end((start + offset) // self.block_size)
+
+        keep_first, keep_last = keep or (first, last)
+        for idx in list(self._cache):
+            if len(self._cache) <= self.cache_blocks:
+                break
+            if not keep_first <= idx <= keep_last:
+                del self._cache[idx]
+
+    def _get(self, start: int, end: int) -> Tuple[int, bytes]:
+        host = _url_host(self.pre_signed_url)
+        with _measure(RequestMetrics("download", "GET", host)) as metrics:
+            try:
+                offset, content = DEFAULT_RETRY_ENGINE.call(self._get_once, DOWNLOAD_RETRY_POLICY, host, start, end)
+            # retries exhausted
+            except httpx.ConnectError as e:
+                raise ConnectError(f"Could not connect to {self.pre_signed_url}: {e}") from None
+            finally:
+                metrics.retries = _last_call_retries()
+            metrics.status = 206 if self._full_content is None else 200
+            metrics.num_bytes = len(content)
+        return offset, content
+
+    def _get_once(self, start: int, end: int) -> Tuple[int, bytes]:
+        """
+        Returns:
+            Tuple[int, bytes]: offset and content - whole asset if server does not support range requests
+        """
+        if self.size != -1:
+            end = min(end, self.size - 1)
+
+        if self.throttle is not None:
+            self.throttle.acquire_request(self.pre_signed_url)
+
+        response = self._client.get(self.pre_signed_url, headers={"Range": f"bytes={start}-{end}"})
+
+        # range not satisfiable, e.g. empty asset
+        if response.status_code == 416:
+            self.size = 0
+            return start, b""
+
+        response.raise_for_status()
+        content = response.content
+        self.num_requests += 1
+        self.bytes_fetched += len(content)
+
+        if self.throttle is not None:
+            self.throttle.consume(self.pre_signed_url, len(content))
+
+        if response.status_code != 206:
+            self.size = len(content)
+            self._full_content = content
+            return 0, content
+
+        match = CONTENT_RANGE_REGEX.match(response.headers.get("Content-Range", ""))
+        if match and match.group(3) != "*":
+            self.size = int(match.group(3))
+        return start, content
+
+
+def _missing_runs(missing: List[int]) -> List[Tuple[int, int]]:
+    """coalesce sorted block indices into (first, last) runs of adjacent blocks"""
+    runs: List[Tuple[int, int]] = []
+    for idx in missing:
+        if runs and runs[-1][1] == idx - 1:
+            runs[-1] = (runs[-1][0], idx)
+        else:
+            runs.append((idx, idx))
+    return runs
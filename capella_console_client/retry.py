@@ -0,0 +1,289 @@
+"""
+unified retry engine
+
+retries are delayed by exponential backoff with full jitter (or the server's Retry-After), draw from a process wide
+retry budget and are subject to a circuit breaker per endpoint. During a backend incident the budget stops clients
+from multiplying load and open circuits fail fast until the endpoint recovers.
+"""
+
+import functools
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Callable, Optional, Any, Dict, TypeVar, Union
+from urllib.parse import urlparse
+
+import httpx
+
+from capella_console_client.config import (
+    DEFAULT_RETRY_BUDGET_PER_SECOND,
+    DEFAULT_RETRY_BUDGET_BURST,
+    DEFAULT_CIRCUIT_FAILURE_THRESHOLD,
+    DEFAULT_CIRCUIT_RESET_SECONDS,
+)
+from capella_console_client.exceptions import CircuitOpenError
+from capella_console_client.hooks import (
+    log_attempt_delay,
+    retry_if_http_status_error,
+    retry_if_transient_httpx_error,
+    retry_if_gateway_error,
+    retry_if_rate_limited,
+)
+from capella_console_client.instrumentation import get_instrumentation
+from capella_console_client.logconf import logger
+from capella_console_client.throttle import TokenBucket
+
+
+T = TypeVar("T")
+
+# retried attempts of the last RetryEngine.call of the current thread
+_last_call = threading.local()
+
+UUID_OR_ID_SEGMENT_REGEX = re.compile(
+    r"^([0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}|\d+|CAPELLA_\w+)$", re.IGNORECASE
+)
+
+
+@dataclass
+class RetryPolicy:
+    """
+    Args:
+        retry_on_exception: predicate deciding if an exception is retryable
+        retry_on_result: predicate deciding if a result (e.g. response with status 429) is retryable
+        max_attempts: maximum number of attempts (including the first one)
+        max_elapsed: maximum seconds spent retrying (None: unbounded)
+        base_delay: delay (seconds) of first retry - doubled for every subsequent retry
+        max_delay: maximum delay (seconds) between attempts
+        jitter: randomize delays (full jitter, i.e. uniform between 0 and the exponential delay)
+        respect_retry_after: honor Retry-After header of (error) responses
+    """
+
+    retry_on_exception: Callable[[BaseException], bool] = lambda exc: False
+    retry_on_result: Callable[[Any], bool] = lambda result: False
+    max_attempts: int = 5
+    max_elapsed: Optional[float] = None
+    base_delay: float = 1
+    max_delay: float = 16
+    jitter: bool = True
+    respect_retry_after: bool = True
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """delay (seconds) after `attempt` (1-based) failed"""
+        if retry_after is not None and self.respect_retry_after:
+            return min(retry_after, self.max_delay)
+
+        delay = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return random.uniform(0, delay) if self.jitter else delay
+
+
+class CircuitBreaker:
+    """
+    opens after `failure_threshold` consecutive failures, rejects calls while open and lets a single trial call
+    pass once `reset_seconds` have passed (half-open) - closes again on success
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_CIRCUIT_FAILURE_THRESHOLD,
+        reset_seconds: float = DEFAULT_CIRCUIT_RESET_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self._clock = clock
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        return self._opened_at is not None
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._opened_at is None:
+                return True
+
+            if self._trial_running or self._clock() - self._opened_at < self.reset_seconds:
+                return False
+
+            # half-open
+            self._trial_running = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_running = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._trial_running or self._failures >= self.failure_threshold:
+                self._opened_at = self._clock()
+            self._trial_running = False
+
+
+class RetryEngine:
+    """
+    Args:
+        budget_per_second: retries per second refilled into the shared retry budget
+        budget_burst: maximum retries available at once
+        failure_threshold: consecutive failures of an endpoint opening its circuit
+        reset_seconds: seconds an open circuit rejects calls before letting a trial call pass
+    """
+
+    def __init__(
+        self,
+        budget_per_second: float = DEFAULT_RETRY_BUDGET_PER_SECOND,
+        budget_burst: float = DEFAULT_RETRY_BUDGET_BURST,
+        failure_threshold: int = DEFAULT_CIRCUIT_FAILURE_THRESHOLD,
+        reset_seconds: float = DEFAULT_CIRCUIT_RESET_SECONDS,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.budget = TokenBucket(budget_per_second, budget_burst, clock=clock)
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self._sleep = sleep
+        self._clock = clock
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def breaker(self, endpoint: str) -> CircuitBreaker:
+        with self._lock:
+            if endpoint not in self._breakers:
+                self._breakers[endpoint] = CircuitBreaker(self.failure_threshold, self.reset_seconds, self._clock)
+            return self._breakers[endpoint]
+
+    def call(self, fct: Callable[..., T], policy: RetryPolicy, endpoint: str, *args, **kwargs) -> T:
+        breaker = self.breaker(endpoint)
+        started = self._clock()
+        attempt = 0
+        _last_call.retries = 0
+
+        while True:
+            if not breaker.allow():
+                raise CircuitOpenError(f"circuit open for {endpoint} - failing fast") from None
+
+            attempt += 1
+            try:
+                result = fct(*args, **kwargs)
+            except Exception as exc:
+                if not policy.retry_on_exception(exc):
+                    breaker.record_success()
+                    raise
+                breaker.record_failure()
+                delay = self._next_delay(policy, breaker, attempt, started, _retry_after(exc))
+                if delay is None:
+                    raise
+            else:
+                if not policy.retry_on_result(result):
+                    breaker.record_success()
+                    return result
+                breaker.record_failure()
+                delay = self._next_delay(policy, breaker, attempt, started, _retry_after(result))
+                if delay is None:
+                    return result
+
+            log_attempt_delay(attempt, int(delay * 1000))
+            get_instrumentation().on_retry(endpoint, attempt, delay)
+            _last_call.retries = attempt
+            self._sleep(delay)
+
+    def _next_delay(
+        self,
+        policy: RetryPolicy,
+        breaker: CircuitBreaker,
+        attempt: int,
+        started: float,
+        retry_after: Optional[float],
+    ) -> Optional[float]:
+        """delay before next attempt, None if retries are exhausted"""
+        if attempt >= policy.max_attempts or breaker.is_open:
+            return None
+
+        delay = policy.delay(attempt, retry_after)
+        if policy.max_elapsed is not None and self._clock() - started + delay > policy.max_elapsed:
+            return None
+
+        if not self.budget.try_consume(1):
+            logger.warning("retry budget exhausted - not retrying")
+            return None
+        return delay
+
+
+DEFAULT_RETRY_ENGINE = RetryEngine()
+
+# STAC search pages
+SEARCH_RETRY_POLICY = RetryPolicy(retry_on_exception=retry_if_http_status_error, base_delay=1, max_elapsed=16)
+# presigned asset downloads (whole assets or ranges)
+DOWNLOAD_RETRY_POLICY = RetryPolicy(
+    retry_on_exception=retry_if_transient_httpx_error, max_attempts=8, base_delay=2, max_delay=16
+)
+# idempotent Console API requests
+SESSION_RETRY_POLICY = RetryPolicy(
+    retry_on_exception=retry_if_gateway_error, retry_on_result=retry_if_rate_limited, max_attempts=4, base_delay=1
+)
+
+
+def with_retries(
+    policy: RetryPolicy,
+    endpoint: Union[str, Callable[..., str]],
+    engine: Optional[RetryEngine] = None,
+) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """
+    decorator retrying according to `policy` - `endpoint` (circuit breaker key) can be derived from call arguments
+    """
+
+    def decorator(fct: Callable[..., T]) -> Callable[..., T]:
+        @functools.wraps(fct)
+        def wrapper(*args, **kwargs) -> T:
+            key = endpoint(*args, **kwargs) if callable(endpoint) else endpoint
+            return (engine or DEFAULT_RETRY_ENGINE).call(fct, policy, key, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def _last_call_retries() -> int:
+    """retried attempts of the last retried call in the current thread"""
+    return getattr(_last_call, "retries", 0)
+
+
+def _retry_after(exc_or_result: Any) -> Optional[float]:
+    """seconds from Retry-After header of response attached to exception or result (if any)"""
+    response = exc_or_result if isinstance(exc_or_result, httpx.Response) else getattr(exc_or_result, "response", None)
+    if response is None or not hasattr(response, "headers"):
+        return None
+
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _endpoint_template(url: Union[str, httpx.URL]) -> str:
+    """host and path with ids replaced, e.g. api.capellaspace.com/orders/{id}/download"""
+    parsed = urlparse(str(url))
+    segments = ["{id}" if UUID_OR_ID_SEGMENT_REGEX.match(seg) else seg for seg in parsed.path.split("/") if seg]
+    return f"{parsed.netloc}/{'/'.join(segments)}"
+
+
+def _url_host(url: Union[str, httpx.URL], *args, **kwargs) -> str:
+    return urlparse(str(url)).netloc
@@ -0,0 +1,66 @@
+"""
+size based scheduling of asset downloads
+
+assets are downloaded largest first (longest transfers start first) while small assets (e.g. metadata, thumbnail,
+preview) are batched into work units that fill the gaps. Optional priority classes (e.g. ["metadata"]) are
+scheduled ahead of all other assets regardless of size.
+"""
+
+from typing import List, Optional, Tuple, TYPE_CHECKING
+
+from capella_console_client.config import SMALL_ASSET_BYTES, SMALL_ASSET_BATCH_BYTES
+
+if TYPE_CHECKING:
+    from capella_console_client.assets import DownloadRequest
+
+
+def _schedule(
+    download_requests: List["DownloadRequest"],
+    asset_priority: Optional[List[str]] = None,
+) -> List[List["DownloadRequest"]]:
+    """
+    order `download_requests` into work units, each unit is downloaded sequentially by a single worker
+
+    units are ordered by priority class (position of asset key in `asset_priority`, unlisted assets last) and
+    descending size within each class (unknown sizes first). Consecutive small assets of a class are batched.
+    """
+    ranked = sorted(download_requests, key=lambda dl_request: _rank(dl_request, asset_priority))
+
+    units: List[List["DownloadRequest"]] = []
+    batch: List["DownloadRequest"] = []
+    batch_bytes = 0
+    batch_class = None
+
+    for dl_request in ranked:
+        cur_class = _priority_class(dl_request, asset_priority)
+        if batch and (cur_class != batch_class or batch_bytes + max(dl_request.size, 0) > SMALL_ASSET_BATCH_BYTES):
+            units.append(batch)
+            batch, batch_bytes = [], 0
+
+        if not _is_small(dl_request):
+            units.append([dl_request])
+            continue
+
+        batch.append(dl_request)
+        batch_bytes += dl_request.size
+        batch_class = cur_class
+
+    if batch:
+        units.append(batch)
+
+    return units
+
+
+def _rank(dl_request: "DownloadRequest", asset_priority: Optional[List[str]]) -> Tuple[int, float]:
+    size = float("inf") if dl_request.size == -1 else dl_request.size
+    return (_priority_class(dl_request, asset_priority), -size)
+
+
+def _priority_class(dl_request: "DownloadRequest", asset_priority: Optional[List[str]]) -> int:
+    if asset_priority and dl_request.asset_key in asset_priority:
+        return asset_priority.index(dl_request.asset_key)
+    return len(asset_priority or [])
+
+
+def _is_small(dl_request: "DownloadRequest") -> bool:
+    return dl_request.size != -1 and dl_request.size < SMALL_ASSET_BYTES
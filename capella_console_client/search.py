@@ -1,10 +1,9 @@
 from copy import deepcopy
-from typing import Any, Dict, Tuple, DefaultDict, Optional, List
+from typing import Any, Dict, Tuple, DefaultDict, Optional, List, Iterator
 from collections import defaultdict
 from urllib.parse import urlparse
 from dataclasses import dataclass, field
 
-from retrying import retry  # type: ignore
 
 from capella_console_client.logconf import logger
 from capella_console_client.session import CapellaConsoleSession
@@ -18,7 +17,7 @@ from capella_console_client.config import (
     DEFAULT_PAGE_SIZE,
     DEFAULT_MAX_FEATURE_COUNT,
 )
-from capella_console_client.hooks import retry_if_http_status_error, log_attempt_delay
+from capella_console_client.retry import with_retries, SEARCH_RETRY_POLICY, _endpoint_template
 
 
 @dataclass
@@ -125,6 +124,21 @@ class StacSearch:
         return sorts
 
     def fetch_all(self) -> SearchResult:
+        search_result = SearchResult(request_body=self.payload)
+        for page_data in self.iter_pages():
+            search_result.add(page_data)
+
+        len_features = len(search_result)
+        if not len_features:
+            logger.info("found no STAC items matching your query")
+        else:
+            multiple_suffix = "s" if len_features > 1 else ""
+            logger.info(f"found {len(search_result)} STAC item{multiple_suffix}")
+
+        return search_result
+
+    def iter_pages(self) -> Iterator[Dict[str, Any]]:
+        """yield result pages as they are fetched - features of last page truncated to requested limit"""
         logger.info(f"searching catalog with payload {self.payload}")
 
         requested_limit = self.payload.get("limit", DEFAULT_MAX_FEATURE_COUNT)
@@ -136,16 +150,22 @@ class StacSearch:
         self.payload["limit"] = min(DEFAULT_PAGE_SIZE, self.payload["limit"])
 
         page_cnt = 1
-        search_result = SearchResult(request_body=self.payload)
+        num_fetched = 0
         next_href = None
 
         while True:
-            _log_page_query(page_cnt, len(search_result), self.payload["limit"])
+            _log_page_query(page_cnt, num_fetched, self.payload["limit"])
             page_data = _page_search(self.session, self.payload, next_href)
             number_matched = page_data["numberMatched"]
-            search_result.add(page_data)
 
-            limit_reached = len(search_result) >= requested_limit or len(search_result) >= number_matched
+            # truncate to limit
+            remaining = requested_limit - num_fetched
+            if len(page_data["features"]) > remaining:
+                page_data = {**page_data, "features": page_data["features"][:remaining]}
+            num_fetched += len(page_data["features"])
+            yield page_data
+
+            limit_reached = num_fetched >= requested_limit or num_fetched >= number_matched
             if limit_reached:
                 break
 
@@ -160,19 +180,6 @@ class StacSearch:
             page_cnt += 1
             self.payload["page"] = page_cnt
 
-        # truncate to limit
-        len_features = len(search_result)
-        if len_features > requested_limit:
-            search_result._features = search_result._features[:requested_limit]
-
-        if not len_features:
-            logger.info("found no STAC items matching your query")
-        else:
-            multiple_suffix = "s" if len_features > 1 else ""
-            logger.info(f"found {len(search_result)} STAC item{multiple_suffix}")
-
-        return search_result
-
 
 def _log_page_query(page_cnt: int, len_feat: int, limit: int):
     if page_cnt != 1:
@@ -189,13 +196,10 @@ def _get_next_page_href(page_data: Dict[str, Any]) -> Optional[str]:
     return next_href
 
 
-@retry(
-    retry_on_exception=retry_if_http_status_error,
-    wait_func=log_attempt_delay,
-    wait_exponential_multiplier=1000,
-    stop_max_delay=16000,
-)
-def _page_search(session: CapellaConsoleSession, payload: Dict[str, Any], next_href: str = None) -> Dict[str, Any]:
+@with_retries(SEARCH_RETRY_POLICY, endpoint=lambda session, *args, **kwargs: _endpoint_template(session.search_url))
+def _page_search(
+    session: CapellaConsoleSession, payload: Dict[str, Any], next_href: Optional[str] = None
+) -> Dict[str, Any]:
 
     if next_href:
         # STAC API to return normalized asset hrefs, not api gateway - fixing this here ...
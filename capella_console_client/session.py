@@ -1,14 +1,39 @@
 import base64
+import json
+import threading
+import time
+from contextlib import nullcontext
+from dataclasses import dataclass, replace
 from enum import Enum
 from getpass import getpass
 
-from typing import Optional, Tuple
+from typing import Optional, Tuple, Dict, Any
 
 import httpx
 
-from capella_console_client.config import DEFAULT_TIMEOUT, CONSOLE_API_URL
+from capella_console_client.config import (
+    DEFAULT_TIMEOUT,
+    CONSOLE_API_URL,
+    DEFAULT_TOKEN_REFRESH_MARGIN,
+    DEFAULT_MAX_CONNECTIONS,
+)
 from capella_console_client.hooks import log_on_4xx_5xx, translate_error_to_exception
 from capella_console_client.logconf import logger
+from capella_console_client.retry import (
+    DEFAULT_RETRY_ENGINE,
+    SESSION_RETRY_POLICY,
+    RetryEngine,
+    _endpoint_template,
+    _last_call_retries,
+)
+from capella_console_client.credentials import (
+    CredentialCache,
+    CachedCredentials,
+    _credential_key,
+    _hash_password,
+    _password_matches,
+)
+from capella_console_client.instrumentation import Instrumentation, RequestMetrics, _measure
 from capella_console_client.exceptions import (
     CapellaConsoleClientError,
     AuthenticationError,
@@ -18,6 +43,22 @@ from capella_console_client.exceptions import (
 from capella_console_client.version import __version__
 
 
+# only requests without side effects are retried
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+# requests issuing tokens - never refreshed before/ upon failure
+TOKEN_PATHS = {"/token", "/token/refresh"}
+
+
+@dataclass(frozen=True)
+class Credentials:
+    """immutable snapshot of session credentials - swapped as a whole, never mutated"""
+
+    authorization: Optional[str] = None
+    refresh_token: Optional[str] = None
+    expires_at: Optional[float] = None
+
+
 class AuthMethod(Enum):
     BASIC = 1  # email/ password
     TOKEN = 2  # JWT token
@@ -27,6 +68,15 @@ class CapellaConsoleSession(httpx.Client):
     def __init__(self, *args, **kwargs):
         verbose = kwargs.pop("verbose", False)
         search_url = kwargs.pop("search_url", None)
+        retry_engine = kwargs.pop("retry_engine", None)
+        instrumentation = kwargs.pop("instrumentation", None)
+        token_refresh_margin = kwargs.pop("token_refresh_margin", DEFAULT_TOKEN_REFRESH_MARGIN)
+        background_token_refresh = kwargs.pop("background_token_refresh", False)
+        max_connections = kwargs.pop("max_connections", DEFAULT_MAX_CONNECTIONS)
+        max_keepalive_connections = kwargs.pop("max_keepalive_connections", max_connections)
+        kwargs.setdefault(
+            "limits", httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_keepalive_connections)
+        )
         event_hooks = [translate_error_to_exception]
         if verbose:
             event_hooks.insert(0, log_on_4xx_5xx)
@@ -41,11 +91,31 @@ class CapellaConsoleSession(httpx.Client):
             },
             **kwargs,
         )
-        self.customer_id = None
-        self.organization_id = None
+        # customer_id, organization_id and email - see _user_info_field
+        self._user_info: Dict[str, Any] = {}
+        self.lazy_user_info = False
+        self._user_info_lock = threading.Lock()
 
         self.search_url = search_url if search_url is not None else f"{self.base_url}/catalog/search"
-        self._refresh_token = None
+        self._credentials = Credentials()
+        self.retry_engine: RetryEngine = retry_engine or DEFAULT_RETRY_ENGINE
+        # None: process wide instrumentation, see capella_console_client.instrumentation.set_instrumentation
+        self.instrumentation: Optional[Instrumentation] = instrumentation
+
+        # proactive token refresh, see _refresh_if_expiring
+        self.token_refresh_margin = token_refresh_margin
+        self.background_token_refresh = background_token_refresh
+        # guards credential swaps and makes token refreshes single-flight
+        self._refresh_lock = threading.RLock()
+        self._refresh_timer: Optional[threading.Timer] = None
+
+        self.credential_cache: Optional[CredentialCache] = None
+        self._credential_key: Optional[str] = None
+        self._password_hash: Optional[str] = None
+
+        # lazy authentication, see defer_authentication
+        self._pending_auth: Optional[Dict[str, Any]] = None
+        self._authenticating: Optional[int] = None
 
     def authenticate(
         self,
@@ -53,10 +123,30 @@ class CapellaConsoleSession(httpx.Client):
         password: Optional[str] = None,
         token: Optional[str] = None,
         no_token_check: bool = False,
+        credential_cache: Optional[CredentialCache] = None,
+        lazy_user_info: bool = False,
+        prompt: bool = True,
     ) -> None:
+        """
+        Args:
+            lazy_user_info: defer GET /user until customer_id, organization_id or email are accessed - NOTE: tokens
+                are not validated by GET /user in that case
+            prompt: prompt for missing email/ password - raises AuthenticationError instead if False
+        """
+        self.lazy_user_info = lazy_user_info
+        if credential_cache is not None:
+            self.credential_cache = credential_cache
+            self._credential_key = _credential_key(str(self.base_url), email, token if not email else None)
+            restored = self._restore_credentials(token if not email else None, password if email else None)
+            if restored and self._complete_user_info():
+                logger.info(f"authenticated from {credential_cache.path}")
+                return
+
         try:
             basic_auth_provided = bool(email) and bool(password)
             if not basic_auth_provided and not bool(token):
+                if not prompt:
+                    raise AuthenticationError(f"Unable to authenticate with {self.base_url} - no credentials provided")
                 email, password = self._prompt_user_creds(email, password)  # type: ignore
 
             auth_method = self._get_auth_method(email, password, token)
@@ -74,12 +164,42 @@ class CapellaConsoleSession(httpx.Client):
                 f"Unable to authenticate with {self.base_url} ({auth_method}) - {message}"
             ) from None
 
+        if self.credential_cache is not None:
+            if self._credential_key is None:
+                # prompted for email
+                self._credential_key = _credential_key(str(self.base_url), email)
+            if auth_method == AuthMethod.BASIC:
+                self._password_hash = _hash_password(password)  # type: ignore
+            self._persist_credentials()
+
         suffix = f"({self.base_url})" if self.base_url != CONSOLE_API_URL else ""
-        if auth_method == AuthMethod.TOKEN and no_token_check:
+        if "email" not in self._user_info:
             logger.info(f"successfully authenticated {suffix}")
         else:
             logger.info(f"successfully authenticated as {self.email} {suffix}")
 
+    def defer_authentication(self, **auth_kwargs) -> None:
+        """authenticate (see :py:meth:`authenticate` for `auth_kwargs`) upon first request"""
+        self._pending_auth = auth_kwargs
+        self.lazy_user_info = True
+
+    def _ensure_authenticated(self) -> None:
+        """perform deferred authentication - concurrent callers wait for a single authentication"""
+        if self._pending_auth is None or self._authenticating == threading.get_ident():
+            return
+
+        with self._refresh_lock:
+            # authenticated by another thread while waiting for lock
+            if self._pending_auth is None:
+                return
+
+            self._authenticating = threading.get_ident()
+            try:
+                self.authenticate(**self._pending_auth, lazy_user_info=True)
+            finally:
+                self._authenticating = None
+            self._pending_auth = None
+
     def _prompt_user_creds(self, email: str, password: str) -> Tuple[str, str]:
         """user credentials on console.capellaspace.com"""
         if not email:
@@ -114,16 +234,45 @@ class CapellaConsoleSession(httpx.Client):
         resp.raise_for_status()
         response_body = resp.json()
 
-        self._set_auth_header(response_body["accessToken"])
-        self._refresh_token = response_body["refreshToken"]
-        self._cache_user_info()
+        self._set_auth_header(response_body["accessToken"], refresh_token=response_body["refreshToken"])
+        if not self.lazy_user_info:
+            self._cache_user_info()
 
-    def _set_auth_header(self, token: str):
+    def _set_auth_header(self, token: str, refresh_token: Optional[str] = None):
         token = token.strip()
         if not token.startswith("Bearer"):
             token = f"Bearer {token}"
 
-        self.headers["Authorization"] = token
+        changes = {"authorization": token, "expires_at": _jwt_expiry(token)}
+        if refresh_token is not None:
+            changes["refresh_token"] = refresh_token
+        self._swap_credentials(**changes)
+        self._schedule_background_refresh()
+
+    def _swap_credentials(self, **changes) -> None:
+        """
+        atomically replace credentials and client headers
+
+        requests being built concurrently copy either the old or the new headers, never a partially updated one
+        """
+        with self._refresh_lock:
+            self._credentials = replace(self._credentials, **changes)
+            if self._credentials.authorization is not None:
+                headers = self.headers.copy()
+                headers["Authorization"] = self._credentials.authorization
+                self.headers = headers
+
+    @property
+    def _refresh_token(self) -> Optional[str]:
+        return self._credentials.refresh_token
+
+    @_refresh_token.setter
+    def _refresh_token(self, refresh_token: Optional[str]) -> None:
+        self._swap_credentials(refresh_token=refresh_token)
+
+    @property
+    def _token_expires_at(self) -> Optional[float]:
+        return self._credentials.expires_at
 
     def _cache_user_info(self):
         """cache customer_id and organization_id - serves as test for successful auth"""
@@ -131,39 +280,255 @@ class CapellaConsoleSession(httpx.Client):
         resp.raise_for_status()
 
         con = resp.json()
-        self.customer_id = con["id"]
-        self.organization_id = con["organizationId"]
-        self.email = con["email"]
+        self._user_info = {"customer_id": con["id"], "organization_id": con["organizationId"], "email": con["email"]}
 
     def _token_auth_check(self, token: str, no_token_check: bool):
         self._set_auth_header(token)
-        if not no_token_check:
+        if not no_token_check and not self.lazy_user_info:
             self._cache_user_info()
 
+    def _user_info_field(self, name: str) -> Optional[str]:
+        """user info `name` - looked up on first access if lazy_user_info"""
+        if name not in self._user_info and self.lazy_user_info:
+            self._ensure_authenticated()
+            with self._user_info_lock:
+                if name not in self._user_info and self._credentials.authorization is not None:
+                    self._cache_user_info()
+                    self._persist_credentials()
+        return self._user_info.get(name)
+
+    @property
+    def customer_id(self) -> Optional[str]:
+        return self._user_info_field("customer_id")
+
+    @customer_id.setter
+    def customer_id(self, customer_id: Optional[str]) -> None:
+        self._user_info["customer_id"] = customer_id
+
+    @property
+    def organization_id(self) -> Optional[str]:
+        return self._user_info_field("organization_id")
+
+    @organization_id.setter
+    def organization_id(self, organization_id: Optional[str]) -> None:
+        self._user_info["organization_id"] = organization_id
+
+    @property
+    def email(self) -> Optional[str]:
+        return self._user_info_field("email")
+
+    @email.setter
+    def email(self, email: Optional[str]) -> None:
+        self._user_info["email"] = email
+
     def send(self, *fct_args, **kwargs):
-        """wrap httpx.Client.send for auto token_refresh"""
-        try:
-            ret = super().send(*fct_args, **kwargs)
-        except AuthenticationError as e:
-            # safeguard in case AuthenticationError get's improperly re-used
-            if e.code != INVALID_TOKEN_ERROR_CODE:
-                raise e
+        """wrap httpx.Client.send for proactive/ auto token_refresh, retries and instrumentation"""
+        orig_request = fct_args[0]
+        metrics = RequestMetrics("api", orig_request.method, _endpoint_template(orig_request.url))
+        is_token_request = orig_request.url.path in TOKEN_PATHS
 
-            self.perform_token_refresh()
+        with _measure(metrics, self.instrumentation):
+            if not is_token_request:
+                self._ensure_authenticated()
+                if "authorization" not in orig_request.headers and self._credentials.authorization is not None:
+                    orig_request.headers["authorization"] = self._credentials.authorization
 
-            # retry request
-            orig_request = fct_args[0]
-            orig_request.headers["authorization"] = self.headers["authorization"]
-            ret = super().send(*fct_args, **kwargs)
+            if not is_token_request and self._refresh_if_expiring():
+                metrics.token_refreshes += 1
+                orig_request.headers["authorization"] = self._credentials.authorization
+
+            sent_authorization = orig_request.headers.get("authorization")
+            try:
+                ret = self._send_with_retries(metrics, *fct_args, **kwargs)
+            except AuthenticationError as e:
+                # safeguard in case AuthenticationError get's improperly re-used
+                if e.code != INVALID_TOKEN_ERROR_CODE or is_token_request:
+                    raise e
+
+                if self._refresh_unless_refreshed(sent_authorization):
+                    metrics.token_refreshes += 1
+
+                # retry request
+                orig_request.headers["authorization"] = self._credentials.authorization
+                ret = self._send_with_retries(metrics, *fct_args, **kwargs)
+
+            metrics.status = ret.status_code
+            metrics.num_bytes = ret.num_bytes_downloaded
         return ret
 
+    def _send_with_retries(self, metrics: RequestMetrics, *fct_args, **kwargs):
+        """retry idempotent (non streaming) requests upon gateway errors and rate limiting"""
+        request = fct_args[0]
+        if request.method not in IDEMPOTENT_METHODS or kwargs.get("stream"):
+            return super().send(*fct_args, **kwargs)
+
+        try:
+            return self.retry_engine.call(
+                super().send,
+                SESSION_RETRY_POLICY,
+                f"{request.method} {metrics.endpoint}",
+                *fct_args,
+                **kwargs,
+            )
+        finally:
+            metrics.retries += _last_call_retries()
+
     def perform_token_refresh(self):
-        if not self._refresh_token:
-            raise NoRefreshTokenError("No refresh token found") from None
+        credential_cache_lock = self.credential_cache.lock() if self.credential_cache is not None else nullcontext()
+        with self._refresh_lock, credential_cache_lock:
+            # another process refreshed already
+            if self._adopt_cached_credentials():
+                logger.info("adopted access token refreshed by another process")
+                return
 
-        resp = self.post("/token/refresh", json={"refreshToken": self._refresh_token})
-        con = resp.json()
-        self._set_auth_header(con["accessToken"])
-        if con["refreshToken"] != self._refresh_token:
-            self._refresh_token = con["refreshToken"]
+            if not self._refresh_token:
+                raise NoRefreshTokenError("No refresh token found") from None
+
+            resp = self.post("/token/refresh", json={"refreshToken": self._refresh_token})
+            con = resp.json()
+            self._set_auth_header(con["accessToken"], refresh_token=con["refreshToken"])
+            self._persist_credentials()
         logger.info("successfully refreshed access token")
+
+    def _restore_credentials(self, token: Optional[str] = None, password: Optional[str] = None) -> bool:
+        """
+        restore credentials and user info from credential cache - `token` takes precedence over cached token
+
+        Args:
+            token: API token
+            password: password of cached user - cache is bypassed if it does not match the one of the cached login
+        """
+        cached = self._load_cached_credentials()
+        if cached is None:
+            return False
+
+        if password and not _password_matches(password, cached.password_hash):
+            logger.info("password differs from cached login ... authenticating")
+            return False
+
+        expired = cached.expires_at is not None and cached.expires_at <= time.time()
+        if token is None and expired and not cached.refresh_token:
+            return False
+
+        self._set_auth_header(token or cached.access_token, refresh_token=cached.refresh_token)
+        self._password_hash = cached.password_hash
+        for name in ("customer_id", "organization_id", "email"):
+            if getattr(cached, name) is not None:
+                self._user_info[name] = getattr(cached, name)
+        return True
+
+    def _complete_user_info(self) -> bool:
+        """look up user info missing in restored credentials (e.g. cached by lazy session) unless lazy_user_info"""
+        if self.lazy_user_info or all(name in self._user_info for name in ("customer_id", "organization_id")):
+            return True
+
+        try:
+            self._cache_user_info()
+        except httpx.HTTPStatusError:
+            # restored credentials not valid (anymore) - authenticate from scratch
+            return False
+
+        self._persist_credentials()
+        return True
+
+    def _adopt_cached_credentials(self) -> bool:
+        """adopt cached access token if it differs from the current one and is not about to expire"""
+        cached = self._load_cached_credentials()
+        if cached is None or f"Bearer {cached.access_token}" == self._credentials.authorization:
+            return False
+
+        expires_at = cached.expires_at
+        if expires_at is not None and time.time() >= expires_at - self.token_refresh_margin:
+            return False
+
+        self._set_auth_header(cached.access_token, refresh_token=cached.refresh_token)
+        return True
+
+    def _load_cached_credentials(self) -> Optional[CachedCredentials]:
+        if self.credential_cache is None or self._credential_key is None:
+            return None
+        return self.credential_cache.load(self._credential_key)
+
+    def _persist_credentials(self) -> None:
+        if self.credential_cache is None or self._credential_key is None or not self._credentials.authorization:
+            return
+
+        self.credential_cache.store(
+            self._credential_key,
+            CachedCredentials(
+                access_token=self._credentials.authorization.split(" ")[-1],
+                refresh_token=self._credentials.refresh_token,
+                expires_at=self._credentials.expires_at,
+                customer_id=self._user_info.get("customer_id"),
+                organization_id=self._user_info.get("organization_id"),
+                email=self._user_info.get("email"),
+                password_hash=self._password_hash,
+            ),
+        )
+
+    def _token_expiring(self) -> bool:
+        return self._token_expires_at is not None and time.time() >= self._token_expires_at - self.token_refresh_margin
+
+    def _refresh_if_expiring(self) -> bool:
+        """
+        refresh access token ahead of its expiry - concurrent callers wait for a single refresh
+
+        Returns:
+            bool: True if this call refreshed the access token
+        """
+        if not self._refresh_token or not self._token_expiring():
+            return False
+
+        with self._refresh_lock:
+            # refreshed by another thread while waiting for lock
+            if not self._token_expiring():
+                return False
+            self.perform_token_refresh()
+        return True
+
+    def _refresh_unless_refreshed(self, sent_authorization: Optional[str]) -> bool:
+        """
+        refresh access token rejected as invalid unless another thread refreshed it since `sent_authorization` was sent
+
+        Returns:
+            bool: True if this call refreshed the access token
+        """
+        with self._refresh_lock:
+            if sent_authorization is not None and self._credentials.authorization != sent_authorization:
+                return False
+            self.perform_token_refresh()
+        return True
+
+    def _schedule_background_refresh(self) -> None:
+        if self._refresh_timer is not None:
+            self._refresh_timer.cancel()
+            self._refresh_timer = None
+
+        if not self.background_token_refresh or self._token_expires_at is None:
+            return
+
+        delay = max(0.0, self._token_expires_at - self.token_refresh_margin - time.time())
+        self._refresh_timer = threading.Timer(delay, self._background_refresh)
+        self._refresh_timer.daemon = True
+        self._refresh_timer.start()
+
+    def _background_refresh(self) -> None:
+        try:
+            self._refresh_if_expiring()
+        except Exception as e:
+            logger.warning(f"background token refresh failed ({e}) ... refreshing on next request")
+
+    def close(self) -> None:
+        if self._refresh_timer is not None:
+            self._refresh_timer.cancel()
+        super().close()
+
+
+def _jwt_expiry(token: str) -> Optional[float]:
+    """`exp` claim (epoch seconds) of JWT `token` (may be prefixed by Bearer) - None if not a decodable JWT"""
+    try:
+        payload = token.split(" ")[-1].split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return float(claims["exp"])
+    except (IndexError, ValueError, KeyError, TypeError):
+        return None
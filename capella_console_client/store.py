@@ -0,0 +1,141 @@
+"""
+content-addressed local product store
+
+assets are keyed by STAC id, asset key and ETag (or size if no ETag is available). Downloading an asset that is
+already held in the store into a different directory hardlinks (or reflinks/ copies) it instead of transferring it again.
+"""
+
+import hashlib
+import os
+import shutil
+import sqlite3
+from contextlib import closing
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Union
+
+from capella_console_client.logconf import logger
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS assets (
+    key TEXT PRIMARY KEY,
+    stac_id TEXT NOT NULL,
+    asset_key TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    etag TEXT,
+    blob_path TEXT NOT NULL,
+    created_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS assets_stac_id ON assets (stac_id);
+"""
+
+
+class ProductStore:
+    """
+    Args:
+        root: store directory - created if it does not exist
+    """
+
+    INDEX_FILE_NAME = "index.sqlite"
+    BLOBS_DIR_NAME = "blobs"
+
+    def __init__(self, root: Union[Path, str]):
+        self.root = Path(root)
+        self.blobs = self.root / self.BLOBS_DIR_NAME
+        self.blobs.mkdir(parents=True, exist_ok=True)
+        self.index_path = self.root / self.INDEX_FILE_NAME
+
+        with closing(self._connect()) as con, con:
+            con.executescript(_SCHEMA)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.root})"
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(str(self.index_path), timeout=30)
+
+    @staticmethod
+    def _key(stac_id: str, asset_key: str, size: int, etag: Optional[str]) -> str:
+        version = etag.strip('"') if etag else f"size:{size}"
+        return hashlib.sha256(f"{stac_id}/{asset_key}/{version}".encode()).hexdigest()
+
+    def lookup(self, stac_id: str, asset_key: str, size: int, etag: Optional[str] = None) -> Optional[Path]:
+        """return path of blob held for asset if present"""
+        key = self._key(stac_id, asset_key, size, etag)
+        with closing(self._connect()) as con:
+            row = con.execute("SELECT blob_path, size FROM assets WHERE key = ?", (key,)).fetchone()
+
+        if row is None:
+            return None
+
+        blob_path = Path(row[0])
+        if not blob_path.exists() or (row[1] >= 0 and blob_path.stat().st_size != row[1]):
+            self._forget(key)
+            return None
+        return blob_path
+
+    def _forget(self, key: str) -> None:
+        with closing(self._connect()) as con, con:
+            con.execute("DELETE FROM assets WHERE key = ?", (key,))
+
+    def add(self, local_path: Path, stac_id: str, asset_key: str, size: int, etag: Optional[str] = None) -> Path:
+        """add downloaded `local_path` to store"""
+        key = self._key(stac_id, asset_key, size, etag)
+        blob_path = self.blobs / key[:2] / key / local_path.name
+        blob_path.parent.mkdir(parents=True, exist_ok=True)
+
+        if not blob_path.exists():
+            _link_or_copy(local_path, blob_path)
+
+        with closing(self._connect()) as con, con:
+            con.execute(
+                "INSERT OR REPLACE INTO assets VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, stac_id, asset_key, size, etag, str(blob_path), datetime.utcnow().isoformat()),
+            )
+        return blob_path
+
+    def materialize(self, blob_path: Path, local_path: Path) -> Path:
+        """place stored `blob_path` at `local_path`"""
+        local_path.parent.mkdir(parents=True, exist_ok=True)
+        if local_path.exists():
+            local_path.unlink()
+        _link_or_copy(blob_path, local_path)
+        logger.info(f"linked {local_path} from store {self.root}")
+        return local_path
+
+
+def _link_or_copy(src: Path, dst: Path) -> None:
+    try:
+        os.link(src, dst)
+        return
+    except OSError:
+        pass
+
+    if _reflink(src, dst):
+        return
+
+    shutil.copyfile(src, dst)
+
+
+def _reflink(src: Path, dst: Path) -> bool:
+    try:
+        import fcntl
+    except ImportError:
+        return False
+
+    FICLONE = 0x40049409
+    try:
+        with open(src, "rb") as s, open(dst, "wb") as d:
+            fcntl.ioctl(d.fileno(), FICLONE, s.fileno())
+    except OSError:
+        if dst.exists():
+            dst.unlink()
+        return False
+    return True
+
+
+def _as_store(store: Union["ProductStore", Path, str, None]) -> Optional["ProductStore"]:
+    if store is None or isinstance(store, ProductStore):
+        return store
+    return ProductStore(store)
@@ -0,0 +1,166 @@
+"""
+streaming asset downloads without local files
+
+asset bytes can be consumed as an iterator of chunks, a read-only file-like object or piped into a sink, e.g. a
+hashing function, an object store (multipart) uploader or an in-memory buffer.
+"""
+
+import hashlib
+import io
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, Optional, Union, Callable, Any, IO, List, Dict
+
+import httpx
+
+from capella_console_client.exceptions import ConnectError
+from capella_console_client.integrity import _verify
+from capella_console_client.throttle import DownloadThrottle
+from capella_console_client.assets import (
+    _download_chunk_size,
+    _get_filename,
+    _derive_stac_id,
+    _select_assets,
+)
+
+
+Sink = Union[Callable[[bytes], Any], IO[bytes]]
+# (stac_id, asset_key, file_name) -> sink
+SinkFactory = Callable[[str, str, str], Sink]
+
+
+def _iter_asset(
+    pre_signed_url: str,
+    chunk_size: Optional[int] = None,
+    throttle: Optional[DownloadThrottle] = None,
+) -> Iterator[bytes]:
+    if throttle is not None:
+        throttle.acquire_request(pre_signed_url)
+
+    try:
+        with httpx.stream("GET", pre_signed_url) as response:
+            response.raise_for_status()
+            for chunk in response.iter_bytes(chunk_size=chunk_size or _download_chunk_size()):
+                if throttle is not None:
+                    throttle.consume(pre_signed_url, len(chunk))
+                yield chunk
+    except httpx.ConnectError as e:
+        raise ConnectError(f"Could not connect to {pre_signed_url}: {e}") from None
+
+
+class AssetReader(io.RawIOBase):
+    """
+    read-only, forward-only file-like object streaming a presigned asset
+
+    Args:
+        pre_signed_url: presigned asset url
+        chunk_size: bytes per network read
+        throttle: bandwidth and request rate limits, see :py:class:`DownloadThrottle`
+    """
+
+    def __init__(
+        self,
+        pre_signed_url: str,
+        chunk_size: Optional[int] = None,
+        throttle: Optional[DownloadThrottle] = None,
+    ):
+        super().__init__()
+        self.pre_signed_url = pre_signed_url
+        self._chunks = _iter_asset(pre_signed_url, chunk_size, throttle)
+        self._view = memoryview(b"")
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:  # type: ignore
+        if not self._view:
+            self._view = memoryview(next(self._chunks, b""))
+
+        num_bytes = min(len(buffer), len(self._view))
+        buffer[:num_bytes] = self._view[:num_bytes]
+        self._view = self._view[num_bytes:]
+        self._position += num_bytes
+        return num_bytes
+
+    def tell(self) -> int:
+        return self._position
+
+    def close(self) -> None:
+        if not self.closed:
+            # closes underlying response
+            self._chunks.close()  # type: ignore
+        super().close()
+
+
+def _stream_to_sink(
+    pre_signed_url: str,
+    sink: Sink,
+    verify: bool = False,
+    chunk_size: Optional[int] = None,
+    throttle: Optional[DownloadThrottle] = None,
+) -> int:
+    """
+    Returns:
+        int: number of bytes passed to `sink`
+    """
+    write = sink.write if hasattr(sink, "write") else sink  # type: ignore
+    hasher = hashlib.md5() if verify else None
+    num_bytes = 0
+
+    if throttle is not None:
+        throttle.acquire_request(pre_signed_url)
+
+    try:
+        with httpx.stream("GET", pre_signed_url) as response:
+            response.raise_for_status()
+            for chunk in response.iter_bytes(chunk_size=chunk_size or _download_chunk_size()):
+                write(chunk)
+                num_bytes += len(chunk)
+
+                if hasher is not None:
+                    hasher.update(chunk)
+
+                if throttle is not None:
+                    throttle.consume(pre_signed_url, len(chunk))
+
+            headers = response.headers
+    except httpx.ConnectError as e:
+        raise ConnectError(f"Could not connect to {pre_signed_url}: {e}") from None
+
+    if hasher is not None:
+        expected_size = int(headers.get("Content-Length", -1))
+        _verify(_get_filename(pre_signed_url), num_bytes, hasher.hexdigest(), expected_size, headers.get("ETag"))
+
+    return num_bytes
+
+
+def _stream_products_to(
+    assets_presigned: List[Dict[str, Any]],
+    sink_factory: SinkFactory,
+    include: Optional[Union[List[str], str]] = None,
+    exclude: Optional[Union[List[str], str]] = None,
+    verify: bool = False,
+    max_workers: int = 1,
+    throttle: Optional[DownloadThrottle] = None,
+) -> Dict[str, Dict[str, int]]:
+    streams = []
+    for cur_assets in assets_presigned:
+        stac_id = _derive_stac_id(cur_assets)
+        for asset_key, asset in _select_assets(cur_assets, include, exclude).items():
+            streams.append((stac_id, asset_key, asset["href"]))
+
+    def _stream(stac_id: str, asset_key: str, href: str) -> int:
+        sink = sink_factory(stac_id, asset_key, _get_filename(href))
+        return _stream_to_sink(href, sink, verify=verify, throttle=throttle)
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        futures = [
+            (stac_id, asset_key, executor.submit(_stream, stac_id, asset_key, href))
+            for stac_id, asset_key, href in streams
+        ]
+
+    num_bytes_by_stac_id: Dict[str, Dict[str, int]] = defaultdict(dict)
+    for stac_id, asset_key, fut in futures:
+        num_bytes_by_stac_id[stac_id][asset_key] = fut.result()
+    return dict(num_bytes_by_stac_id)
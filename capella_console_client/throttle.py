@@ -0,0 +1,173 @@
+"""
+bandwidth shaping and request rate limiting for asset downloads
+
+limits can be configured per call (see :py:class:`DownloadThrottle`) or process wide via environment variables:
+
+    CAPELLA_MAX_BYTES_PER_SECOND: total download bandwidth (bytes/s)
+    CAPELLA_MAX_BYTES_PER_SECOND_PER_HOST: download bandwidth per host (bytes/s)
+    CAPELLA_MAX_REQUESTS_PER_SECOND: download requests per second
+"""
+
+import os
+import threading
+import time
+from typing import Optional, Callable, Dict
+from urllib.parse import urlparse
+
+from capella_console_client.config import (
+    MAX_BYTES_PER_SECOND_ENV,
+    MAX_BYTES_PER_SECOND_PER_HOST_ENV,
+    MAX_REQUESTS_PER_SECOND_ENV,
+)
+
+
+class TokenBucket:
+    """
+    thread-safe token bucket - `consume` blocks until the requested amount is available
+
+    Args:
+        rate: tokens refilled per second
+        capacity: maximum burst, defaults to `rate` (1 second worth of tokens)
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        if rate <= 0:
+            raise ValueError(f"rate must be > 0 (got {rate})")
+
+        self.rate = float(rate)
+        self.capacity = float(capacity) if capacity is not None else self.rate
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.capacity
+        self._last = clock()
+        self._lock = threading.Lock()
+
+    def consume(self, amount: float = 1) -> float:
+        """
+        take `amount` tokens, amounts exceeding the available tokens are borrowed and paid back by waiting
+
+        Returns:
+            float: seconds waited
+        """
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            self._tokens -= amount
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+    def try_consume(self, amount: float = 1) -> bool:
+        """take `amount` tokens if available without waiting"""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            if self._tokens < amount:
+                return False
+            self._tokens -= amount
+            return True
+
+
+class DownloadThrottle:
+    """
+    Args:
+        max_bytes_per_second: total download bandwidth across all hosts and threads
+        max_bytes_per_second_per_host: download bandwidth per host
+        max_requests_per_second: maximum number of download requests per second
+    """
+
+    def __init__(
+        self,
+        max_bytes_per_second: Optional[float] = None,
+        max_bytes_per_second_per_host: Optional[float] = None,
+        max_requests_per_second: Optional[float] = None,
+    ):
+        self.max_bytes_per_second = max_bytes_per_second
+        self.max_bytes_per_second_per_host = max_bytes_per_second_per_host
+        self.max_requests_per_second = max_requests_per_second
+
+        self._bandwidth = TokenBucket(max_bytes_per_second) if max_bytes_per_second else None
+        self._requests = TokenBucket(max_requests_per_second) if max_requests_per_second else None
+        self._bandwidth_by_host: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(max_bytes_per_second={self.max_bytes_per_second}, "
+            f"max_bytes_per_second_per_host={self.max_bytes_per_second_per_host}, "
+            f"max_requests_per_second={self.max_requests_per_second})"
+        )
+
+    @classmethod
+    def from_env(cls) -> Optional["DownloadThrottle"]:
+        limits = {
+            "max_bytes_per_second": _float_env(MAX_BYTES_PER_SECOND_ENV),
+            "max_bytes_per_second_per_host": _float_env(MAX_BYTES_PER_SECOND_PER_HOST_ENV),
+            "max_requests_per_second": _float_env(MAX_REQUESTS_PER_SECOND_ENV),
+        }
+        if not any(limits.values()):
+            return None
+        return cls(**limits)
+
+    def _host_bucket(self, url: str) -> Optional[TokenBucket]:
+        if not self.max_bytes_per_second_per_host:
+            return None
+
+        host = urlparse(url).netloc
+        with self._lock:
+            if host not in self._bandwidth_by_host:
+                self._bandwidth_by_host[host] = TokenBucket(self.max_bytes_per_second_per_host)
+            return self._bandwidth_by_host[host]
+
+    def acquire_request(self, url: str) -> None:
+        """block until another request may be issued"""
+        if self._requests is not None:
+            self._requests.consume(1)
+
+    def consume(self, url: str, num_bytes: int) -> None:
+        """block until `num_bytes` received from `url` fit into the bandwidth limits"""
+        if self._bandwidth is not None:
+            self._bandwidth.consume(num_bytes)
+
+        host_bucket = self._host_bucket(url)
+        if host_bucket is not None:
+            host_bucket.consume(num_bytes)
+
+
+def _float_env(name: str) -> Optional[float]:
+    value = os.environ.get(name)
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        raise ValueError(f"{name} must be a number (got {value})") from None
+
+
+_ENV_THROTTLE: Dict[str, Optional[DownloadThrottle]] = {}
+_ENV_THROTTLE_LOCK = threading.Lock()
+
+
+def _get_throttle(throttle: Optional[DownloadThrottle] = None) -> Optional[DownloadThrottle]:
+    """`throttle` if provided, else process wide throttle configured via environment variables (if any)"""
+    if throttle is not None:
+        return throttle
+
+    env_key = "|".join(
+        os.environ.get(name, "")
+        for name in (MAX_BYTES_PER_SECOND_ENV, MAX_BYTES_PER_SECOND_PER_HOST_ENV, MAX_REQUESTS_PER_SECOND_ENV)
+    )
+    with _ENV_THROTTLE_LOCK:
+        if env_key not in _ENV_THROTTLE:
+            _ENV_THROTTLE[env_key] = DownloadThrottle.from_env()
+        return _ENV_THROTTLE[env_key]
@@ -3,6 +3,7 @@ from copy import deepcopy
 from datetime import datetime, timedelta
 
 import pytest
+import httpx
 from pytest_httpx import HTTPXMock
 
 from capella_console_client import client as capella_client_module
@@ -22,11 +23,28 @@ from .test_data import (
 MOCK_ASSET_HREF = create_mock_asset_hrefs()["HH"]["href"]
 
 
+def mock_content_callback(content_length: str = "127"):
+    # fresh response per request - a single shared response can only be streamed once (concurrent downloads)
+    return lambda request: httpx.Response(200, text="MOCK_CONTENT", headers={"Content-Length": content_length})
+
+
 @pytest.fixture
 def assert_all_responses_were_requested() -> bool:
     return False
 
 
+@pytest.fixture
+def no_retry_delay(monkeypatch):
+    from capella_console_client.retry import DEFAULT_RETRY_ENGINE, RetryEngine
+
+    sleeps = []
+    monkeypatch.setattr(DEFAULT_RETRY_ENGINE, "_sleep", sleeps.append)
+    # circuits opened and retry budget consumed by test do not leak into other tests
+    monkeypatch.setattr(DEFAULT_RETRY_ENGINE, "_breakers", {})
+    monkeypatch.setattr(DEFAULT_RETRY_ENGINE, "budget", RetryEngine().budget)
+    yield sleeps
+
+
 @pytest.fixture
 def disable_validate_uuid(monkeypatch):
     monkeypatch.setattr(capella_client_module, "_validate_uuid", lambda x: None)
@@ -138,19 +156,19 @@ def authed_tasking_request_mock(auth_httpx_mock):
 
 @pytest.fixture
 def download_client(test_client, auth_httpx_mock):
-    auth_httpx_mock.add_response(text="MOCK_CONTENT", headers={"Content-Length": "127"})
+    auth_httpx_mock.add_callback(mock_content_callback())
     yield test_client
 
 
 @pytest.fixture
 def big_download_client(test_client, auth_httpx_mock):
-    auth_httpx_mock.add_response(text="MOCK_CONTENT", headers={"Content-Length": "12700"})
+    auth_httpx_mock.add_callback(mock_content_callback("12700"))
     yield test_client
 
 
 @pytest.fixture
 def verbose_download_client(verbose_test_client, auth_httpx_mock):
-    auth_httpx_mock.add_response(text="MOCK_CONTENT", headers={"Content-Length": "127"})
+    auth_httpx_mock.add_callback(mock_content_callback())
     yield verbose_test_client
 
 
@@ -172,7 +190,7 @@ def verbose_download_multiple_client(verbose_test_client, auth_httpx_mock):
         url=f"{CONSOLE_API_URL}/orders/1/download",
         json=get_mock_responses("/orders/1/download"),
     )
-    auth_httpx_mock.add_response(url=MOCK_ASSET_HREF, text="MOCK_CONTENT", headers={"Content-Length": "127"})
+    auth_httpx_mock.add_callback(mock_content_callback(), url=MOCK_ASSET_HREF)
     yield verbose_test_client
 
 
@@ -1,6 +1,8 @@
 import base64
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock
 
+import httpx
 import pytest
 from pytest_httpx import HTTPXMock
 
@@ -126,3 +128,50 @@ def test_whoami(auth_httpx_mock):
 def test_chatty_client(auth_httpx_mock):
     # chatty client
     CapellaConsoleClient(email="MOCK_EMAIL", password="MOCK_PW", verbose=True)
+
+
+def test_lazy_auth_no_requests_on_construction(auth_httpx_mock: HTTPXMock):
+    CapellaConsoleClient(email="MOCK_EMAIL", password="MOCK_PW", lazy=True)
+    assert auth_httpx_mock.get_requests() == []
+
+
+def test_lazy_auth_on_first_request_without_user_lookup(auth_httpx_mock: HTTPXMock):
+    auth_httpx_mock.add_response(url=f"{CONSOLE_API_URL}/orders/1", json={"orderId": "1"})
+    client = CapellaConsoleClient(email="MOCK_EMAIL", password="MOCK_PW", lazy=True)
+
+    client._sesh.get("/orders/1")
+
+    requests = auth_httpx_mock.get_requests()
+    assert [r.url.path for r in requests] == ["/token", "/orders/1"]
+    assert requests[-1].headers["Authorization"] == f"Bearer {post_mock_responses('/token')['accessToken']}"
+
+
+def test_lazy_user_lookup_when_needed(auth_httpx_mock: HTTPXMock):
+    auth_httpx_mock.add_response(url=f"{CONSOLE_API_URL}/tasks?customerId=MOCK_ID", json=[])
+    client = CapellaConsoleClient(email="MOCK_EMAIL", password="MOCK_PW", lazy=True)
+
+    assert client.list_tasking_requests() == []
+    assert client._sesh.customer_id == get_mock_responses("/user")["id"]
+    assert [r.url.path for r in auth_httpx_mock.get_requests()] == ["/token", "/user", "/tasks"]
+
+
+def test_lazy_auth_single_flight(auth_httpx_mock: HTTPXMock):
+    auth_httpx_mock.add_callback(lambda request: httpx.Response(200, json=[]), url=f"{CONSOLE_API_URL}/orders")
+    client = CapellaConsoleClient(email="MOCK_EMAIL", password="MOCK_PW", lazy=True)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda _: client._sesh.get("/orders"), range(16)))
+
+    paths = [r.url.path for r in auth_httpx_mock.get_requests()]
+    assert paths.count("/token") == 1
+    assert paths.count("/orders") == 16
+
+
+def test_lazy_auth_failure_raises_on_first_request(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(
+        url=f"{CONSOLE_API_URL}/token", method="POST", status_code=400, json={"error": {"code": "not allowed"}}
+    )
+    client = CapellaConsoleClient(email="MOCK_INVALID_EMAIL", password="MOCK_INVALID_PW", lazy=True)
+
+    with pytest.raises(AuthenticationError):
+        client._sesh.get("/orders")
@@ -0,0 +1,199 @@
+import base64
+import json
+import tempfile
+
+import httpx
+import pytest
+
+pytest.importorskip("typer")
+
+from typer.testing import CliRunner
+
+from capella_console_client.config import CONSOLE_API_URL
+from capella_console_client.exceptions import AuthenticationError, CapellaConsoleClientError, ConnectError
+from capella_console_client.cli import batch, client_singleton
+from capella_console_client.cli.cache import CLICache
+from capella_console_client.cli.config import CURRENT_SETTINGS, DEFAULT_SETTINGS
+from capella_console_client.cli.validate import get_caster
+from capella_console_client.cli.wizard import app
+from .conftest import mock_content_callback
+from .test_data import get_canned_search_results, get_mock_responses, DUMMY_STAC_IDS
+
+
+@pytest.fixture
+def cli(monkeypatch, tmp_path):
+    monkeypatch.setattr("capella_console_client.cli.cache.CLICache.SETTINGS", tmp_path / "settings.json")
+
+    def invoke(*args, input=None):
+        return CliRunner().invoke(app, list(args), input=input)
+
+    return invoke
+
+
+@pytest.fixture
+def batch_client(test_client, monkeypatch):
+    monkeypatch.setattr(batch, "get_authenticated_client", lambda prompt=True: test_client)
+    yield test_client
+
+
+def _ndjson(output):
+    return [json.loads(line) for line in output.splitlines()]
+
+
+def _search_payloads(httpx_mock):
+    return [json.loads(r.read()) for r in httpx_mock.get_requests() if r.url.path == "/catalog/search"]
+
+
+def test_search_filters(cli, batch_client, auth_httpx_mock):
+    auth_httpx_mock.add_response(url=f"{CONSOLE_API_URL}/catalog/search", json=get_canned_search_results())
+
+    result = cli("search", "-f", "product_type=GEO,SLC", "-f", "incidence_angle>=30", "--limit", "2")
+
+    assert result.exit_code == 0, result.stderr
+    assert [item["id"] for item in _ndjson(result.stdout)] == [
+        item["id"] for item in get_canned_search_results()["features"][:2]
+    ]
+    payload = _search_payloads(auth_httpx_mock)[0]
+    assert payload["limit"] == 2
+    assert payload["query"]["sar:product_type"] == {"in": ["GEO", "SLC"]}
+    assert payload["query"]["view:incidence_angle"] == {"gte": 30.0}
+
+
+def test_search_polarizations_filter(cli, batch_client, auth_httpx_mock):
+    assert get_caster("polarizations")("HH,VV") == ["HH", "VV"]
+    auth_httpx_mock.add_response(url=f"{CONSOLE_API_URL}/catalog/search", json=get_canned_search_results())
+
+    result = cli("search", "-f", "polarizations=HH,VV")
+
+    assert result.exit_code == 0, result.stderr
+    assert _search_payloads(auth_httpx_mock)[0]["query"]["sar:polarizations"] == {"in": ["HH", "VV"]}
+
+
+def test_search_query_file_per_line(cli, batch_client, auth_httpx_mock):
+    auth_httpx_mock.add_response(url=f"{CONSOLE_API_URL}/catalog/search", json=get_canned_search_results())
+    queries = [{"bbox": [1, 2, 3, 4]}, {"bbox": [5, 6, 7, 8], "limit": 1}]
+
+    result = cli("search", "-q", "-", "-f", "product_type=GEO", input="\n".join(map(json.dumps, queries)))
+
+    assert result.exit_code == 0, result.stderr
+    assert len(_ndjson(result.stdout)) == 4 + 1
+    payloads = _search_payloads(auth_httpx_mock)
+    assert [p["bbox"] for p in payloads] == [[1, 2, 3, 4], [5, 6, 7, 8]]
+    assert all(p["query"]["sar:product_type"] == {"eq": "GEO"} for p in payloads)
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ("search",),
+        ("search", "-f", "product_type"),
+        ("search", "-f", "product_type=NOPE"),
+        ("search", "-f", "not_a_field=1"),
+        ("search", "-f", "incidence_angle=abc"),
+    ],
+)
+def test_search_usage_errors(cli, batch_client, args):
+    assert cli(*args).exit_code == 2
+
+
+def test_search_fail_on_empty(cli, batch_client, auth_httpx_mock):
+    auth_httpx_mock.add_response(url=f"{CONSOLE_API_URL}/catalog/search", json={"features": [], "numberMatched": 0})
+
+    assert cli("search", "-f", "product_type=GEO").exit_code == 0
+    assert cli("search", "-f", "product_type=GEO", "--fail-on-empty").exit_code == batch.EXIT_NO_RESULTS
+
+
+def test_order_from_search_output(cli, batch_client, order_client, auth_httpx_mock):
+    items = get_canned_search_results()["features"][:2]
+
+    result = cli("order", input="\n".join(map(json.dumps, items)))
+
+    assert result.exit_code == 0, result.stderr
+    assert _ndjson(result.stdout) == [{"orderId": "1", "stac_ids": [item["id"] for item in items]}]
+    # STAC items provided - no search
+    assert not _search_payloads(auth_httpx_mock)
+
+
+def test_download_order(cli, batch_client, auth_httpx_mock, disable_validate_uuid):
+    auth_httpx_mock.add_response(
+        url=f"{CONSOLE_API_URL}/orders/1/download", json=get_mock_responses("/orders/1/download")
+    )
+    auth_httpx_mock.add_callback(mock_content_callback())
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        result = cli("download", "--order-id", "1", "--local-dir", tmp_dir, "--include", "HH")
+
+        assert result.exit_code == 0, result.stderr
+        products = _ndjson(result.stdout)
+        assert [(p["id"], p["orderId"]) for p in products] == [(DUMMY_STAC_IDS[0], "1")]
+        assert products[0]["assets"]["HH"].startswith(tmp_dir)
+
+
+def test_auth_error_exit_code(cli, monkeypatch):
+    def raise_auth_error(prompt=True):
+        raise AuthenticationError("MOCK_INVALID")
+
+    monkeypatch.setattr(batch, "get_authenticated_client", raise_auth_error)
+
+    result = cli("search", "-f", "product_type=GEO")
+    assert result.exit_code == batch.EXIT_AUTH
+    assert json.loads(result.stderr)["error"] == "AuthenticationError"
+
+
+@pytest.fixture
+def nothing_cached(monkeypatch, tmp_path):
+    monkeypatch.setattr(CLICache, "JWT", tmp_path / "jwt.cache")
+    monkeypatch.setattr(CLICache, "CREDENTIALS", tmp_path / "credentials.json")
+    monkeypatch.setattr(client_singleton, "_client", None)
+    monkeypatch.setattr(CURRENT_SETTINGS, "_data", {**DEFAULT_SETTINGS, "console_user": "MOCK_EMAIL"})
+
+
+@pytest.mark.parametrize("console_user", [True, False])
+def test_nothing_cached_does_not_prompt(cli, nothing_cached, monkeypatch, console_user):
+    if not console_user:
+        monkeypatch.setattr(CURRENT_SETTINGS, "_data", dict(DEFAULT_SETTINGS))
+
+    def fail_prompt(*args):
+        raise AssertionError("prompted for credentials")
+
+    monkeypatch.setattr("builtins.input", fail_prompt)
+    monkeypatch.setattr("capella_console_client.session.getpass", fail_prompt)
+
+    result = cli("search", "-f", "product_type=GEO")
+    assert result.exit_code == batch.EXIT_AUTH
+    assert json.loads(result.stderr)["error"] == "AuthenticationError"
+
+
+def test_cached_jwt_tried_first(nothing_cached, httpx_mock):
+    httpx_mock.add_response(url=f"{CONSOLE_API_URL}/user", json=get_mock_responses("/user"))
+    CLICache.write_jwt("Bearer MOCK_TOKEN")
+
+    client = client_singleton.get_authenticated_client()
+
+    assert [r.url.path for r in httpx_mock.get_requests()] == ["/user"]
+    assert client._sesh.headers["authorization"] == "Bearer MOCK_TOKEN"
+
+
+def test_console_user_authenticated_if_no_jwt(nothing_cached, auth_httpx_mock, monkeypatch):
+    monkeypatch.setattr("capella_console_client.session.getpass", lambda *args: "MOCK_PW")
+
+    client = client_singleton.get_authenticated_client()
+
+    basic_token = base64.b64encode(b"MOCK_EMAIL:MOCK_PW").decode("utf-8")
+    assert auth_httpx_mock.get_requests()[0].headers["authorization"] == f"Basic {basic_token}"
+    assert CLICache.load_jwt() == client._sesh.headers["authorization"]
+    assert CLICache.CREDENTIALS.exists()
+
+
+@pytest.mark.parametrize(
+    "exc, expected",
+    [
+        (ConnectError("MOCK"), batch.EXIT_TEMPFAIL),
+        (CapellaConsoleClientError(response=httpx.Response(503)), batch.EXIT_TEMPFAIL),
+        (CapellaConsoleClientError(response=httpx.Response(400)), batch.EXIT_FAILURE),
+        (httpx.ReadTimeout("MOCK"), batch.EXIT_TEMPFAIL),
+        (ValueError("MOCK"), batch.EXIT_FAILURE),
+    ],
+)
+def test_exit_codes(exc, expected):
+    assert batch._exit_code(exc) == expected
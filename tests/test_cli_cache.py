@@ -0,0 +1,271 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from capella_console_client.cli.cache import CLICache, SavedSearchStore
+
+RESULT = SavedSearchStore.RESULT
+QUERY = SavedSearchStore.QUERY
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SavedSearchStore(tmp_path / "saved-searches.sqlite")
+    yield store
+    store.close()
+
+
+@pytest.fixture
+def cli_cache(tmp_path, monkeypatch):
+    for name in ("SETTINGS", "JWT", "SAVED_SEARCHES", "MY_SEARCH_RESULTS", "MY_SEARCH_QUERIES"):
+        monkeypatch.setattr(CLICache, name, tmp_path / getattr(CLICache, name).name)
+    monkeypatch.setattr(CLICache, "_saved_searches", None)
+    yield CLICache
+
+
+def test_upsert_get_load(store):
+    store.upsert(RESULT, "first", ["a", "b"], is_new=True)
+    store.upsert(RESULT, "second", ["c"], is_new=True)
+    store.upsert(QUERY, "first", {"bbox": [1, 2, 3, 4]}, is_new=True)
+
+    assert store.get(RESULT, "first")["data"] == ["a", "b"]
+    assert store.get(RESULT, "missing") is None
+    assert list(store.load(RESULT)) == ["first", "second"]
+    assert store.load(QUERY)["first"]["data"] == {"bbox": [1, 2, 3, 4]}
+    assert [(s["identifier"], s["size"]) for s in store.summaries(RESULT)] == [("first", 2), ("second", 1)]
+
+
+def test_update_keeps_created_at(store, monkeypatch):
+    monkeypatch.setattr("capella_console_client.cli.cache._now", lambda: "2022-01-01 00:00:00")
+    store.upsert(RESULT, "first", ["a"], is_new=True)
+
+    monkeypatch.setattr("capella_console_client.cli.cache._now", lambda: "2022-01-02 00:00:00")
+    store.upsert(RESULT, "first", ["a", "b"])
+
+    saved = store.get(RESULT, "first")
+    assert (saved["created_at"], saved["updated_at"], saved["data"]) == (
+        "2022-01-01 00:00:00",
+        "2022-01-02 00:00:00",
+        ["a", "b"],
+    )
+
+
+def test_rename_delete_clear(store):
+    for identifier in ("first", "second", "third"):
+        store.upsert(RESULT, identifier, [identifier], is_new=True)
+    store.upsert(QUERY, "first", {}, is_new=True)
+
+    store.rename(RESULT, "first", "second")
+    assert store.identifiers(RESULT) == ["second", "third"]
+    assert store.get(RESULT, "second")["data"] == ["first"]
+
+    store.delete(RESULT, ["third"])
+    assert store.identifiers(RESULT) == ["second"]
+
+    store.clear(RESULT)
+    assert store.identifiers(RESULT) == []
+    assert store.identifiers(QUERY) == ["first"]
+
+
+def test_failed_transaction_rolled_back(store):
+    store.upsert(RESULT, "first", ["a"], is_new=True)
+
+    with pytest.raises(RuntimeError):
+        with store._transaction():
+            store._con.execute("DELETE FROM saved_searches")
+            raise RuntimeError("crash")
+
+    assert store.identifiers(RESULT) == ["first"]
+
+
+def test_concurrent_writers(tmp_path):
+    path = tmp_path / "saved-searches.sqlite"
+    SavedSearchStore(path).close()
+
+    def _save(idx):
+        # separate connections - serialized by SQLite's file lock
+        store = SavedSearchStore(path)
+        store.upsert(RESULT, f"search-{idx}", [str(idx)], is_new=True)
+        store.close()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(_save, range(32)))
+
+    assert len(SavedSearchStore(path).identifiers(RESULT)) == 32
+
+
+def test_legacy_json_imported(cli_cache):
+    legacy = {"old": {"data": ["a"], "created_at": "2021-01-01 00:00:00", "updated_at": "2021-01-01 00:00:00"}}
+    cli_cache.MY_SEARCH_RESULTS.write_text(json.dumps(legacy))
+
+    assert cli_cache.load_my_search_results() == legacy
+    assert not cli_cache.MY_SEARCH_RESULTS.exists()
+    assert cli_cache.MY_SEARCH_RESULTS.with_name("my-search-results.json.imported").exists()
+
+
+def test_corrupt_legacy_json_kept(cli_cache):
+    cli_cache.MY_SEARCH_QUERIES.write_text("{not json")
+
+    assert cli_cache.load_my_search_queries() == {}
+    assert cli_cache.MY_SEARCH_QUERIES.exists()
+
+
+def test_cli_cache_update(cli_cache):
+    cli_cache.update_my_search_results("search", ["a"], is_new=True)
+    cli_cache.update_my_search_queries("search", {"limit": 1}, is_new=True)
+
+    assert cli_cache.load_my_search_results()["search"]["data"] == ["a"]
+    assert cli_cache.load_my_search_queries()["search"]["data"] == {"limit": 1}
+
+
+def test_user_settings_written_atomically(cli_cache):
+    cli_cache.write_user_settings("limit", 10)
+    cli_cache.write_user_settings("out_path", "/tmp")
+
+    assert cli_cache.load_user_settings() == {"limit": 10, "out_path": "/tmp"}
+    assert [p.name for p in cli_cache.SETTINGS.parent.iterdir() if p.name.startswith(".")] == []
+
+
+def _item(stac_id, dt):
+    return {"id": stac_id, "properties": {"datetime": dt}}
+
+
+def test_materialize(store):
+    assert store.high_water_mark("aoi") is None
+
+    added = store.materialize("aoi", [_item("a", "2022-01-01T00:00:00Z"), _item("b", "2022-01-02T00:00:00Z")])
+    assert added == 2
+    assert store.materialize("aoi", [_item("b", "2022-01-02T00:00:00Z"), _item("c", "2022-01-03T00:00:00Z")]) == 1
+    assert [item["id"] for item in store.materialized_items("aoi")] == ["c", "b", "a"]
+    assert store.high_water_mark("aoi") == "2022-01-03T00:00:00Z"
+
+    assert store.materialize("aoi", [_item("d", "2021-01-01T00:00:00Z")], replace=True) == 1
+    assert [item["id"] for item in store.materialized_items("aoi")] == ["d"]
+
+
+def test_materialized_follow_saved_query(store):
+    store.upsert(QUERY, "aoi", {}, is_new=True)
+    store.materialize("aoi", [_item("a", "2022-01-01T00:00:00Z")])
+
+    store.rename(QUERY, "aoi", "renamed")
+    assert store.materialized_items("aoi") == []
+    assert [item["id"] for item in store.materialized_items("renamed")] == ["a"]
+
+    store.delete(QUERY, ["renamed"])
+    assert store.materialized_items("renamed") == []
+
+
+@pytest.fixture
+def refresh_client(test_client, monkeypatch):
+    monkeypatch.setattr("capella_console_client.cli.user_searches.core.get_client", lambda: test_client)
+    yield test_client
+
+
+def test_refresh_materialized_incremental(cli_cache, refresh_client, auth_httpx_mock):
+    from capella_console_client.config import CONSOLE_API_URL
+    from capella_console_client.cli.user_searches.core import refresh_materialized
+
+    search_url = f"{CONSOLE_API_URL}/catalog/search"
+    first = [_item("a", "2022-01-01T00:00:00Z"), _item("b", "2022-01-02T00:00:00Z")]
+    newer = [_item("b", "2022-01-02T00:00:00Z"), _item("c", "2022-01-03T00:00:00Z")]
+    auth_httpx_mock.add_response(url=search_url, json={"features": first, "numberMatched": 2})
+    auth_httpx_mock.add_response(url=search_url, json={"features": newer, "numberMatched": 2})
+
+    cli_cache.update_my_search_queries("aoi", {"bbox": [1, 2, 3, 4], "limit": 10}, is_new=True)
+
+    assert refresh_materialized("aoi") == 2
+    assert refresh_materialized("aoi") == 1
+
+    payloads = [json.loads(r.read()) for r in auth_httpx_mock.get_requests() if r.url.path == "/catalog/search"]
+    assert "query" not in payloads[0]
+    assert payloads[1]["query"] == {"datetime": {"gte": "2022-01-02T00:00:00.000000Z"}}
+    assert payloads[1]["sortby"] == [{"field": "properties.datetime", "direction": "asc"}]
+    assert [item["id"] for item in cli_cache.saved_searches().materialized_items("aoi")] == ["c", "b", "a"]
+
+
+def test_refresh_materialized_pages_until_caught_up(cli_cache, refresh_client, auth_httpx_mock):
+    from datetime import timedelta
+    from capella_console_client.config import CONSOLE_API_URL
+    from capella_console_client.cli.user_searches.core import refresh_materialized
+
+    search_url = f"{CONSOLE_API_URL}/catalog/search"
+    auth_httpx_mock.add_response(
+        url=search_url, json={"features": [_item("a", "2022-01-05T00:00:00Z")], "numberMatched": 1}
+    )
+    # limit reached - next round starts at most recent item
+    auth_httpx_mock.add_response(
+        url=search_url,
+        json={"features": [_item("b", "2022-01-05T00:00:00Z"), _item("c", "2022-01-06T00:00:00Z")], "numberMatched": 2},
+    )
+    auth_httpx_mock.add_response(
+        url=search_url, json={"features": [_item("c", "2022-01-06T00:00:00Z")], "numberMatched": 1}
+    )
+
+    cli_cache.update_my_search_queries("aoi", {"limit": 2, "datetime__gt": "2022-01-04T12:00:00Z"}, is_new=True)
+
+    assert refresh_materialized("aoi") == 1
+    assert refresh_materialized("aoi", lookback=timedelta(days=1)) == 2
+
+    payloads = [json.loads(r.read()) for r in auth_httpx_mock.get_requests() if r.url.path == "/catalog/search"]
+    # lookback bounded by saved query
+    assert [p["query"]["datetime"] for p in payloads[1:]] == [
+        {"gte": "2022-01-04T12:00:00.000000Z"},
+        {"gte": "2022-01-06T00:00:00.000000Z"},
+    ]
+
+
+def test_refresh_cmd(cli_cache, refresh_client, auth_httpx_mock, monkeypatch):
+    pytest.importorskip("typer")
+    from typer.testing import CliRunner
+    from capella_console_client.config import CONSOLE_API_URL
+    from capella_console_client.cli import wizard
+
+    monkeypatch.setattr(wizard, "get_authenticated_client", lambda: refresh_client)
+    auth_httpx_mock.add_response(
+        url=f"{CONSOLE_API_URL}/catalog/search",
+        json={"features": [_item("a", "2022-01-01T00:00:00Z")], "numberMatched": 1},
+    )
+    cli_cache.update_my_search_queries("aoi", {"limit": 10}, is_new=True)
+
+    result = CliRunner().invoke(wizard.app, ["my-searches", "queries", "refresh", "--all"])
+    assert result.exit_code == 0, result.output
+    assert result.stdout == "aoi: 1 new STAC items\n"
+
+    result = CliRunner().invoke(wizard.app, ["my-searches", "queries", "refresh", "unknown"])
+    assert result.exit_code == 2
+
+
+def test_saved_query_items_as_saved_query_returns(cli_cache):
+    from capella_console_client.cli.user_searches.core import saved_query_items
+
+    store = cli_cache.saved_searches()
+    items = [_item(stac_id, f"2022-01-0{day}T00:00:00Z") for day, stac_id in enumerate("abcd", start=1)]
+    store.materialize("recent", items)
+    store.materialize("sorted", items)
+    cli_cache.update_my_search_queries("recent", {"limit": 2}, is_new=True)
+    cli_cache.update_my_search_queries("sorted", {"limit": 3, "sortby": ["+datetime"]}, is_new=True)
+
+    # all seen so far materialized - limit and sort order of saved query applied
+    assert [item["id"] for item in saved_query_items("recent")] == ["d", "c"]
+    assert [item["id"] for item in saved_query_items("sorted")] == ["a", "b", "c"]
+
+
+def test_from_saved_falls_back_to_materialized_on_errors(cli_cache, monkeypatch, capsys):
+    pytest.importorskip("typer")
+    import typer
+    from capella_console_client.cli import search
+    from capella_console_client.exceptions import ConnectError
+
+    def _raise(identifier):
+        raise ConnectError("MOCK")
+
+    monkeypatch.setattr(search, "refresh_materialized", _raise)
+    cli_cache.update_my_search_queries("aoi", {"limit": 10}, is_new=True)
+
+    with pytest.raises(typer.Exit):
+        search._refresh_or_warn("aoi")
+
+    cli_cache.saved_searches().materialize("aoi", [_item("a", "2022-01-01T00:00:00Z")])
+    search._refresh_or_warn("aoi")
+    assert "showing previously materialized STAC items" in capsys.readouterr().err
@@ -0,0 +1,71 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+pytest.importorskip("typer")
+
+# seconds - importing httpx alone takes ~0.2s
+IMPORT_TIME_BUDGET = 0.5
+HEAVY_MODULES = ("httpx", "questionary", "tabulate", "capella_console_client.client")
+
+
+def _run_wizard(tmp_path, *args: str):
+    """run wizard in fresh interpreter - returns import duration and heavy modules imported"""
+    script = f"""
+import json, sys, time
+started = time.perf_counter()
+from capella_console_client.cli.wizard import app
+import_duration = time.perf_counter() - started
+sys.argv = ["capella-console-wizard", *{list(args)!r}]
+try:
+    app()
+except SystemExit:
+    pass
+sys.stderr.write(json.dumps([import_duration, [m for m in {HEAVY_MODULES!r} if m in sys.modules]]))
+"""
+    proc = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "HOME": str(tmp_path)},
+        check=True,
+    )
+    return json.loads(proc.stderr.splitlines()[-1])
+
+
+def test_import_time_budget(tmp_path):
+    import_duration, _ = _run_wizard(tmp_path, "--help")
+    assert import_duration < IMPORT_TIME_BUDGET
+
+
+@pytest.mark.parametrize(
+    "args, expected_heavy",
+    [
+        (("--help",), []),
+        (("settings", "--help"), []),
+        (("downloads", "--help"), []),
+        (("settings", "show"), ["tabulate"]),
+    ],
+)
+def test_lazy_imports(tmp_path, args, expected_heavy):
+    _, heavy_imported = _run_wizard(tmp_path, *args)
+    assert heavy_imported == expected_heavy
+
+
+def test_subcommands_resolved(monkeypatch):
+    from typer.testing import CliRunner
+    from capella_console_client.cli.wizard import app
+
+    monkeypatch.setattr(sys, "argv", ["capella-console-wizard", "--help"])
+    result = CliRunner().invoke(app, ["--help"])
+    assert result.exit_code == 0
+    for name in ("settings", "my-searches", "orders", "workflows", "downloads", "configure"):
+        assert name in result.output
+
+    monkeypatch.setattr(sys, "argv", ["capella-console-wizard", "orders", "--help"])
+    result = CliRunner().invoke(app, ["orders", "--help"])
+    assert result.exit_code == 0
+    assert "list" in result.output
@@ -0,0 +1,84 @@
+import pytest
+
+pytest.importorskip("typer")
+
+from rich.console import Console
+
+from capella_console_client.cli import visualize
+from capella_console_client.cli.visualize import show_tabulated
+
+
+def _items(count):
+    return [
+        {
+            "id": f"STAC_ID_{i}",
+            "properties": {"sar:product_type": "GEO", "sar:polarizations": None if i % 2 else ["HH"]},
+        }
+        for i in range(count)
+    ]
+
+
+@pytest.fixture(autouse=True)
+def wide_console(monkeypatch):
+    monkeypatch.setenv("COLUMNS", "200")
+
+
+def _rows(output):
+    return [line for line in output.splitlines() if "STAC_ID_" in line]
+
+
+def test_headers_not_mutated(capsys):
+    headers = ["product_type", "id"]
+
+    show_tabulated(_items(1), headers)
+
+    assert headers == ["product_type", "id"]
+    assert _rows(capsys.readouterr().out)[0].split("│")[1].strip() == "STAC_ID_0"
+
+
+def test_missing_values_keep_columns_aligned(capsys):
+    show_tabulated(_items(2), ["id", "polarizations", "product_type"], show_row_number=True)
+
+    rows = [[cell.strip() for cell in row.split("│")[1:-1]] for row in _rows(capsys.readouterr().out)]
+    assert rows == [["1", "STAC_ID_0", "['HH']", "GEO"], ["2", "STAC_ID_1", "n/a", "GEO"]]
+
+
+def test_all_pages_streamed_if_not_terminal(capsys, monkeypatch):
+    monkeypatch.setattr(visualize.typer, "confirm", lambda *args, **kwargs: pytest.fail("prompted"))
+
+    show_tabulated(_items(5), ["id"], page_size=2)
+
+    out = capsys.readouterr().out
+    assert len(_rows(out)) == 5
+    # one table per page
+    assert out.count("┃ id") == 3
+
+
+def test_stop_paging_on_terminal(capsys, monkeypatch):
+    prompts = []
+
+    def _confirm(text, **kwargs):
+        prompts.append(text)
+        return len(prompts) < 2
+
+    monkeypatch.setattr(Console, "is_terminal", True)
+    monkeypatch.setattr(visualize.typer, "confirm", _confirm)
+
+    show_tabulated(_items(7), ["id"], page_size=2)
+
+    assert len(_rows(capsys.readouterr().out)) == 4
+    assert prompts == ["show next 2 of 5 remaining?", "show next 2 of 3 remaining?"]
+
+
+def test_project_single_pass():
+    consumed = []
+
+    def _gen():
+        for item in _items(3):
+            consumed.append(item["id"])
+            yield item
+
+    rows = visualize._project(_gen(), ["#", "id", "product_type"])
+    assert consumed == []
+    assert next(rows) == ["1", "STAC_ID_0", "GEO"]
+    assert consumed == ["STAC_ID_0"]
@@ -0,0 +1,115 @@
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+
+from capella_console_client.assets import DownloadRequest
+from capella_console_client.coordinator import DownloadJob, run_download_job
+from .test_data import create_mock_asset_hrefs, DUMMY_STAC_IDS
+
+MOCK_ASSETS_PRESIGNED = create_mock_asset_hrefs()
+
+
+@pytest.fixture
+def temp_dir():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yield Path(temp_dir)
+
+
+def _download_requests(local_dir: Path, cnt: int):
+    return [
+        DownloadRequest(url=MOCK_ASSETS_PRESIGNED["HH"]["href"], local_path=local_dir / f"{i}.png", asset_key=str(i))
+        for i in range(cnt)
+    ]
+
+
+def test_create_job_shards(temp_dir):
+    job = DownloadJob.create(temp_dir / "job", _download_requests(temp_dir, 5), shard_size=2)
+
+    assert len(job.shards) == 3
+    assert job.pending() == [0, 1, 2]
+    assert job.download_requests(2)[0].local_path == temp_dir / "4.png"
+
+
+def test_claim_exclusive(temp_dir):
+    job = DownloadJob.create(temp_dir / "job", _download_requests(temp_dir, 2), shard_size=1)
+
+    assert job.claim("worker-1") == 0
+    assert job.claim("worker-2") == 1
+    assert job.claim("worker-3") is None
+
+    job.complete(0, "worker-1")
+    job.release(1, "worker-2")
+    assert job.pending() == [1]
+    assert job.claim("worker-3") == 1
+
+
+def test_claim_takes_over_expired_lease(temp_dir):
+    job = DownloadJob.create(temp_dir / "job", _download_requests(temp_dir, 1))
+    assert job.claim("worker-1") == 0
+
+    expired = time.time() - 60
+    os.utime(job._claim_path(0), (expired, expired))
+
+    assert job.claim("worker-2", lease_seconds=600) is None
+    assert job.claim("worker-2", lease_seconds=30) == 0
+
+
+def test_claim_does_not_take_over_lease_taken_over_concurrently(temp_dir, monkeypatch):
+    job = DownloadJob.create(temp_dir / "job", _download_requests(temp_dir, 1))
+    assert job.claim("worker-1") == 0
+    expired = time.time() - 60
+    os.utime(job._claim_path(0), (expired, expired))
+
+    rename = os.rename
+
+    def _taken_over_before_rename(src, dst):
+        # worker-3 takes over expired lease after worker-2 inspected it
+        os.unlink(src)
+        Path(src).write_text("worker-3")
+        rename(src, dst)
+
+    monkeypatch.setattr(os, "rename", _taken_over_before_rename)
+    assert job.claim("worker-2", lease_seconds=30) is None
+
+    assert job._claim_path(0).read_text() == "worker-3"
+    assert list(job.claims_dir.iterdir()) == [job._claim_path(0)]
+
+
+def test_release_only_own_lease(temp_dir):
+    job = DownloadJob.create(temp_dir / "job", _download_requests(temp_dir, 1))
+    assert job.claim("worker-1") == 0
+    expired = time.time() - 60
+    os.utime(job._claim_path(0), (expired, expired))
+    assert job.claim("worker-2", lease_seconds=30) == 0
+
+    # lease of worker-1 taken over
+    job.release(0, "worker-1")
+    job.complete(0, "worker-1")
+    assert job._claim_path(0).read_text() == "worker-2"
+
+    job.release(0, "worker-2")
+    assert not job._claim_path(0).exists()
+
+
+def test_run_download_job(download_client, temp_dir):
+    job = DownloadJob.create(temp_dir / "job", _download_requests(temp_dir, 3), shard_size=2)
+    summary = run_download_job(job.job_dir, processes=1)
+
+    assert summary == {"completed": 2, "failed": 0}
+    assert job.pending() == []
+    assert (temp_dir / "2.png").read_text() == "MOCK_CONTENT"
+
+    # resume - nothing left to do
+    assert run_download_job(job.job_dir, processes=1) == {"completed": 0, "failed": 0}
+
+
+def test_create_download_job(test_client, temp_dir):
+    job = test_client.create_download_job(
+        temp_dir / "job", assets_presigned=[MOCK_ASSETS_PRESIGNED], local_dir=temp_dir, shard_size=1
+    )
+
+    assert len(job.shards) == 2
+    assert {dl_request.stac_id for dl_request in job.download_requests(0)} == {DUMMY_STAC_IDS[0]}
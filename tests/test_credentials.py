@@ -0,0 +1,143 @@
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from capella_console_client import CapellaConsoleClient
+from capella_console_client.config import CONSOLE_API_URL
+from capella_console_client.credentials import (
+    CredentialCache,
+    CachedCredentials,
+    _credential_key,
+    _hash_password,
+    _password_matches,
+)
+from capella_console_client.exceptions import AuthenticationError
+from .test_data import post_mock_responses, get_mock_responses
+
+
+@pytest.fixture
+def credential_cache():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        yield CredentialCache(Path(tmp_dir) / "credentials.json")
+
+
+def test_store_load_clear(credential_cache):
+    credential_cache.store("key", CachedCredentials(access_token="A", refresh_token="R", customer_id="C"))
+
+    cached = credential_cache.load("key")
+    assert (cached.access_token, cached.refresh_token, cached.customer_id) == ("A", "R", "C")
+    assert credential_cache.load("other") is None
+
+    credential_cache.clear("key")
+    assert credential_cache.load("key") is None
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX permissions")
+def test_cache_file_private(credential_cache):
+    credential_cache.store("key", CachedCredentials(access_token="A"))
+    assert credential_cache.path.stat().st_mode & 0o777 == 0o600
+
+
+def test_corrupt_cache_ignored(credential_cache):
+    credential_cache.path.parent.mkdir(parents=True, exist_ok=True)
+    credential_cache.path.write_text("{not json")
+    assert credential_cache.load("key") is None
+
+
+def test_concurrent_stores_not_lost(credential_cache):
+    def _store(idx):
+        # separate instances - exclusion via OS file lock
+        CredentialCache(credential_cache.path).store(f"key-{idx}", CachedCredentials(access_token=str(idx)))
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(_store, range(32)))
+
+    assert all(credential_cache.load(f"key-{idx}").access_token == str(idx) for idx in range(32))
+
+
+def test_credential_key():
+    assert _credential_key(CONSOLE_API_URL, email="User@Capellaspace.com") == f"{CONSOLE_API_URL}|user@capellaspace.com"
+    assert _credential_key(CONSOLE_API_URL, token="Bearer abc") == _credential_key(CONSOLE_API_URL, token="abc")
+    assert _credential_key(CONSOLE_API_URL) is None
+
+
+def test_client_authenticates_from_cache(auth_httpx_mock: HTTPXMock, credential_cache):
+    CapellaConsoleClient(email="MOCK_EMAIL", password="MOCK_PW", credential_cache=credential_cache)
+    assert len(auth_httpx_mock.get_requests()) == 2
+
+    client = CapellaConsoleClient(email="MOCK_EMAIL", password="MOCK_PW", credential_cache=credential_cache.path)
+
+    # no auth round trips
+    assert len(auth_httpx_mock.get_requests()) == 2
+    assert client._sesh.headers["Authorization"] == f"Bearer {post_mock_responses('/token')['accessToken']}"
+    assert client._sesh._refresh_token == post_mock_responses("/token")["refreshToken"]
+    assert client._sesh.customer_id == get_mock_responses("/user")["id"]
+    assert client._sesh.organization_id == get_mock_responses("/user")["organizationId"]
+
+
+def test_wrong_password_not_authenticated_from_cache(auth_httpx_mock: HTTPXMock, credential_cache):
+    CapellaConsoleClient(email="MOCK_EMAIL", password="MOCK_PW", credential_cache=credential_cache)
+    assert credential_cache.load(_credential_key(CONSOLE_API_URL, email="MOCK_EMAIL")).password_hash
+    auth_httpx_mock.add_response(
+        url=f"{CONSOLE_API_URL}/token", method="POST", status_code=400, json={"error": {"code": "not allowed"}}
+    )
+
+    with pytest.raises(AuthenticationError):
+        CapellaConsoleClient(email="MOCK_EMAIL", password="MOCK_WRONG_PW", credential_cache=credential_cache)
+    assert [r.url.path for r in auth_httpx_mock.get_requests()] == ["/token", "/user", "/token"]
+
+
+def test_password_hash():
+    password_hash = _hash_password("MOCK_PW")
+    assert "MOCK_PW" not in password_hash
+    assert _password_matches("MOCK_PW", password_hash)
+    assert not _password_matches("MOCK_WRONG_PW", password_hash)
+    assert not _password_matches("MOCK_PW", None)
+
+
+def test_token_auth_user_info_from_cache(httpx_mock: HTTPXMock, credential_cache):
+    httpx_mock.add_response(url=f"{CONSOLE_API_URL}/user", json=get_mock_responses("/user"))
+
+    CapellaConsoleClient(token="MOCK_TOKEN", credential_cache=credential_cache)
+    client = CapellaConsoleClient(token="MOCK_TOKEN", credential_cache=credential_cache)
+
+    assert len(httpx_mock.get_requests()) == 1
+    assert client._sesh.customer_id == get_mock_responses("/user")["id"]
+
+
+def test_refresh_persisted_and_adopted(auth_httpx_mock: HTTPXMock, credential_cache):
+    auth_httpx_mock.add_response(
+        url=f"{CONSOLE_API_URL}/token/refresh", method="POST", json=post_mock_responses("/token/refresh")
+    )
+    worker_1 = CapellaConsoleClient(email="MOCK_EMAIL", password="MOCK_PW", credential_cache=credential_cache)
+    worker_2 = CapellaConsoleClient(email="MOCK_EMAIL", password="MOCK_PW", credential_cache=credential_cache)
+
+    worker_1._sesh.perform_token_refresh()
+    refreshed = post_mock_responses("/token/refresh")
+    assert credential_cache.load(worker_1._sesh._credential_key).access_token == refreshed["accessToken"]
+
+    # picks up token refreshed by worker_1 instead of refreshing again
+    worker_2._sesh.perform_token_refresh()
+    assert worker_2._sesh.headers["Authorization"] == f"Bearer {refreshed['accessToken']}"
+    assert [r.url.path for r in auth_httpx_mock.get_requests()].count("/token/refresh") == 1
+
+
+def test_eager_client_completes_user_info_cached_by_lazy_client(auth_httpx_mock: HTTPXMock, credential_cache):
+    auth_httpx_mock.add_response(url=f"{CONSOLE_API_URL}/orders/1", json={"orderId": "1"})
+    lazy_client = CapellaConsoleClient(
+        email="MOCK_EMAIL", password="MOCK_PW", credential_cache=credential_cache, lazy=True
+    )
+    lazy_client._sesh.get("/orders/1")
+    assert credential_cache.load(lazy_client._sesh._credential_key).customer_id is None
+
+    client = CapellaConsoleClient(email="MOCK_EMAIL", password="MOCK_PW", credential_cache=credential_cache)
+
+    assert [r.url.path for r in auth_httpx_mock.get_requests()] == ["/token", "/orders/1", "/user"]
+    assert client._sesh.customer_id == get_mock_responses("/user")["id"]
+    assert client._sesh.organization_id == get_mock_responses("/user")["organizationId"]
+    # completed entry written back
+    assert credential_cache.load(client._sesh._credential_key).customer_id == get_mock_responses("/user")["id"]
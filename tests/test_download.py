@@ -2,6 +2,8 @@
 
 """Tests for `capella_console_client` package."""
 
+import os
+import re
 import tempfile
 from pathlib import Path
 
@@ -11,12 +13,16 @@ from pytest_httpx import HTTPXMock
 
 from capella_console_client.config import CONSOLE_API_URL
 from capella_console_client import CapellaConsoleClient
+from capella_console_client import assets as capella_assets_module
 from .test_data import (
     get_mock_responses,
+    post_mock_responses,
     create_mock_asset_hrefs,
     DUMMY_STAC_IDS,
 )
-from capella_console_client.exceptions import ConnectError
+from capella_console_client.exceptions import ConnectError, NoValidStacIdsError
+from .conftest import mock_content_callback
+from capella_console_client.pipeline import DownloadPipeline
 
 MOCK_ASSETS_PRESIGNED = create_mock_asset_hrefs()
 MOCK_ASSET_HREF = MOCK_ASSETS_PRESIGNED["HH"]["href"]
@@ -330,6 +336,159 @@ def test_download_products_for_collect_id(verbose_download_multiple_client, auth
         _shared_dl_asserts(paths_by_stac_id_and_key, temp_dir)
 
 
+def test_download_products_for_collect_id_pipelined(test_client, auth_httpx_mock, disable_validate_uuid):
+    auth_httpx_mock.add_response(
+        url=f"{CONSOLE_API_URL}/catalog/search",
+        json={"features": [{"id": DUMMY_STAC_IDS[0], "collection": "capella-test"}], "numberMatched": 1},
+    )
+    auth_httpx_mock.add_response(url=f"{CONSOLE_API_URL}/orders?customerId=MOCK_ID", json=[])
+    auth_httpx_mock.add_response(
+        url=f"{CONSOLE_API_URL}/orders/review", json=get_mock_responses("/orders/review_success")
+    )
+    auth_httpx_mock.add_response(url=f"{CONSOLE_API_URL}/orders", json=post_mock_responses("/submitOrder"))
+    auth_httpx_mock.add_response(
+        url=f"{CONSOLE_API_URL}/orders/1/download", json=get_mock_responses("/orders/1/download")
+    )
+    # fresh response per request as assets are downloaded concurrently
+    auth_httpx_mock.add_callback(lambda request: httpx.Response(200, text="MOCK_CONTENT"))
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_dir = Path(temp_dir)
+        paths_by_stac_id_and_key = test_client.download_products(collect_id="abc", local_dir=temp_dir)
+
+        assert list(paths_by_stac_id_and_key) == [DUMMY_STAC_IDS[0]]
+        paths = list(paths_by_stac_id_and_key[DUMMY_STAC_IDS[0]].values())
+        assert len(paths) == 2
+        assert all([p.read_text() == "MOCK_CONTENT" for p in paths])
+
+
+def _asset_requests(httpx_mock: HTTPXMock):
+    return [r for r in httpx_mock.get_requests() if not str(r.url).startswith(CONSOLE_API_URL)]
+
+
+def test_product_download_threaded_rerun_no_requests(test_client, auth_httpx_mock):
+    auth_httpx_mock.add_callback(lambda request: httpx.Response(200, text="MOCK_CONTENT"))
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_dir = Path(temp_dir)
+        test_client.download_product(MOCK_ASSETS_PRESIGNED, local_dir=temp_dir, threaded=True)
+        num_asset_requests = len(_asset_requests(auth_httpx_mock))
+
+        paths_by_key = test_client.download_product(MOCK_ASSETS_PRESIGNED, local_dir=temp_dir, threaded=True)
+        assert all([p.read_text() == "MOCK_CONTENT" for p in paths_by_key.values()])
+        assert len(_asset_requests(auth_httpx_mock)) == num_asset_requests
+
+
+def test_download_products_for_collect_id_pipelined_rerun_no_requests(
+    test_client, auth_httpx_mock, disable_validate_uuid
+):
+    auth_httpx_mock.add_response(
+        url=f"{CONSOLE_API_URL}/catalog/search",
+        json={"features": [{"id": DUMMY_STAC_IDS[0], "collection": "capella-test"}], "numberMatched": 1},
+    )
+    auth_httpx_mock.add_response(url=f"{CONSOLE_API_URL}/orders?customerId=MOCK_ID", json=[])
+    auth_httpx_mock.add_response(
+        url=f"{CONSOLE_API_URL}/orders/review", json=get_mock_responses("/orders/review_success")
+    )
+    auth_httpx_mock.add_response(url=f"{CONSOLE_API_URL}/orders", json=post_mock_responses("/submitOrder"))
+    auth_httpx_mock.add_response(
+        url=f"{CONSOLE_API_URL}/orders/1/download", json=get_mock_responses("/orders/1/download")
+    )
+    auth_httpx_mock.add_callback(
+        lambda request: httpx.Response(200, text="MOCK_CONTENT"),
+        url=re.compile(r"https://test-data\.capellaspace\.com/.*"),
+    )
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_dir = Path(temp_dir)
+        test_client.download_products(collect_id="abc", local_dir=temp_dir)
+        num_asset_requests = len(_asset_requests(auth_httpx_mock))
+
+        test_client.download_products(collect_id="abc", local_dir=temp_dir)
+        assert len(_asset_requests(auth_httpx_mock)) == num_asset_requests
+
+
+def test_download_products_for_collect_id_nothing_found(test_client, auth_httpx_mock, disable_validate_uuid):
+    auth_httpx_mock.add_response(
+        url=f"{CONSOLE_API_URL}/catalog/search",
+        json={"features": [], "numberMatched": 0},
+    )
+
+    with pytest.raises(NoValidStacIdsError):
+        test_client.download_products(collect_id="abc")
+
+
+def test_download_pipeline_orders_in_chunks(test_client, monkeypatch):
+    searched = []
+
+    def _search_and_order(self, collect_ids):
+        searched.append(collect_ids)
+        self._product_cnt += 1
+        return [MOCK_ASSETS_PRESIGNED]
+
+    monkeypatch.setattr(DownloadPipeline, "_search_and_order", _search_and_order)
+    monkeypatch.setattr("capella_console_client.pipeline._probe_sizes", lambda download_requests, **kw: None)
+    monkeypatch.setattr("capella_console_client.pipeline._download_assets", lambda unit, **kw: [])
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        pipeline = DownloadPipeline(test_client, local_dir=Path(temp_dir), collects_per_order=2, queue_size=1)
+        paths_by_stac_id_and_key = pipeline.run(["c1", "c2", "c3"])
+
+    assert searched == [["c1", "c2"], ["c3"]]
+    assert list(paths_by_stac_id_and_key) == [DUMMY_STAC_IDS[0]]
+
+
+def test_download_pipeline_propagates_order_stage_error(test_client, monkeypatch):
+    def _search_and_order(self, collect_ids):
+        raise NoValidStacIdsError("MOCK_ERROR")
+
+    monkeypatch.setattr(DownloadPipeline, "_search_and_order", _search_and_order)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        pipeline = DownloadPipeline(test_client, local_dir=Path(temp_dir))
+        with pytest.raises(NoValidStacIdsError):
+            pipeline.run(["c1"])
+
+
+def test_download_large_chunks(test_client, auth_httpx_mock, monkeypatch):
+    monkeypatch.setenv("CAPELLA_DOWNLOAD_CHUNK_SIZE", "4")
+    auth_httpx_mock.add_response(text="MOCK_CONTENT", headers={"Content-Length": "12"})
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        local_path = test_client.download_asset(MOCK_ASSET_HREF, local_path=Path(temp_dir) / "asset.png")
+        assert local_path.read_text() == "MOCK_CONTENT"
+        assert list(Path(temp_dir).iterdir()) == [local_path]
+
+
+def test_download_chunks_written_from_reused_buffer(test_client, auth_httpx_mock, monkeypatch):
+    monkeypatch.setenv("CAPELLA_DOWNLOAD_CHUNK_SIZE", "5")
+    auth_httpx_mock.add_response(text="MOCK_CONTENT", headers={"Content-Length": "12"})
+
+    written = []
+
+    def record_write(fd, chunk):
+        written.append((id(chunk.obj), bytes(chunk)))
+        return os.write(fd, chunk)
+
+    monkeypatch.setattr(capella_assets_module, "_write_all", record_write)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        local_path = test_client.download_asset(MOCK_ASSET_HREF, local_path=Path(temp_dir) / "asset.png", verify=True)
+        assert local_path.read_text() == "MOCK_CONTENT"
+
+    assert [chunk for _, chunk in written] == [b"MOCK_", b"CONTE", b"NT"]
+    assert len({buffer_id for buffer_id, _ in written}) == 1
+
+
+def test_download_truncated_response_not_preallocated(test_client, auth_httpx_mock):
+    # announced size larger than actual content
+    auth_httpx_mock.add_response(text="MOCK_CONTENT", headers={"Content-Length": "12700"})
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        local_path = test_client.download_asset(MOCK_ASSET_HREF, local_path=Path(temp_dir) / "asset.png")
+        assert local_path.stat().st_size == len("MOCK_CONTENT")
+
+
 def test_download_products_with_product_types_filter(download_client):
 
     with tempfile.TemporaryDirectory() as temp_dir:
@@ -376,3 +535,34 @@ def test_get_asset_bytesize_raises(test_client, auth_httpx_mock: HTTPXMock):
 
     with pytest.raises(ConnectError):
         test_client.get_asset_bytesize(MOCK_ASSET_HREF)
+
+
+def test_download_asset_retries_connect_error(test_client, auth_httpx_mock: HTTPXMock, no_retry_delay):
+    requests = []
+
+    def connect_error_once(request):
+        requests.append(request)
+        # 1st: size probe, 2nd: download
+        if len(requests) == 2:
+            raise httpx.ConnectError("NO CONNECTION")
+        return mock_content_callback()(request)
+
+    auth_httpx_mock.add_callback(connect_error_once)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        local_path = test_client.download_asset(pre_signed_url=MOCK_ASSET_HREF, local_path=Path(temp_dir) / "asset.tif")
+        assert local_path.read_text() == "MOCK_CONTENT"
+
+    assert len(requests) == 3
+    assert len(no_retry_delay) == 1
+
+
+def test_download_asset_connect_error_after_retries(test_client, auth_httpx_mock: HTTPXMock, no_retry_delay):
+    def raise_connection_error(request):
+        raise httpx.ConnectError("NO CONNECTION")
+
+    auth_httpx_mock.add_callback(raise_connection_error)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        with pytest.raises(ConnectError):
+            test_client.download_asset(pre_signed_url=MOCK_ASSET_HREF, local_path=Path(temp_dir) / "asset.tif")
@@ -0,0 +1,151 @@
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from capella_console_client.config import CONSOLE_API_URL
+from capella_console_client.exceptions import AuthenticationError, INVALID_TOKEN_ERROR_CODE
+from capella_console_client.instrumentation import (
+    Instrumentation,
+    PrometheusMetrics,
+    OpenTelemetrySpans,
+    RequestMetrics,
+    set_instrumentation,
+    get_instrumentation,
+)
+from .test_data import create_mock_asset_hrefs
+
+MOCK_ASSET_HREF = create_mock_asset_hrefs()["HH"]["href"]
+
+
+class Recorder(Instrumentation):
+    def __init__(self):
+        self.requests = []
+        self.retries = []
+
+    def on_request(self, metrics):
+        self.requests.append(metrics)
+
+    def on_retry(self, endpoint, attempt, delay):
+        self.retries.append((endpoint, attempt))
+
+
+@pytest.fixture
+def recorder():
+    recorder = Recorder()
+    set_instrumentation(recorder)
+    yield recorder
+    set_instrumentation(None)
+
+
+def test_default_instrumentation_noop():
+    assert type(get_instrumentation()) is Instrumentation
+
+
+def test_session_request_metrics(test_client, auth_httpx_mock, recorder):
+    auth_httpx_mock.add_response(url=f"{CONSOLE_API_URL}/orders/42", json={"orderId": "42"})
+
+    test_client._sesh.get("/orders/42")
+
+    metrics = recorder.requests[-1]
+    assert (metrics.kind, metrics.method, metrics.endpoint, metrics.status) == (
+        "api",
+        "GET",
+        "api.capellaspace.com/orders/{id}",
+        200,
+    )
+    assert metrics.num_bytes > 0
+    assert metrics.duration >= 0
+    assert metrics.retries == 0
+
+
+def test_session_request_metrics_error(test_client, auth_httpx_mock, recorder):
+    auth_httpx_mock.add_response(url=f"{CONSOLE_API_URL}/orders", status_code=500, json={"error": {"message": "x"}})
+
+    with pytest.raises(Exception):
+        test_client._sesh.post("/orders", json={})
+
+    metrics = recorder.requests[-1]
+    assert metrics.status == 500
+    assert metrics.error == "CapellaConsoleClientError"
+
+
+def test_session_instrumentation_override(auth_httpx_mock, recorder):
+    from capella_console_client import CapellaConsoleClient
+
+    own = Recorder()
+    CapellaConsoleClient(email="MOCK_EMAIL", password="MOCK_PW", instrumentation=own)
+
+    assert [m.endpoint for m in own.requests] == ["api.capellaspace.com/token", "api.capellaspace.com/user"]
+    assert recorder.requests == []
+
+
+def test_session_token_refresh_counted(refresh_token_client, auth_httpx_mock, recorder):
+    def raise_invalid_token(request):
+        raise AuthenticationError(code=INVALID_TOKEN_ERROR_CODE)
+
+    auth_httpx_mock.add_callback(raise_invalid_token)
+
+    with pytest.raises(AuthenticationError):
+        refresh_token_client._sesh.get("/this-route-does-not-exist")
+
+    assert recorder.requests[-1].token_refreshes == 1
+    assert recorder.requests[-1].error == "AuthenticationError"
+
+
+def test_download_metrics(download_client, recorder):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        download_client.download_asset(pre_signed_url=MOCK_ASSET_HREF, local_path=Path(tmp_dir) / "asset.tif")
+
+    metrics = recorder.requests[-1]
+    assert (metrics.kind, metrics.endpoint, metrics.status, metrics.num_bytes) == (
+        "download",
+        "test-data.capellaspace.com",
+        200,
+        len("MOCK_CONTENT"),
+    )
+
+
+def test_prometheus_render():
+    prom = PrometheusMetrics(buckets=(0.1, 1))
+    prom.on_request(RequestMetrics("api", "GET", "api/orders", duration=0.05, status=200, num_bytes=10))
+    prom.on_request(RequestMetrics("api", "GET", "api/orders", duration=0.5, status=503, token_refreshes=1))
+    prom.on_retry("GET api/orders", 1, 0.5)
+
+    text = prom.render()
+    assert 'capella_requests_total{kind="api",method="GET",endpoint="api/orders",status="200"} 1' in text
+    assert 'capella_requests_total{kind="api",method="GET",endpoint="api/orders",status="503"} 1' in text
+    assert 'capella_response_bytes_total{kind="api",method="GET",endpoint="api/orders"} 10' in text
+    assert 'capella_retries_total{endpoint="GET api/orders"} 1' in text
+    assert "capella_token_refreshes_total 1" in text
+    assert 'capella_request_duration_seconds_bucket{kind="api",method="GET",endpoint="api/orders",le="0.1"} 1' in text
+    assert 'capella_request_duration_seconds_bucket{kind="api",method="GET",endpoint="api/orders",le="1"} 2' in text
+    assert 'capella_request_duration_seconds_count{kind="api",method="GET",endpoint="api/orders"} 2' in text
+
+
+class FakeSpan:
+    def __init__(self, name, start_time, attributes):
+        self.name, self.start_time, self.attributes = name, start_time, attributes
+        self.end_time = None
+
+    def end(self, end_time=None):
+        self.end_time = end_time
+
+
+class FakeTracer:
+    def __init__(self):
+        self.spans = []
+
+    def start_span(self, name, start_time=None, attributes=None):
+        self.spans.append(FakeSpan(name, start_time, attributes))
+        return self.spans[-1]
+
+
+def test_opentelemetry_spans():
+    tracer = FakeTracer()
+    OpenTelemetrySpans(tracer).on_request(RequestMetrics("api", "GET", "api/user", start=1, duration=0.5, status=200))
+
+    span = tracer.spans[0]
+    assert span.name == "GET api/user"
+    assert (span.start_time, span.end_time) == (1_000_000_000, 1_500_000_000)
+    assert span.attributes["http.status_code"] == 200
@@ -0,0 +1,116 @@
+import hashlib
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from capella_console_client.exceptions import ChecksumMismatchError
+from capella_console_client import integrity
+from capella_console_client.integrity import DownloadManifest, _md5_from_etag
+from .test_data import create_mock_asset_hrefs
+
+MOCK_ASSET_HREF = create_mock_asset_hrefs()["HH"]["href"]
+MOCK_CONTENT_MD5 = hashlib.md5(b"MOCK_CONTENT").hexdigest()
+
+
+@pytest.fixture
+def local_path():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yield Path(temp_dir) / "asset.tif"
+
+
+@pytest.mark.parametrize(
+    "etag,expected",
+    [
+        (f'"{MOCK_CONTENT_MD5}"', MOCK_CONTENT_MD5),
+        (f'"{MOCK_CONTENT_MD5}-3"', None),
+        (f'W/"{MOCK_CONTENT_MD5}"', None),
+        (None, None),
+    ],
+)
+def test_md5_from_etag(etag, expected):
+    assert _md5_from_etag(etag) == expected
+
+
+def test_verified_download_records_manifest(test_client, auth_httpx_mock, local_path):
+    auth_httpx_mock.add_response(text="MOCK_CONTENT", headers={"Content-Length": "12", "ETag": f'"{MOCK_CONTENT_MD5}"'})
+    test_client.download_asset(MOCK_ASSET_HREF, local_path=local_path, verify=True)
+
+    assert local_path.read_text() == "MOCK_CONTENT"
+    assert DownloadManifest.get(local_path) == {
+        "size": 12,
+        "md5": MOCK_CONTENT_MD5,
+        "etag": f'"{MOCK_CONTENT_MD5}"',
+        "mtime_ns": local_path.stat().st_mtime_ns,
+    }
+    assert DownloadManifest.is_verified(local_path)
+
+    cnt_requests = len(auth_httpx_mock.get_requests())
+    test_client.download_asset(MOCK_ASSET_HREF, local_path=local_path, verify=True)
+    assert len(auth_httpx_mock.get_requests()) == cnt_requests
+
+
+def test_verified_download_checksum_mismatch(test_client, auth_httpx_mock, local_path):
+    auth_httpx_mock.add_response(text="MOCK_CONTENT", headers={"Content-Length": "12", "ETag": f'"{"0" * 32}"'})
+
+    with pytest.raises(ChecksumMismatchError):
+        test_client.download_asset(MOCK_ASSET_HREF, local_path=local_path, verify=True)
+
+    # no partial files left behind
+    assert list(local_path.parent.iterdir()) == []
+
+
+def test_verified_download_size_mismatch(test_client, auth_httpx_mock, local_path):
+    auth_httpx_mock.add_response(text="MOCK_CONTENT", headers={"Content-Length": "127"})
+
+    with pytest.raises(ChecksumMismatchError):
+        test_client.download_asset(MOCK_ASSET_HREF, local_path=local_path, verify=True)
+
+
+def test_verified_download_redownloads_unverified(test_client, auth_httpx_mock, local_path):
+    auth_httpx_mock.add_response(text="MOCK_CONTENT", headers={"Content-Length": "12"})
+    local_path.write_text("MOCK_PARTI")
+
+    test_client.download_asset(MOCK_ASSET_HREF, local_path=local_path, verify=True)
+    assert local_path.read_text() == "MOCK_CONTENT"
+
+    # corrupted after verification
+    local_path.write_text("MOCK_CONTENX")
+    assert not DownloadManifest.is_verified(local_path)
+    test_client.download_asset(MOCK_ASSET_HREF, local_path=local_path, verify=True)
+    assert local_path.read_text() == "MOCK_CONTENT"
+
+
+def test_is_verified_rehashes_only_if_modified(local_path, monkeypatch):
+    local_path.write_text("MOCK_CONTENT")
+    DownloadManifest.record(local_path, 12, MOCK_CONTENT_MD5)
+    hashed = []
+    monkeypatch.setattr(integrity, "_file_md5", lambda path: hashed.append(path) or MOCK_CONTENT_MD5)
+
+    assert DownloadManifest.is_verified(local_path)
+    assert hashed == []
+
+    assert DownloadManifest.is_verified(local_path, rehash=True)
+    assert len(hashed) == 1
+
+    # touched, identical content - re-recorded
+    os.utime(local_path, ns=(0, 0))
+    assert DownloadManifest.is_verified(local_path)
+    assert DownloadManifest.is_verified(local_path)
+    assert len(hashed) == 2
+
+
+def _record(local_path: Path) -> None:
+    local_path.write_text("MOCK_CONTENT")
+    DownloadManifest.record(local_path, 12, MOCK_CONTENT_MD5)
+
+
+def test_concurrent_processes_record(local_path):
+    paths = [local_path.with_name(f"{i}.tif") for i in range(16)]
+
+    with ProcessPoolExecutor(max_workers=4) as executor:
+        list(executor.map(_record, paths))
+
+    assert all(DownloadManifest.get(path) for path in paths)
@@ -0,0 +1,110 @@
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from capella_console_client.assets import DownloadRequest
+from capella_console_client.enumerations import DownloadState
+from capella_console_client.exceptions import AuthenticationError
+from capella_console_client.job_manifest import JobManifest
+from .test_data import create_mock_asset_hrefs, DUMMY_STAC_IDS
+
+MOCK_ASSETS_PRESIGNED = create_mock_asset_hrefs()
+
+
+@pytest.fixture
+def temp_dir():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yield Path(temp_dir)
+
+
+def _dl_request(local_dir: Path, asset_key: str = "HH") -> DownloadRequest:
+    return DownloadRequest(
+        url=MOCK_ASSETS_PRESIGNED["HH"]["href"],
+        local_path=local_dir / f"{asset_key}.png",
+        asset_key=asset_key,
+        stac_id=DUMMY_STAC_IDS[0],
+    )
+
+
+def test_manifest_states(temp_dir):
+    manifest = JobManifest(temp_dir / "manifest.sqlite")
+    hh, vv = _dl_request(temp_dir, "HH"), _dl_request(temp_dir, "VV")
+    manifest.add([hh, vv])
+
+    manifest.mark_in_flight(hh)
+    hh.local_path.write_text("MOCK_CONTENT")
+    manifest.mark_done(hh)
+    manifest.mark_failed(vv, ValueError("MOCK_ERROR"))
+
+    assert manifest.counts() == {"pending": 0, "in_flight": 0, "done": 1, "failed": 1}
+    assert manifest.is_done(hh)
+    assert [cur.asset_key for cur in manifest.unfinished()] == ["VV"]
+
+
+def test_manifest_add_keeps_state(temp_dir):
+    manifest = JobManifest(temp_dir / "manifest.sqlite")
+    hh = _dl_request(temp_dir)
+    manifest.add([hh])
+    hh.local_path.write_text("MOCK_CONTENT")
+    manifest.mark_done(hh)
+
+    manifest.add([hh])
+    assert manifest.counts()[DownloadState.done] == 1
+
+
+def test_manifest_done_with_changed_file_unfinished(temp_dir):
+    manifest = JobManifest(temp_dir / "manifest.sqlite")
+    hh = _dl_request(temp_dir)
+    manifest.add([hh])
+    hh.local_path.write_text("MOCK_CONTENT")
+    manifest.mark_done(hh)
+
+    hh.local_path.write_text("TRUNCATED")
+    assert not manifest.is_done(hh)
+    assert len(manifest.unfinished()) == 1
+
+
+def test_download_products_manifest_and_resume(download_client, auth_httpx_mock, temp_dir):
+    manifest_path = temp_dir / "manifest.sqlite"
+    paths = download_client.download_products(
+        assets_presigned=[MOCK_ASSETS_PRESIGNED], local_dir=temp_dir, manifest=manifest_path
+    )
+
+    manifest = JobManifest(manifest_path)
+    assert manifest.counts()["done"] == 2
+
+    # nothing to resume
+    cnt_requests = len(auth_httpx_mock.get_requests())
+    assert download_client.resume_downloads(manifest_path) == {}
+    assert len(auth_httpx_mock.get_requests()) == cnt_requests
+
+    # resume after file vanished
+    paths[DUMMY_STAC_IDS[0]]["HH"].unlink()
+    resumed = download_client.resume_downloads(manifest)
+    assert list(resumed[DUMMY_STAC_IDS[0]]) == ["HH"]
+    assert paths[DUMMY_STAC_IDS[0]]["HH"].read_text() == "MOCK_CONTENT"
+    assert manifest.counts()["done"] == 2
+
+
+def test_cli_resume_without_credentials(httpx_mock, temp_dir, monkeypatch):
+    pytest.importorskip("typer")
+    from typer.testing import CliRunner
+    from capella_console_client.cli import client_singleton
+    from capella_console_client.cli.wizard import app
+
+    class ExpiredClient:
+        def resume_downloads(self, *args, **kwargs):
+            raise AuthenticationError("MOCK_EXPIRED")
+
+    monkeypatch.setattr(client_singleton, "_client", ExpiredClient())
+    httpx_mock.add_response(url=MOCK_ASSETS_PRESIGNED["HH"]["href"], text="MOCK_CONTENT")
+    manifest = JobManifest(temp_dir / "manifest.sqlite")
+    manifest.add([_dl_request(temp_dir)])
+
+    result = CliRunner().invoke(app, ["downloads", "resume", str(manifest.path), "--no-show-progress"])
+
+    assert result.exit_code == 0, result.output
+    assert (temp_dir / "HH.png").read_text() == "MOCK_CONTENT"
+    # presigned url only - no authentication requests
+    assert {r.url.host for r in httpx_mock.get_requests()} == {"test-data.capellaspace.com"}
@@ -5,9 +5,11 @@ import pytest
 from capella_console_client.config import CONSOLE_API_URL
 from capella_console_client import client as capella_client_module
 from capella_console_client.exceptions import (
+    CapellaConsoleClientError,
     NoValidStacIdsError,
     OrderRejectedError,
     InsufficientFundsError,
+    PartialResultError,
 )
 from .test_data import (
     post_mock_responses,
@@ -25,6 +27,40 @@ def test_list_specific_order(test_client, auth_httpx_mock):
     assert order == get_mock_responses("/orders")
 
 
+def test_list_specific_orders_keeps_order(test_client, auth_httpx_mock, disable_validate_uuid):
+    for order_id in ("1", "2", "3"):
+        auth_httpx_mock.add_response(url=f"{CONSOLE_API_URL}/orders/{order_id}", json={"orderId": order_id})
+
+    orders = test_client.list_orders("3", "1", "2", max_workers=2)
+    assert [o["orderId"] for o in orders] == ["3", "1", "2"]
+
+
+def test_list_specific_orders_partial_error(test_client, auth_httpx_mock, disable_validate_uuid):
+    auth_httpx_mock.add_response(url=f"{CONSOLE_API_URL}/orders/1", json={"orderId": "1"})
+    auth_httpx_mock.add_response(
+        url=f"{CONSOLE_API_URL}/orders/2", status_code=500, json={"error": {"message": "MOCK_ERROR"}}
+    )
+
+    with pytest.raises(PartialResultError) as excinfo:
+        test_client.list_orders("1", "2")
+    assert excinfo.value.data["results"] == [{"orderId": "1"}]
+    assert list(excinfo.value.data["errors"]) == ["2"]
+
+    orders = test_client.list_orders("1", "2", raise_on_error=False)
+    assert orders == [{"orderId": "1"}]
+
+
+def test_list_single_order_error_reraises_original(test_client, auth_httpx_mock, disable_validate_uuid):
+    auth_httpx_mock.add_response(
+        url=f"{CONSOLE_API_URL}/orders/1", status_code=500, json={"error": {"message": "MOCK_ERROR"}}
+    )
+
+    with pytest.raises(CapellaConsoleClientError) as excinfo:
+        test_client.list_orders("1")
+    assert not isinstance(excinfo.value, PartialResultError)
+    assert excinfo.value.message == "MOCK_ERROR"
+
+
 def test_list_all_orders(order_client):
     orders = order_client.list_orders()
     assert orders == get_mock_responses("/orders")
@@ -0,0 +1,97 @@
+import io
+import json
+import tempfile
+from pathlib import Path
+
+from capella_console_client.assets import DownloadRequest
+from capella_console_client.progress import DownloadProgress, JsonProgressSink, _open_progress
+from .test_data import create_mock_asset_hrefs
+
+MOCK_ASSET_HREF = create_mock_asset_hrefs()["HH"]["href"]
+
+
+def test_progress_disabled():
+    with _open_progress(show_progress=False, callback=None) as progress:
+        assert progress is None
+
+
+def test_progress_sample_reports_changes_only():
+    events = []
+    progress = DownloadProgress(callback=events.append)
+    counter = progress.register(DownloadRequest(url=MOCK_ASSET_HREF, local_path=Path("a.tif"), asset_key="HH"), 10)
+
+    progress.sample()
+    progress.sample()
+    counter.completed += 4
+    progress.sample()
+    counter.completed += 6
+    counter.done = True
+    progress.sample()
+
+    assert [(e["event"], e["completed"], e["total"]) for e in events] == [
+        ("progress", 0, 10),
+        ("progress", 4, 10),
+        ("done", 10, 10),
+    ]
+
+
+def test_json_progress_sink():
+    stream = io.StringIO()
+    JsonProgressSink(stream)({"event": "done", "completed": 12})
+
+    event = json.loads(stream.getvalue())
+    assert event["event"] == "done"
+    assert event["completed"] == 12
+
+
+def test_asset_download_progress_callback(download_client):
+    events = []
+    local_path = Path(tempfile.NamedTemporaryFile().name)
+    download_client.download_asset(
+        pre_signed_url=MOCK_ASSET_HREF, local_path=local_path, progress_callback=events.append
+    )
+
+    assert events[-1]["event"] == "done"
+    assert events[-1]["completed"] == len("MOCK_CONTENT")
+    assert events[-1]["local_path"] == str(local_path)
+    local_path.unlink()
+
+
+def _register(progress, name, total=10):
+    return progress.register(DownloadRequest(url=MOCK_ASSET_HREF, local_path=Path(name), asset_key="HH"), total)
+
+
+def test_progress_drops_finished_downloads():
+    events = []
+    progress = DownloadProgress(show_progress=True, callback=events.append)
+    first, second = _register(progress, "a.tif"), _register(progress, "b.tif")
+    progress.sample()
+    assert len(progress.progress_bar.tasks) == 2
+
+    first.completed, first.done = 10, True
+    progress.sample()
+
+    assert progress._counters == [second]
+    assert [task.fields["filename"] for task in progress.progress_bar.tasks] == ["b.tif"]
+    assert (progress.num_done, progress.bytes_done) == (1, 10)
+    assert events[-1]["event"] == "done"
+
+    progress.discard(second)
+    progress.sample()
+    assert progress._counters == []
+    assert progress.progress_bar.tasks == []
+    assert (progress.num_done, progress.bytes_done, progress.num_failed) == (1, 10, 1)
+    assert events[-1]["event"] == "failed"
+
+
+def test_progress_discard_during_sample():
+    progress = DownloadProgress(show_progress=True)
+    first, second = _register(progress, "a.tif"), _register(progress, "b.tif")
+
+    # worker fails `second` after renderer took its snapshot
+    progress.callback = lambda event: progress.discard(second) if event["local_path"] == "a.tif" else None
+    progress.sample()
+    progress.sample()
+
+    assert progress._counters == [first]
+    assert [task.fields["filename"] for task in progress.progress_bar.tasks] == ["a.tif"]
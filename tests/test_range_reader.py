@@ -0,0 +1,112 @@
+import io
+import re
+
+import httpx
+import pytest
+
+from capella_console_client.range_reader import RangeReader, _missing_runs
+from .test_data import create_mock_asset_hrefs
+
+MOCK_ASSET_HREF = create_mock_asset_hrefs()["HH"]["href"]
+MOCK_CONTENT = bytes(range(256)) * 40
+
+
+def _range_response(request: httpx.Request) -> httpx.Response:
+    match = re.match(r"bytes=(\d+)-(\d+)", request.headers["Range"])
+    start, end = int(match.group(1)), min(int(match.group(2)), len(MOCK_CONTENT) - 1)
+    return httpx.Response(
+        206,
+        content=MOCK_CONTENT[start : end + 1],
+        headers={"Content-Range": f"bytes {start}-{end}/{len(MOCK_CONTENT)}"},
+    )
+
+
+@pytest.fixture
+def range_client(test_client, auth_httpx_mock):
+    auth_httpx_mock.add_callback(_range_response)
+    yield test_client
+
+
+def test_random_access_reads(range_client):
+    with range_client.open_asset_ranged(MOCK_ASSET_HREF, block_size=100, read_ahead=0) as f:
+        assert f.size == len(MOCK_CONTENT)
+
+        f.seek(5000)
+        assert f.read(250) == MOCK_CONTENT[5000:5250]
+
+        f.seek(-10, io.SEEK_END)
+        assert f.read() == MOCK_CONTENT[-10:]
+        assert f.read(1) == b""
+
+        # only first block, 5000-5299 and last block transferred
+        assert f.bytes_fetched == 100 + 300 + 40
+
+
+def test_cached_blocks_not_fetched_again(range_client):
+    with range_client.open_asset_ranged(MOCK_ASSET_HREF, block_size=100, read_ahead=0) as f:
+        f.seek(1000)
+        f.read(100)
+        num_requests = f.num_requests
+
+        f.seek(1010)
+        assert f.read(50) == MOCK_CONTENT[1010:1060]
+        assert f.num_requests == num_requests
+
+
+def test_sequential_read_ahead(range_client):
+    with range_client.open_asset_ranged(MOCK_ASSET_HREF, block_size=100, read_ahead=4) as f:
+        assert f.read(100) == MOCK_CONTENT[:100]
+        # second block sequential miss -> fetches 1..5 in a single request
+        assert f.read(100) == MOCK_CONTENT[100:200]
+        num_requests = f.num_requests
+        assert f.read(400) == MOCK_CONTENT[200:600]
+        assert f.num_requests == num_requests
+
+
+def test_lru_eviction(range_client):
+    with range_client.open_asset_ranged(MOCK_ASSET_HREF, block_size=100, cache_blocks=2, read_ahead=0) as f:
+        for offset in (1000, 2000, 3000):
+            f.seek(offset)
+            assert f.read(10) == MOCK_CONTENT[offset : offset + 10]
+        assert len(f._cache) == 2
+        assert 10 not in f._cache
+
+
+def test_partly_cached_span_not_evicted(range_client):
+    with range_client.open_asset_ranged(MOCK_ASSET_HREF, block_size=100, cache_blocks=3, read_ahead=0) as f:
+        for offset in (500, 900, 0):
+            f.seek(offset)
+            assert f.read(1) == MOCK_CONTENT[offset : offset + 1]
+
+        # block 5 cached, 6-7 missing and fetched while cache is full
+        f.seek(500)
+        assert f.read(250) == MOCK_CONTENT[500:750]
+        assert sorted(f._cache) == [5, 6, 7]
+
+
+def test_range_not_supported(test_client, auth_httpx_mock):
+    auth_httpx_mock.add_response(content=MOCK_CONTENT)
+    with RangeReader(MOCK_ASSET_HREF, block_size=100) as f:
+        f.seek(7000)
+        assert f.read(10) == MOCK_CONTENT[7000:7010]
+        assert f.num_requests == 1
+
+
+def test_missing_runs():
+    assert _missing_runs([1, 2, 3, 5, 7, 8]) == [(1, 3), (5, 5), (7, 8)]
+
+
+def test_connect_error_retried(test_client, auth_httpx_mock, no_retry_delay):
+    requests = []
+
+    def connect_error_once(request):
+        requests.append(request)
+        if len(requests) == 1:
+            raise httpx.ConnectError("NO CONNECTION")
+        return _range_response(request)
+
+    auth_httpx_mock.add_callback(connect_error_once)
+
+    with test_client.open_asset_ranged(MOCK_ASSET_HREF, block_size=100, read_ahead=0) as f:
+        assert f.read(10) == MOCK_CONTENT[:10]
+    assert len(no_retry_delay) == 1
@@ -1,3 +1,8 @@
+import base64
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 import httpx
 
@@ -14,6 +19,7 @@ from capella_console_client.exceptions import (
     NoRefreshTokenError,
 )
 from capella_console_client import CapellaConsoleClient
+from capella_console_client.session import _jwt_expiry
 
 
 def test_refresh_token(refresh_token_client):
@@ -81,3 +87,100 @@ def test_no_refresh_token_provided():
 
     with pytest.raises(NoRefreshTokenError):
         client._sesh.perform_token_refresh()
+
+
+def _jwt(exp: float) -> str:
+    def _b64(payload):
+        return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
+
+    return f"{_b64({'alg': 'HS256'})}.{_b64({'exp': exp, 'sub': 'MOCK_ID'})}.MOCK_SIGNATURE"
+
+
+def test_jwt_expiry():
+    assert _jwt_expiry(f"Bearer {_jwt(1234)}") == 1234
+    assert _jwt_expiry("MOCK_TOKEN") is None
+    assert _jwt_expiry("a.b.c") is None
+
+
+def test_proactive_refresh_before_expiry(refresh_token_client, auth_httpx_mock: HTTPXMock):
+    sesh = refresh_token_client._sesh
+    sesh._set_auth_header(_jwt(time.time() + 30))
+    auth_httpx_mock.add_response(url=f"{CONSOLE_API_URL}/orders", json=[])
+
+    sesh.get("/orders")
+
+    requests = auth_httpx_mock.get_requests()
+    assert [r.url.path for r in requests[-2:]] == ["/token/refresh", "/orders"]
+    assert requests[-1].headers["Authorization"] == f"Bearer {post_mock_responses('/token/refresh')['accessToken']}"
+
+
+def test_no_proactive_refresh_if_not_expiring(refresh_token_client, auth_httpx_mock: HTTPXMock):
+    sesh = refresh_token_client._sesh
+    sesh._set_auth_header(_jwt(time.time() + 3600))
+    auth_httpx_mock.add_response(url=f"{CONSOLE_API_URL}/orders", json=[])
+
+    sesh.get("/orders")
+    assert "/token/refresh" not in [r.url.path for r in auth_httpx_mock.get_requests()]
+
+
+def test_proactive_refresh_single_flight(refresh_token_client, auth_httpx_mock: HTTPXMock):
+    sesh = refresh_token_client._sesh
+    sesh._set_auth_header(_jwt(time.time() - 1))
+    # fresh response per request - shared responses can only be consumed once (concurrent requests)
+    auth_httpx_mock.add_callback(lambda request: httpx.Response(200, json=[]), url=f"{CONSOLE_API_URL}/orders")
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda _: sesh.get("/orders"), range(16)))
+
+    paths = [r.url.path for r in auth_httpx_mock.get_requests()]
+    assert paths.count("/token/refresh") == 1
+    assert paths.count("/orders") == 16
+
+
+def test_reactive_refresh_skipped_if_refreshed_concurrently(refresh_token_client, auth_httpx_mock: HTTPXMock):
+    sesh = refresh_token_client._sesh
+    sesh._set_auth_header("ALREADY_REFRESHED_TOKEN")
+
+    assert not sesh._refresh_unless_refreshed("Bearer MOCK_TOKEN")
+    assert sesh._refresh_unless_refreshed("Bearer ALREADY_REFRESHED_TOKEN")
+
+
+def test_background_refresh(refresh_token_client, auth_httpx_mock: HTTPXMock):
+    sesh = refresh_token_client._sesh
+    sesh.background_token_refresh = True
+    sesh._set_auth_header(_jwt(time.time() + sesh.token_refresh_margin + 0.05))
+
+    deadline = time.time() + 5
+    while sesh.headers["Authorization"] != "Bearer REFRESHED_MOCK_TOKEN" and time.time() < deadline:
+        time.sleep(0.01)
+
+    assert sesh.headers["Authorization"] == "Bearer REFRESHED_MOCK_TOKEN"
+    sesh.close()
+
+
+def test_credential_swap_atomic(refresh_token_client, auth_httpx_mock: HTTPXMock):
+    sesh = refresh_token_client._sesh
+    auth_httpx_mock.add_callback(lambda request: httpx.Response(200, json=[]), url=f"{CONSOLE_API_URL}/orders")
+    tokens = [f"TOKEN_{i}" for i in range(50)]
+
+    def _swap():
+        for token in tokens:
+            sesh._set_auth_header(token, refresh_token=f"REFRESH_{token}")
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        swapper = executor.submit(_swap)
+        list(executor.map(lambda _: sesh.get("/orders"), range(64)))
+        swapper.result()
+
+    valid = {"Bearer MOCK_TOKEN"} | {f"Bearer {token}" for token in tokens}
+    sent = [r.headers["Authorization"] for r in auth_httpx_mock.get_requests() if r.url.path == "/orders"]
+    assert set(sent) <= valid
+    assert sesh._credentials.refresh_token == f"REFRESH_{tokens[-1]}"
+    assert sesh.headers["Authorization"] == f"Bearer {tokens[-1]}"
+
+
+def test_connection_pool_limits():
+    client = CapellaConsoleClient(token="MOCK_TOKEN", no_token_check=True, max_connections=64)
+    pool = client._sesh._transport._pool
+    assert pool._max_connections == 64
+    assert pool._max_keepalive_connections == 64
@@ -0,0 +1,204 @@
+import pytest
+import httpx
+
+from capella_console_client.config import CONSOLE_API_URL
+from capella_console_client.exceptions import CircuitOpenError, CapellaConsoleClientError
+from capella_console_client.retry import (
+    RetryPolicy,
+    RetryEngine,
+    CircuitBreaker,
+    SESSION_RETRY_POLICY,
+    _retry_after,
+    _endpoint_template,
+)
+from .test_throttle import FakeClock
+
+
+class TransientError(Exception):
+    pass
+
+
+def _engine(clock: FakeClock, **kwargs) -> RetryEngine:
+    return RetryEngine(sleep=clock.sleep, clock=clock, **kwargs)
+
+
+def _flaky(failures: int):
+    calls = []
+
+    def fct():
+        calls.append(1)
+        if len(calls) <= failures:
+            raise TransientError()
+        return "OK"
+
+    return fct, calls
+
+
+RETRY_TRANSIENT = RetryPolicy(retry_on_exception=lambda exc: isinstance(exc, TransientError), jitter=False)
+
+
+def test_policy_delay_exponential_capped():
+    policy = RetryPolicy(base_delay=1, max_delay=5, jitter=False)
+    assert [policy.delay(attempt) for attempt in range(1, 5)] == [1, 2, 4, 5]
+
+
+def test_policy_delay_full_jitter():
+    policy = RetryPolicy(base_delay=1, max_delay=16)
+    assert all(0 <= policy.delay(3) <= 4 for _ in range(100))
+
+
+def test_policy_delay_respects_retry_after():
+    policy = RetryPolicy(max_delay=16)
+    assert policy.delay(1, retry_after=7) == 7
+    assert policy.delay(1, retry_after=600) == 16
+
+
+def test_retry_after_parsing():
+    assert _retry_after(httpx.Response(429, headers={"Retry-After": "3"})) == 3
+    assert _retry_after(httpx.Response(429, headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})) == 0
+    assert _retry_after(httpx.Response(429)) is None
+    assert _retry_after(ValueError()) is None
+
+
+def test_engine_retries_until_success():
+    clock = FakeClock()
+    fct, calls = _flaky(failures=2)
+
+    assert _engine(clock).call(fct, RETRY_TRANSIENT, "endpoint") == "OK"
+    assert len(calls) == 3
+    assert clock.sleeps == [1, 2]
+
+
+def test_engine_gives_up_after_max_attempts():
+    clock = FakeClock()
+    fct, calls = _flaky(failures=10)
+
+    with pytest.raises(TransientError):
+        _engine(clock).call(fct, RetryPolicy(RETRY_TRANSIENT.retry_on_exception, max_attempts=3), "endpoint")
+    assert len(calls) == 3
+
+
+def test_engine_max_elapsed():
+    clock = FakeClock()
+    fct, calls = _flaky(failures=10)
+
+    with pytest.raises(TransientError):
+        policy = RetryPolicy(RETRY_TRANSIENT.retry_on_exception, max_attempts=100, max_elapsed=10, jitter=False)
+        _engine(clock).call(fct, policy, "endpoint")
+    # 1 + 2 + 4 = 7s, next delay (8s) would exceed 10s
+    assert len(calls) == 4
+
+
+def test_engine_does_not_retry_other_errors():
+    clock = FakeClock()
+
+    def fct():
+        raise ValueError()
+
+    with pytest.raises(ValueError):
+        _engine(clock).call(fct, RETRY_TRANSIENT, "endpoint")
+    assert clock.sleeps == []
+
+
+def test_engine_retry_budget_shared():
+    clock = FakeClock()
+    engine = _engine(clock, budget_per_second=0.001, budget_burst=3)
+
+    fct, calls = _flaky(failures=10)
+    with pytest.raises(TransientError):
+        engine.call(fct, RETRY_TRANSIENT, "a")
+    assert len(calls) == 4
+
+    # budget exhausted for all endpoints
+    fct, calls = _flaky(failures=1)
+    with pytest.raises(TransientError):
+        engine.call(fct, RETRY_TRANSIENT, "b")
+    assert len(calls) == 1
+
+
+def test_engine_retries_on_result():
+    clock = FakeClock()
+    responses = iter([httpx.Response(429, headers={"Retry-After": "5"}), httpx.Response(200)])
+    policy = RetryPolicy(retry_on_result=lambda resp: resp.status_code == 429)
+
+    assert _engine(clock).call(lambda: next(responses), policy, "endpoint").status_code == 200
+    assert clock.sleeps == [5]
+
+
+def test_circuit_breaker_opens_and_recovers():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=2, reset_seconds=30, clock=clock)
+
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.is_open and not breaker.allow()
+
+    clock.now += 30
+    # single half-open trial
+    assert breaker.allow()
+    assert not breaker.allow()
+
+    breaker.record_failure()
+    assert not breaker.allow()
+
+    clock.now += 30
+    assert breaker.allow()
+    breaker.record_success()
+    assert not breaker.is_open and breaker.allow()
+
+
+def test_engine_fails_fast_on_open_circuit():
+    clock = FakeClock()
+    engine = _engine(clock, failure_threshold=3)
+    fct, calls = _flaky(failures=10)
+
+    with pytest.raises(TransientError):
+        engine.call(fct, RETRY_TRANSIENT, "endpoint")
+    assert len(calls) == 3
+
+    with pytest.raises(CircuitOpenError):
+        engine.call(fct, RETRY_TRANSIENT, "endpoint")
+    assert len(calls) == 3
+
+    # other endpoints unaffected
+    assert engine.call(lambda: "OK", RETRY_TRANSIENT, "other") == "OK"
+
+
+def test_endpoint_template():
+    assert (
+        _endpoint_template(f"{CONSOLE_API_URL}/orders/9bb18a2e-3b70-4e08-8c3a-3f2f2c5f6c54/download")
+        == "api.capellaspace.com/orders/{id}/download"
+    )
+    assert _endpoint_template(f"{CONSOLE_API_URL}/user") == "api.capellaspace.com/user"
+
+
+@pytest.fixture
+def retry_clock(test_client):
+    clock = FakeClock()
+    test_client._sesh.retry_engine = _engine(clock)
+    yield clock
+
+
+def test_session_retries_idempotent_requests(test_client, auth_httpx_mock, retry_clock):
+    auth_httpx_mock.add_response(url=f"{CONSOLE_API_URL}/user", status_code=503, json={"error": {"message": "down"}})
+    auth_httpx_mock.add_response(url=f"{CONSOLE_API_URL}/user", status_code=429, headers={"Retry-After": "2"})
+    auth_httpx_mock.add_response(url=f"{CONSOLE_API_URL}/user", json={"id": "MOCK_ID"})
+
+    assert test_client._sesh.get("/user").json() == {"id": "MOCK_ID"}
+    assert len(retry_clock.sleeps) == 2
+    assert retry_clock.sleeps[1] == 2
+
+
+def test_session_does_not_retry_non_idempotent_requests(test_client, auth_httpx_mock, retry_clock):
+    auth_httpx_mock.add_response(url=f"{CONSOLE_API_URL}/orders", status_code=503, json={"error": {"message": "down"}})
+
+    with pytest.raises(CapellaConsoleClientError):
+        test_client._sesh.post("/orders", json={})
+    assert retry_clock.sleeps == []
+
+
+def test_session_policy_does_not_retry_internal_server_error():
+    error = CapellaConsoleClientError(response=httpx.Response(500))
+    assert not SESSION_RETRY_POLICY.retry_on_exception(error)
+    assert SESSION_RETRY_POLICY.retry_on_exception(httpx.ReadTimeout("timeout"))
@@ -0,0 +1,54 @@
+from pathlib import Path
+
+from capella_console_client.assets import DownloadRequest
+from capella_console_client.config import SMALL_ASSET_BYTES, SMALL_ASSET_BATCH_BYTES
+from capella_console_client.scheduling import _schedule
+
+MiB = 1024 * 1024
+
+
+def _dl_request(asset_key: str, size: int = -1) -> DownloadRequest:
+    return DownloadRequest(url=f"https://host/{asset_key}", local_path=Path(asset_key), asset_key=asset_key, size=size)
+
+
+def _keys(units):
+    return [[dl_request.asset_key for dl_request in unit] for unit in units]
+
+
+def test_schedule_largest_first():
+    units = _schedule([_dl_request("a", 10 * MiB), _dl_request("b", 500 * MiB), _dl_request("c", 50 * MiB)])
+    assert _keys(units) == [["b"], ["c"], ["a"]]
+
+
+def test_schedule_unknown_size_first():
+    units = _schedule([_dl_request("a", 10 * MiB), _dl_request("b")])
+    assert _keys(units) == [["b"], ["a"]]
+
+
+def test_schedule_batches_small_assets():
+    small = SMALL_ASSET_BYTES // 2
+    units = _schedule(
+        [_dl_request("metadata", small), _dl_request("HH", 500 * MiB), _dl_request("thumbnail", small - 1)]
+    )
+    assert _keys(units) == [["HH"], ["metadata", "thumbnail"]]
+
+
+def test_schedule_small_asset_batch_bytes_limit():
+    size = SMALL_ASSET_BYTES - 1
+    cnt = SMALL_ASSET_BATCH_BYTES // size + 1
+    units = _schedule([_dl_request(str(i), size) for i in range(cnt)])
+    assert len(units) == 2
+    assert sum(len(unit) for unit in units) == cnt
+
+
+def test_schedule_asset_priority():
+    units = _schedule(
+        [_dl_request("HH", 500 * MiB), _dl_request("thumbnail", 10), _dl_request("metadata", 10)],
+        asset_priority=["metadata"],
+    )
+    assert _keys(units) == [["metadata"], ["HH"], ["thumbnail"]]
+
+
+def test_schedule_keeps_order_of_unknown_sizes():
+    units = _schedule([_dl_request("a"), _dl_request("b"), _dl_request("c")])
+    assert _keys(units) == [["a"], ["b"], ["c"]]
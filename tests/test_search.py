@@ -50,3 +50,9 @@ def test_search_result_repr(multi_page_search_client):
     search = StacSearch(multi_page_search_client._sesh)
     results = search.fetch_all()
     assert repr(results)
+
+
+def test_iter_search(multi_page_search_client):
+    items = multi_page_search_client.iter_search(limit=3)
+    assert next(items) == get_canned_search_results_multi_page()["features"][0]
+    assert len(list(items)) == 2
@@ -0,0 +1,63 @@
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from capella_console_client.store import ProductStore
+from .test_data import create_mock_asset_hrefs, DUMMY_STAC_IDS
+
+MOCK_ASSETS_PRESIGNED = create_mock_asset_hrefs()
+MOCK_ASSET_HREF = MOCK_ASSETS_PRESIGNED["HH"]["href"]
+
+
+@pytest.fixture
+def store_dir():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yield Path(temp_dir)
+
+
+def test_store_add_and_lookup(store_dir):
+    store = ProductStore(store_dir / "store")
+    local_path = store_dir / "asset.tif"
+    local_path.write_text("MOCK_CONTENT")
+
+    assert store.lookup(DUMMY_STAC_IDS[0], "HH", 12, '"MOCK_ETAG"') is None
+    blob_path = store.add(local_path, DUMMY_STAC_IDS[0], "HH", 12, '"MOCK_ETAG"')
+
+    assert store.lookup(DUMMY_STAC_IDS[0], "HH", 12, '"MOCK_ETAG"') == blob_path
+    assert store.lookup(DUMMY_STAC_IDS[0], "HH", 12, '"OTHER_ETAG"') is None
+    assert store.lookup(DUMMY_STAC_IDS[0], "VV", 12, '"MOCK_ETAG"') is None
+
+
+def test_store_lookup_forgets_missing_blob(store_dir):
+    store = ProductStore(store_dir / "store")
+    local_path = store_dir / "asset.tif"
+    local_path.write_text("MOCK_CONTENT")
+
+    blob_path = store.add(local_path, DUMMY_STAC_IDS[0], "HH", 12)
+    blob_path.unlink()
+
+    assert store.lookup(DUMMY_STAC_IDS[0], "HH", 12) is None
+
+
+def test_store_materialize(store_dir):
+    store = ProductStore(store_dir / "store")
+    local_path = store_dir / "asset.tif"
+    local_path.write_text("MOCK_CONTENT")
+    blob_path = store.add(local_path, DUMMY_STAC_IDS[0], "HH", 12)
+
+    other_path = store.materialize(blob_path, store_dir / "project" / "asset.tif")
+    assert other_path.read_text() == "MOCK_CONTENT"
+
+
+def test_download_asset_deduplicated_by_store(test_client, auth_httpx_mock, store_dir):
+    auth_httpx_mock.add_response(text="MOCK_CONTENT", headers={"Content-Length": "12", "ETag": '"MOCK_ETAG"'})
+    store = ProductStore(store_dir / "store")
+
+    first = test_client.download_asset(MOCK_ASSET_HREF, local_path=store_dir / "a.png", store=store)
+    cnt_requests = len(auth_httpx_mock.get_requests())
+    second = test_client.download_asset(MOCK_ASSET_HREF, local_path=store_dir / "b.png", store=store)
+
+    assert second.read_text() == first.read_text() == "MOCK_CONTENT"
+    # only size/ etag probe - no transfer
+    assert len(auth_httpx_mock.get_requests()) == cnt_requests + 1
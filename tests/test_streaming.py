@@ -0,0 +1,70 @@
+import hashlib
+import io
+
+import httpx
+import pytest
+
+from capella_console_client.exceptions import ChecksumMismatchError
+from .test_data import create_mock_asset_hrefs, DUMMY_STAC_IDS
+
+MOCK_ASSETS_PRESIGNED = create_mock_asset_hrefs()
+MOCK_ASSET_HREF = MOCK_ASSETS_PRESIGNED["HH"]["href"]
+MOCK_CONTENT = b"MOCK_CONTENT" * 100
+
+
+@pytest.fixture
+def streaming_client(test_client, auth_httpx_mock):
+    auth_httpx_mock.add_callback(
+        lambda request: httpx.Response(
+            200, content=MOCK_CONTENT, headers={"ETag": f'"{hashlib.md5(MOCK_CONTENT).hexdigest()}"'}
+        )
+    )
+    yield test_client
+
+
+def test_stream_asset(streaming_client):
+    chunks = list(streaming_client.stream_asset(MOCK_ASSET_HREF, chunk_size=100))
+    assert len(chunks) == 12
+    assert b"".join(chunks) == MOCK_CONTENT
+
+
+def test_open_asset(streaming_client):
+    with streaming_client.open_asset(MOCK_ASSET_HREF, chunk_size=7) as f:
+        assert f.read(5) == MOCK_CONTENT[:5]
+        assert f.tell() == 5
+        assert f.read() == MOCK_CONTENT[5:]
+        assert f.read(1) == b""
+
+
+def test_download_asset_to_file_like(streaming_client):
+    buffer = io.BytesIO()
+    num_bytes = streaming_client.download_asset_to(MOCK_ASSET_HREF, buffer, verify=True)
+    assert num_bytes == len(MOCK_CONTENT)
+    assert buffer.getvalue() == MOCK_CONTENT
+
+
+def test_download_asset_to_callable(streaming_client):
+    hasher = hashlib.sha256()
+    streaming_client.download_asset_to(MOCK_ASSET_HREF, hasher.update)
+    assert hasher.hexdigest() == hashlib.sha256(MOCK_CONTENT).hexdigest()
+
+
+def test_download_asset_to_verify_mismatch(test_client, auth_httpx_mock):
+    auth_httpx_mock.add_response(content=MOCK_CONTENT, headers={"ETag": f'"{"0" * 32}"'})
+    with pytest.raises(ChecksumMismatchError):
+        test_client.download_asset_to(MOCK_ASSET_HREF, io.BytesIO(), verify=True)
+
+
+def test_download_products_to(streaming_client):
+    buffers = {}
+
+    def sink_factory(stac_id, asset_key, file_name):
+        buffers[(stac_id, asset_key)] = io.BytesIO()
+        return buffers[(stac_id, asset_key)]
+
+    num_bytes = streaming_client.download_products_to(
+        sink_factory, assets_presigned=[MOCK_ASSETS_PRESIGNED], exclude=["thumbnail"]
+    )
+
+    assert num_bytes == {DUMMY_STAC_IDS[0]: {"HH": len(MOCK_CONTENT)}}
+    assert buffers[(DUMMY_STAC_IDS[0], "HH")].getvalue() == MOCK_CONTENT
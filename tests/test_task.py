@@ -1,10 +1,19 @@
 #!/usr/bin/env python
 
+from copy import deepcopy
+
 import pytest
 
 from capella_console_client.config import CONSOLE_API_URL
 from capella_console_client import CapellaConsoleClient
-from capella_console_client.exceptions import TaskNotCompleteError
+from capella_console_client import client as capella_client_module
+from capella_console_client.client import _task_is_final
+from capella_console_client.exceptions import (
+    CapellaConsoleClientError,
+    TaskNotCompleteError,
+    PartialResultError,
+    TaskWaitTimeoutError,
+)
 from .test_data import get_mock_responses
 
 
@@ -33,6 +42,34 @@ def test_list_tasking_with_id_multiple(test_client, authed_tasking_request_mock,
     assert "def" in found_ids
 
 
+def test_list_tasking_with_id_multiple_keeps_order(test_client, authed_tasking_request_mock, disable_validate_uuid):
+    tasking_requests = test_client.list_tasking_requests("def", "abc", "def", max_workers=2)
+
+    found_ids = [t["properties"]["taskingrequestId"] for t in tasking_requests]
+    assert found_ids == ["def", "abc", "def"]
+
+
+def test_list_tasking_with_id_partial_error(test_client, authed_tasking_request_mock, disable_validate_uuid):
+    authed_tasking_request_mock.add_response(
+        url=f"{CONSOLE_API_URL}/task/ghi", status_code=500, json={"error": {"message": "MOCK_ERROR"}}
+    )
+
+    with pytest.raises(PartialResultError) as excinfo:
+        test_client.list_tasking_requests("abc", "ghi", "def")
+
+    assert [t["properties"]["taskingrequestId"] for t in excinfo.value.data["results"]] == ["abc", "def"]
+    assert list(excinfo.value.data["errors"]) == ["ghi"]
+
+
+def test_list_tasking_with_id_partial_error_no_raise(test_client, authed_tasking_request_mock, disable_validate_uuid):
+    authed_tasking_request_mock.add_response(
+        url=f"{CONSOLE_API_URL}/task/ghi", status_code=500, json={"error": {"message": "MOCK_ERROR"}}
+    )
+
+    tasking_requests = test_client.list_tasking_requests("abc", "ghi", "def", raise_on_error=False)
+    assert [t["properties"]["taskingrequestId"] for t in tasking_requests] == ["abc", "def"]
+
+
 def test_list_tasking_with_id_single_status(test_client, authed_tasking_request_mock, disable_validate_uuid):
     tasking_requests = test_client.list_tasking_requests(status="completed")
     assert len(tasking_requests) == 1
@@ -94,3 +131,107 @@ def test_get_collects_for_task_not_completed(test_client, auth_httpx_mock):
     # we should get task 'def', see that it's not completed, and throw an exception
     with pytest.raises(TaskNotCompleteError):
         test_client.get_collects_for_task("def")
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(capella_client_module.time, "sleep", sleeps.append)
+    yield sleeps
+
+
+def _completed(task):
+    task = deepcopy(task)
+    task["properties"]["statusHistory"].insert(0, {"time": "2021-02-03T13:03:21.532Z", "code": "completed"})
+    return task
+
+
+def test_wait_for_tasks_already_completed(test_client, authed_tasking_request_mock, disable_validate_uuid, no_sleep):
+    tasks = list(test_client.wait_for_tasks(["abc"]))
+
+    assert [t["properties"]["taskingrequestId"] for t in tasks] == ["abc"]
+    assert no_sleep == []
+
+
+def test_wait_for_tasks_polls_until_completed(test_client, auth_httpx_mock, disable_validate_uuid, no_sleep):
+    task_def = get_mock_responses("/task/def")
+    auth_httpx_mock.add_response(url=f"{CONSOLE_API_URL}/task/def", json=task_def)
+    auth_httpx_mock.add_response(url=f"{CONSOLE_API_URL}/task/def", json=task_def)
+    auth_httpx_mock.add_response(url=f"{CONSOLE_API_URL}/task/def", json=_completed(task_def))
+
+    tasks = list(test_client.wait_for_tasks(["def"], poll_interval=10, max_poll_interval=12))
+
+    assert len(tasks) == 1
+    assert test_client.is_task_completed(tasks[0])
+    assert len(no_sleep) == 2
+    # backoff capped by max_poll_interval (+ jitter)
+    assert all(12 * 0.9 <= s <= 12 * 1.1 for s in no_sleep)
+
+
+def test_wait_for_tasks_batched(test_client, auth_httpx_mock, disable_validate_uuid, no_sleep):
+    auth_httpx_mock.add_response(
+        url=f"{CONSOLE_API_URL}/tasks?customerId=MOCK_ID",
+        json=[get_mock_responses("/task/abc"), _completed(get_mock_responses("/task/def"))],
+    )
+
+    tasks = list(test_client.wait_for_tasks(["abc", "def"], batch_threshold=1))
+
+    assert sorted(t["properties"]["taskingrequestId"] for t in tasks) == ["abc", "def"]
+    requested_urls = [str(r.url) for r in auth_httpx_mock.get_requests()]
+    assert f"{CONSOLE_API_URL}/task/abc" not in requested_urls
+
+
+def test_wait_for_tasks_timeout(test_client, authed_tasking_request_mock, disable_validate_uuid, no_sleep):
+    with pytest.raises(TaskWaitTimeoutError):
+        list(test_client.wait_for_tasks(["def"], timeout=0))
+
+
+def test_wait_for_tasks_and_download(test_client, authed_tasking_request_mock, disable_validate_uuid, monkeypatch):
+    monkeypatch.setattr(
+        CapellaConsoleClient, "download_products", lambda self, tasking_request_id: {"MOCK_STAC_ID": {}}
+    )
+
+    ret = list(test_client.wait_for_tasks_and_download(["abc"]))
+
+    assert len(ret) == 1
+    task, paths = ret[0]
+    assert task["properties"]["taskingrequestId"] == "abc"
+    assert paths == {"MOCK_STAC_ID": {}}
+
+
+def test_wait_for_tasks_listing_error_retried(test_client, auth_httpx_mock, disable_validate_uuid, no_sleep):
+    auth_httpx_mock.add_response(
+        url=f"{CONSOLE_API_URL}/tasks?customerId=MOCK_ID", status_code=500, json={"error": {"message": "MOCK"}}
+    )
+    auth_httpx_mock.add_response(
+        url=f"{CONSOLE_API_URL}/tasks?customerId=MOCK_ID",
+        json=[_completed(get_mock_responses("/task/abc")), _completed(get_mock_responses("/task/def"))],
+    )
+
+    tasks = list(test_client.wait_for_tasks(["abc", "def"], batch_threshold=1))
+
+    assert sorted(t["properties"]["taskingrequestId"] for t in tasks) == ["abc", "def"]
+    assert len(no_sleep) == 1
+
+
+def test_wait_for_tasks_gives_up_after_consecutive_failures(
+    test_client, auth_httpx_mock, disable_validate_uuid, no_sleep
+):
+    auth_httpx_mock.add_response(
+        url=f"{CONSOLE_API_URL}/task/def", status_code=500, json={"error": {"message": "MOCK"}}
+    )
+
+    with pytest.raises(CapellaConsoleClientError):
+        list(test_client.wait_for_tasks(["def"], max_poll_failures=3))
+
+    assert [r.url.path for r in auth_httpx_mock.get_requests()].count("/task/def") == 3
+
+
+def test_task_is_final_checks_current_status():
+    task = get_mock_responses("/task/abc")
+    assert _task_is_final(task)
+
+    # completed before, since re-submitted
+    task = deepcopy(task)
+    task["properties"]["statusHistory"].insert(0, {"time": "2021-02-03T13:03:21.532Z", "code": "submitted"})
+    assert not _task_is_final(task)
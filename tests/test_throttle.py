@@ -0,0 +1,100 @@
+import pytest
+
+from capella_console_client.throttle import TokenBucket, DownloadThrottle, _get_throttle
+from capella_console_client.config import MAX_BYTES_PER_SECOND_ENV, MAX_REQUESTS_PER_SECOND_ENV
+from .test_data import create_mock_asset_hrefs
+
+MOCK_ASSET_HREF = create_mock_asset_hrefs()["HH"]["href"]
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def test_token_bucket_burst_then_wait():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=100, clock=clock, sleep=clock.sleep)
+
+    assert bucket.consume(100) == 0
+    assert bucket.consume(50) == pytest.approx(0.5)
+    clock.now += 1
+    assert bucket.consume(100) == 0
+
+
+def test_token_bucket_large_amount_borrows():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=100, clock=clock, sleep=clock.sleep)
+
+    assert bucket.consume(300) == pytest.approx(2)
+    assert clock.now == pytest.approx(2)
+
+
+def test_token_bucket_invalid_rate():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+
+
+def test_download_throttle_per_host(monkeypatch):
+    consumed = []
+    monkeypatch.setattr(TokenBucket, "consume", lambda self, amount=1: consumed.append((self, amount)))
+
+    throttle = DownloadThrottle(max_bytes_per_second_per_host=1000)
+    throttle.consume("https://host-a.com/1", 10)
+    throttle.consume("https://host-a.com/2", 20)
+    throttle.consume("https://host-b.com/1", 30)
+
+    buckets = [c[0] for c in consumed]
+    assert buckets[0] is buckets[1]
+    assert buckets[0] is not buckets[2]
+
+
+def test_throttle_from_env(monkeypatch):
+    monkeypatch.delenv(MAX_BYTES_PER_SECOND_ENV, raising=False)
+    monkeypatch.delenv(MAX_REQUESTS_PER_SECOND_ENV, raising=False)
+    assert DownloadThrottle.from_env() is None
+
+    monkeypatch.setenv(MAX_BYTES_PER_SECOND_ENV, "1e6")
+    monkeypatch.setenv(MAX_REQUESTS_PER_SECOND_ENV, "5")
+    throttle = DownloadThrottle.from_env()
+    assert throttle.max_bytes_per_second == 1e6
+    assert throttle.max_requests_per_second == 5
+
+    # process wide
+    assert _get_throttle() is _get_throttle()
+
+    explicit = DownloadThrottle()
+    assert _get_throttle(explicit) is explicit
+
+
+def test_throttle_from_env_invalid(monkeypatch):
+    monkeypatch.setenv(MAX_BYTES_PER_SECOND_ENV, "fast")
+    with pytest.raises(ValueError):
+        DownloadThrottle.from_env()
+
+
+def test_throttled_asset_download(download_client, tmp_path):
+    calls = []
+
+    class RecordingThrottle(DownloadThrottle):
+        def acquire_request(self, url):
+            calls.append(("request", url))
+
+        def consume(self, url, num_bytes):
+            calls.append(("bytes", num_bytes))
+
+    local_path = download_client.download_asset(
+        MOCK_ASSET_HREF, local_path=tmp_path / "asset.png", throttle=RecordingThrottle()
+    )
+
+    assert local_path.read_text() == "MOCK_CONTENT"
+    assert ("request", MOCK_ASSET_HREF) in calls
+    assert sum(c[1] for c in calls if c[0] == "bytes") == len("MOCK_CONTENT")